@@ -0,0 +1,61 @@
+"""Synthetic time series for the benchmarks."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+import polars as pl
+
+
+def make_dataframe(
+    n_rows: int,
+    freq: timedelta = timedelta(minutes=1),
+    gap_rate: float = 0.001,
+    jitter: float = 0.0,
+    duplicate_rate: float = 0.0,
+    n_entities: int = 1,
+    n_columns: int = 2,
+    seed: int = 0,
+) -> pd.DataFrame:
+    """Create a sorted pandas DataFrame with a DatetimeIndex named `time`.
+
+    Args:
+        n_rows (int): Number of rows (per entity the rows are split evenly).
+        freq (timedelta, optional): Step between consecutive timestamps. Defaults to 1 minute.
+        gap_rate (float, optional): Share of steps that are a gap of 3 to 20 steps. Defaults to 0.001.
+        jitter (float, optional): Standard deviation of the noise added to every timestamp, as a share of `freq`.
+         Defaults to 0.0.
+        duplicate_rate (float, optional): Share of rows repeated with the same timestamp. Defaults to 0.0.
+        n_entities (int, optional): Number of entities, stored in an `entity` column. Defaults to 1.
+        n_columns (int, optional): Number of float value columns. Defaults to 2.
+        seed (int, optional): Seed of the random generator. Defaults to 0.
+
+    Returns:
+        pd.DataFrame: Sorted by entity and time.
+    """
+    rng = np.random.default_rng(seed)
+    freq_ns = int(freq.total_seconds() * 1e9)
+    entities = np.repeat(np.arange(n_entities), -(-n_rows // n_entities))[:n_rows]
+    steps = np.where(rng.random(n_rows) < gap_rate, rng.integers(3, 21, n_rows), 1) * freq_ns
+    elapsed = np.cumsum(steps)
+    first_rows = np.searchsorted(entities, np.arange(n_entities))
+    values = elapsed - elapsed[first_rows][entities]
+    if jitter > 0:
+        values = values + (rng.normal(scale=jitter, size=n_rows) * freq_ns).astype(np.int64)
+    if duplicate_rate > 0:
+        repeats = np.where(rng.random(n_rows) < duplicate_rate, 2, 1)
+        values, entities = np.repeat(values, repeats)[:n_rows], np.repeat(entities, repeats)[:n_rows]
+    order = np.lexsort((values, entities))
+    index = pd.DatetimeIndex(pd.Timestamp("2020-01-01") + pd.to_timedelta(values[order], unit="ns"), name="time")
+    columns = {f"value_{i}": rng.normal(size=n_rows) for i in range(n_columns)}
+    df = pd.DataFrame(columns, index=index)
+    if n_entities > 1:
+        df["entity"] = entities[order]
+    return df
+
+
+def to_polars(df: pd.DataFrame) -> pl.DataFrame:
+    """Convert a DataFrame from `make_dataframe` to polars with a `time` column."""
+    return pl.from_pandas(df, include_index=True)
@@ -0,0 +1,175 @@
+"""Benchmarks of the df_grouping hot paths.
+
+Run `python -m benchmarks.run --help` from the repository root for the options, e.g.
+
+    python -m benchmarks.run --rows 100000 1000000 --output baseline.json
+    python -m benchmarks.run --rows 100000 1000000 --compare baseline.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, NamedTuple
+
+import numpy as np
+import pandas as pd
+import polars as pl
+
+from benchmarks.data import make_dataframe, to_polars
+from timegroups import get_freq_consistent_dfs, get_time_groups, guess_freq, split_df_by_tgs
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+
+class Result(NamedTuple):
+    """Timing and memory of one benchmark case."""
+
+    name: str
+    backend: str
+    n_rows: int
+    seconds: float
+    rows_per_second: float
+    peak_bytes: int
+
+
+def _measure(func: Callable[[], Any], repeat: int) -> tuple[float, int]:
+    """Get the best wall time of `repeat` runs and the peak memory traced during one extra run."""
+    func()  # warm up
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return best, peak
+
+
+def _get_cases(df: pd.DataFrame | pl.DataFrame, freq: timedelta) -> dict[str, Callable[[], Any]]:
+    """Get the benchmark cases for one DataFrame."""
+    timestamp_column = None if isinstance(df, pd.DataFrame) else "time"
+    idx = df.index if isinstance(df, pd.DataFrame) else df.get_column("time")
+    cases: dict[str, Callable[[], Any]] = {}
+    if "entity" in df.columns:
+        by = df["entity"]
+        cases["get_time_groups[by]"] = lambda: get_time_groups(idx, freq=freq, by=by)
+        cases["get_freq_consistent_dfs[by]"] = lambda: get_freq_consistent_dfs(
+            df, freq=freq, timestamp_column=timestamp_column, by="entity"
+        )
+        return cases
+    tgs = get_time_groups(idx, freq=freq)
+    cases["guess_freq"] = lambda: guess_freq(idx)
+    cases["guess_freq[sampled]"] = lambda: guess_freq(idx, max_points=10_000)
+    cases["get_time_groups"] = lambda: get_time_groups(idx, freq=freq)
+    cases["split_df_by_tgs"] = lambda: split_df_by_tgs(df, tgs, timestamp_column=timestamp_column)
+    cases["get_freq_consistent_dfs"] = lambda: get_freq_consistent_dfs(df, freq=freq, timestamp_column=timestamp_column)
+    cases["get_freq_consistent_dfs[batched]"] = lambda: get_freq_consistent_dfs(
+        df, freq=freq, timestamp_column=timestamp_column, batched=True
+    )
+    return cases
+
+
+def run(args: argparse.Namespace) -> list[Result]:
+    """Run all benchmark cases for every row count and backend."""
+    freq = timedelta(minutes=1)
+    results = []
+    for n_rows in args.rows:
+        pandas_df = make_dataframe(
+            n_rows,
+            freq=freq,
+            gap_rate=args.gap_rate,
+            jitter=args.jitter,
+            duplicate_rate=args.duplicate_rate,
+            n_entities=args.entities,
+            seed=args.seed,
+        )
+        for backend in args.backends:
+            df = pandas_df if backend == "pandas" else to_polars(pandas_df)
+            for name, func in _get_cases(df, freq).items():
+                if args.filter and args.filter not in name:
+                    continue
+                seconds, peak = _measure(func, args.repeat)
+                result = Result(name, backend, n_rows, seconds, n_rows / seconds, peak)
+                results.append(result)
+                print(
+                    f"{name:<34} {backend:<7} {n_rows:>10,} rows {seconds * 1e3:>10.2f} ms "
+                    f"{result.rows_per_second:>14,.0f} rows/s {peak / 2**20:>9.1f} MiB"
+                )
+    return results
+
+
+def compare(results: list[Result], baseline_path: Path, threshold: float, min_seconds: float) -> list[str]:
+    """Get a message for every case that is slower than in the baseline by more than `threshold`.
+
+    Cases that are slower by less than `min_seconds` are not flagged, so timer noise of tiny cases is ignored.
+    """
+    baseline = {
+        (entry["name"], entry["backend"], entry["n_rows"]): entry
+        for entry in json.loads(baseline_path.read_text())["results"]
+    }
+    regressions = []
+    for result in results:
+        entry = baseline.get((result.name, result.backend, result.n_rows))
+        if entry is None:
+            continue
+        ratio = result.seconds / entry["seconds"]
+        regressed = ratio > 1 + threshold and result.seconds - entry["seconds"] > min_seconds
+        status = "REGRESSION" if regressed else "ok"
+        print(f"{result.name:<34} {result.backend:<7} {result.n_rows:>10,} rows {ratio:>6.2f}x  {status}")
+        if regressed:
+            regressions.append(f"{result.name} ({result.backend}, {result.n_rows} rows): {ratio:.2f}x slower")
+    return regressions
+
+
+def main() -> int:
+    """Run the benchmarks from the command line."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[100_000, 1_000_000], help="Row counts to run.")
+    parser.add_argument("--backends", nargs="+", default=["pandas", "polars"], choices=["pandas", "polars"])
+    parser.add_argument("--gap-rate", type=float, default=0.001, help="Share of steps that are gaps.")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Timestamp noise as a share of the frequency.")
+    parser.add_argument("--duplicate-rate", type=float, default=0.0, help="Share of duplicated timestamps.")
+    parser.add_argument("--entities", type=int, default=1, help="Number of entities, runs the `by` cases if > 1.")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=3, help="Number of timed runs, the best one is reported.")
+    parser.add_argument("--filter", default=None, help="Only run cases whose name contains this string.")
+    parser.add_argument("--output", type=Path, default=None, help="Write the results to this JSON file.")
+    parser.add_argument("--compare", type=Path, default=None, help="Baseline JSON file to compare against.")
+    parser.add_argument("--threshold", type=float, default=0.2, help="Allowed slowdown before flagging a case.")
+    parser.add_argument("--min-seconds", type=float, default=0.002, help="Ignore slowdowns shorter than this.")
+    args = parser.parse_args()
+
+    results = run(args)
+    if args.output is not None:
+        report = {
+            "created": datetime.now(UTC).isoformat(),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "pandas": pd.__version__,
+            "polars": pl.__version__,
+            "args": {key: value for key, value in vars(args).items() if key not in ("output", "compare")},
+            "results": [result._asdict() for result in results],
+        }
+        args.output.write_text(json.dumps(report, indent=2))
+    if args.compare is not None:
+        regressions = compare(results, args.compare, args.threshold, args.min_seconds)
+        if regressions:
+            print("\n".join(["", "Regressions:", *regressions]), file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,17 +1,113 @@
+import importlib
+from typing import TYPE_CHECKING, Any
+
+from timegroups.cache import TimeGroupCache, use_cache
 from timegroups.df_grouping import (
+    FreqEstimate,
     align_datetime,
+    estimate_freq,
     get_freq_consistent_dfs,
+    get_freq_consistent_lazyframe,
     get_time_groups,
     guess_freq,
+    iter_time_groups,
     split_df_by_tgs,
+    time_group_expr,
+    time_group_ids,
 )
-from timegroups.time_group import TimeGroup
+from timegroups.stats import GroupingStats, StageStats, collect_stats
+from timegroups.time_group import TimeGroup, TimeGroupArray
+
+if TYPE_CHECKING:
+    from timegroups.aio import agroup_frames
+    from timegroups.export import PaddedBatch, SeriesBatch, bucket_series, pad_series, to_series_batch
+    from timegroups.group_index import TimeGroupIndex
+    from timegroups.ipc import TimeGroupFile, write_time_groups_ipc
+    from timegroups.parquet import read_parquet_time_groups
+    from timegroups.set_ops import (
+        coverage_time_groups,
+        difference_time_groups,
+        intersect_time_groups,
+        union_time_groups,
+    )
+    from timegroups.tracker import TimeGroupTracker
+    from timegroups.windows import Windows, get_windows, iter_windows, sliding_windows
+
+# optional features are imported on first access, e.g. `aio` imports asyncio
+_LAZY_ATTRIBUTES = {
+    "agroup_frames": "timegroups.aio",
+    "PaddedBatch": "timegroups.export",
+    "SeriesBatch": "timegroups.export",
+    "bucket_series": "timegroups.export",
+    "pad_series": "timegroups.export",
+    "to_series_batch": "timegroups.export",
+    "TimeGroupIndex": "timegroups.group_index",
+    "TimeGroupFile": "timegroups.ipc",
+    "write_time_groups_ipc": "timegroups.ipc",
+    "read_parquet_time_groups": "timegroups.parquet",
+    "coverage_time_groups": "timegroups.set_ops",
+    "difference_time_groups": "timegroups.set_ops",
+    "intersect_time_groups": "timegroups.set_ops",
+    "union_time_groups": "timegroups.set_ops",
+    "TimeGroupTracker": "timegroups.tracker",
+    "Windows": "timegroups.windows",
+    "get_windows": "timegroups.windows",
+    "iter_windows": "timegroups.windows",
+    "sliding_windows": "timegroups.windows",
+}
+
+
+def __getattr__(name: str) -> Any:  # noqa: ANN401
+    """Import an optional feature on first access."""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the attributes of the package, including the optional features not imported yet."""
+    return sorted({*globals(), *_LAZY_ATTRIBUTES})
+
 
 __all__ = [
     "TimeGroup",
+    "TimeGroupArray",
+    "TimeGroupTracker",
+    "TimeGroupIndex",
+    "FreqEstimate",
     "guess_freq",
+    "estimate_freq",
     "get_time_groups",
+    "iter_time_groups",
+    "time_group_ids",
+    "time_group_expr",
     "split_df_by_tgs",
     "align_datetime",
     "get_freq_consistent_dfs",
+    "get_freq_consistent_lazyframe",
+    "agroup_frames",
+    "read_parquet_time_groups",
+    "write_time_groups_ipc",
+    "TimeGroupFile",
+    "intersect_time_groups",
+    "union_time_groups",
+    "difference_time_groups",
+    "coverage_time_groups",
+    "Windows",
+    "sliding_windows",
+    "iter_windows",
+    "get_windows",
+    "SeriesBatch",
+    "PaddedBatch",
+    "to_series_batch",
+    "pad_series",
+    "bucket_series",
+    "GroupingStats",
+    "StageStats",
+    "collect_stats",
+    "TimeGroupCache",
+    "use_cache",
 ]
@@ -0,0 +1,156 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Literal
+
+import numpy as np
+
+from timegroups.engine import NS_PER_UNIT, Int64Timestamps, timestamp_to_ns
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+    import numpy.typing as npt
+
+    from timegroups.engine import Backend
+
+    Adapter = Callable[[Any], Int64Timestamps | None]
+
+FrameBackend = Literal["pandas", "polars", "pyarrow"]
+
+NULL_NS = np.iinfo(np.int64).min
+_NUMPY_NS_PER_UNIT = {**NS_PER_UNIT, "m": 60_000_000_000, "h": 3_600_000_000_000, "D": 86_400_000_000_000}
+
+
+def _library(obj: Any) -> str:  # noqa: ANN401
+    """Get the top-level module of the type of `obj`, e.g. "pandas" for a pd.DatetimeIndex."""
+    return type(obj).__module__.partition(".")[0]
+
+
+def _pandas_int64(idx: Any) -> Int64Timestamps | None:  # noqa: ANN401
+    """Get the int64 view of a pd.DatetimeIndex / pd.Series."""
+    if not str(idx.dtype).startswith("datetime64") or idx.hasnans:
+        return None
+    values = idx.array
+    return Int64Timestamps(values.asi8, NS_PER_UNIT[values.unit], values.tz, "pandas")
+
+
+def _polars_int64(idx: Any) -> Int64Timestamps | None:  # noqa: ANN401
+    """Get the int64 view of a pl.Series."""
+    time_unit = getattr(idx.dtype, "time_unit", None)
+    if time_unit is None or idx.null_count() > 0:
+        return None
+    return Int64Timestamps(idx.to_physical().to_numpy(), NS_PER_UNIT[time_unit], idx.dtype.time_zone, "polars")
+
+
+def _numpy_int64(idx: Any) -> Int64Timestamps | None:  # noqa: ANN401
+    """Get the int64 view of a one-dimensional datetime64 array, e.g. a np.memmap."""
+    if not isinstance(idx, np.ndarray) or idx.dtype.kind != "M" or idx.ndim != 1:
+        return None
+    unit, count = np.datetime_data(idx.dtype)
+    if unit not in _NUMPY_NS_PER_UNIT:
+        return None
+    values = idx.view(np.int64)
+    if np.any(values == NULL_NS):
+        return None
+    return Int64Timestamps(values, _NUMPY_NS_PER_UNIT[unit] * count, None, "python")
+
+
+def _pyarrow_int64(idx: Any) -> Int64Timestamps | None:  # noqa: ANN401
+    """Get the int64 view of a pa.TimestampArray or pa.ChunkedArray, e.g. a column of a memory-mapped table.
+
+    Chunked arrays with more than one chunk are combined, which copies them.
+    """
+    import pyarrow as pa
+
+    if isinstance(idx, pa.ChunkedArray):
+        idx = idx.chunk(0) if idx.num_chunks == 1 else idx.combine_chunks()
+    if not isinstance(idx, pa.Array) or not pa.types.is_timestamp(idx.type) or idx.null_count > 0:
+        return None
+    values = idx.to_numpy(zero_copy_only=True).view(np.int64)
+    return Int64Timestamps(values, NS_PER_UNIT[idx.type.unit], idx.type.tz, "python")
+
+
+_ADAPTERS: dict[str, Adapter] = {
+    "pandas": _pandas_int64,
+    "polars": _polars_int64,
+    "numpy": _numpy_int64,
+    "pyarrow": _pyarrow_int64,
+}
+
+
+def register_adapter(library: str, adapter: Adapter) -> None:
+    """Register the int64 adapter for the datetime containers of a library.
+
+    Args:
+        library (str): Top-level module of the container types, e.g. "pandas".
+        adapter (Adapter): Function returning the `Int64Timestamps` of a container, None if it is not supported.
+    """
+    _ADAPTERS[library] = adapter
+
+
+def datetime_int64(idx: Any) -> Int64Timestamps | None:  # noqa: ANN401
+    """Get the int64 view of a datetime series.
+
+    Args:
+        idx (Any): pd.DatetimeIndex / pd.Series / pl.Series with a datetime dtype, a datetime64 np.ndarray or a
+         pa.TimestampArray / pa.ChunkedArray.
+
+    Returns:
+        Int64Timestamps | None: Integer view of `idx` without copying. None if `idx` is not supported or
+         contains nulls.
+    """
+    adapter = _ADAPTERS.get(_library(idx))
+    return None if adapter is None else adapter(idx)
+
+
+def timestamps_to_ns(timestamps: Any) -> npt.NDArray[np.int64]:  # noqa: ANN401
+    """Convert timestamps to nanoseconds since the epoch (UTC), keeping their order.
+
+    Args:
+        timestamps (Any): Datetime series supported by `datetime_int64`, an iterable of datetimes or a single
+         datetime. Nulls become the smallest int64.
+
+    Returns:
+        npt.NDArray[np.int64]: Nanoseconds, 0-dimensional for a single datetime.
+    """
+    if isinstance(timestamps, datetime | np.datetime64):
+        return np.asarray(timestamp_to_ns(timestamps), dtype=np.int64)
+    int64_view = datetime_int64(timestamps)
+    if int64_view is not None:
+        return int64_view.values * int64_view.ns_per_unit
+    if isinstance(timestamps, np.ndarray) and timestamps.dtype.kind == "M":
+        return timestamps.astype("datetime64[ns]").view(np.int64)
+    return np.fromiter((NULL_NS if t is None else timestamp_to_ns(t) for t in timestamps), dtype=np.int64)
+
+
+def as_datetime_int64(idx: Any) -> Int64Timestamps:  # noqa: ANN401
+    """Get the int64 view of a datetime series, or convert any other sequence of datetimes to nanoseconds.
+
+    Args:
+        idx (Any): Datetime series supported by `datetime_int64` or a sequence of datetimes, which is copied.
+
+    Returns:
+        Int64Timestamps: Integer timestamps.
+    """
+    int64_view = datetime_int64(idx)
+    if int64_view is not None:
+        return int64_view
+    values = timestamps_to_ns(idx)
+    if np.any(values == NULL_NS):
+        raise ValueError("Timestamps must not contain nulls.")
+    first = next(iter(idx), None)
+    backend: Backend = "pandas" if _library(first) == "pandas" else "python"
+    return Int64Timestamps(values, 1, getattr(first, "tzinfo", None), backend)
+
+
+def frame_backend(df: Any) -> FrameBackend | None:  # noqa: ANN401
+    """Get the library of a DataFrame, None for lazy frames and unsupported objects."""
+    library = _library(df)
+    if library == "pandas" and hasattr(df, "index"):
+        return "pandas"
+    if library == "polars" and hasattr(df, "get_column"):
+        return "polars"
+    if library == "pyarrow" and hasattr(df, "column"):
+        return "pyarrow"
+    return None
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from functools import partial
+from typing import TYPE_CHECKING, Literal, TypeVar
+
+from timegroups.df_grouping import get_freq_consistent_dfs
+from timegroups.interfaces import DataFrameWithDatetimeIndex as PandasDataframe
+from timegroups.interfaces import PolarsDataFrame
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator
+    from concurrent.futures import Executor
+    from datetime import timedelta
+
+S = TypeVar('S', bound=PandasDataframe | PolarsDataFrame)
+
+
+async def agroup_frames(
+    sources: AsyncIterable[S],
+    freq: timedelta | None = None,
+    time_delta_factor: float = 2.0,
+    timestamp_column: str | None = None,
+    duplicates: Literal["silent", "error"] = "silent",
+    max_points: int | None = None,
+    batched: bool = False,
+    min_length: int | None = None,
+    min_duration: timedelta | None = None,
+    max_groups: int | None = None,
+    max_in_flight: int = 2,
+    executor: Executor | None = None,
+    ordered: bool = False,
+) -> AsyncIterator[S]:
+    """Split and align frames from an async source, overlapping loading and consuming with the processing.
+
+    Every frame is run through `get_freq_consistent_dfs` on `executor`, e.g.
+    `async for group in agroup_frames(load_frames(), freq=timedelta(minutes=1)): await store(group)`.
+    At most `max_in_flight` frames are processed at a time; the next frame is only pulled from `sources` once one
+    of them finished, so a fast source cannot pile up frames in memory. `collect_stats` and `use_cache` contexts
+    are passed on to the default executor and thread pools. Other executors, e.g. a `ProcessPoolExecutor`, get
+    the frames without the context: no stats are collected and no cache is used in their workers.
+
+    Args:
+        sources (AsyncIterable[S]): Frames, e.g. an async generator loading them from object storage.
+        freq (timedelta | None, optional): Frequency to split by, guessed per frame if None. Defaults to None.
+        time_delta_factor (float, optional): Determine the gap that still will be considered all-over.
+         Defaults to 2.0.
+        timestamp_column (str | None, optional): Name of the timestamp column, required for polars.
+         Defaults to None.
+        duplicates (Literal["silent", "error"], optional): How to handle duplicates. Defaults to "silent".
+        max_points (int | None, optional): Maximum number of timestamps to sample if `freq` has to be guessed.
+         Defaults to None (full scan).
+        batched (bool, optional): Align all groups of a frame in one operation. Defaults to False.
+        min_length (int | None, optional): Drop groups with fewer rows once aligned to `freq`. Defaults to None.
+        min_duration (timedelta | None, optional): Drop groups shorter than this. Defaults to None.
+        max_groups (int | None, optional): Keep only the longest groups of every frame. Defaults to None.
+        max_in_flight (int, optional): Maximum number of frames processed at a time. Defaults to 2.
+        executor (Executor | None, optional): Executor to process the frames on, frames and groups are pickled
+         for a `ProcessPoolExecutor`. Defaults to None (the default executor of the event loop).
+        ordered (bool, optional): Yield the groups in the order of the frames instead of as soon as a frame is
+         done. Defaults to False.
+
+    Yields:
+        S: Aligned groups, in chronological order within every frame.
+    """
+    if max_in_flight < 1:
+        raise ValueError("max_in_flight must be at least 1.")
+    loop = asyncio.get_running_loop()
+    process = partial(
+        get_freq_consistent_dfs,
+        freq=freq,
+        time_delta_factor=time_delta_factor,
+        timestamp_column=timestamp_column,
+        duplicates=duplicates,
+        max_points=max_points,
+        batched=batched,
+        min_length=min_length,
+        min_duration=min_duration,
+        max_groups=max_groups,
+    )
+    # a Context cannot be pickled, so only executors running in this process can run the frames in it
+    in_context = executor is None or isinstance(executor, ThreadPoolExecutor)
+    frames = aiter(sources)
+    in_flight: list[asyncio.Future[list[S]]] = []
+    exhausted = False
+    try:
+        while True:
+            while not exhausted and len(in_flight) < max_in_flight:
+                try:
+                    frame = await anext(frames)
+                except StopAsyncIteration:
+                    exhausted = True
+                    break
+                if in_context:
+                    in_flight.append(loop.run_in_executor(executor, copy_context().run, process, frame))
+                else:
+                    in_flight.append(loop.run_in_executor(executor, process, frame))
+            if not in_flight:
+                return
+            if ordered:
+                finished = in_flight[0]
+                await asyncio.wait([finished])
+            else:
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                finished = next(future for future in in_flight if future in done)
+            in_flight.remove(finished)
+            for group in finished.result():
+                yield group
+    finally:
+        for future in in_flight:
+            future.cancel()
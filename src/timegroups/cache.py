@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, NamedTuple, TypeVar
+
+import numpy as np
+
+from timegroups.adapters import datetime_int64
+from timegroups.time_group import TimeGroupArray
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Hashable, Iterator
+
+T = TypeVar('T')
+_SAMPLE_SIZE = 1024
+
+
+class IndexFingerprint(NamedTuple):
+    """Cheap identity of a timestamp series.
+
+    Attributes:
+        length (int): Number of timestamps.
+        first (int): First timestamp in the unit of the series.
+        last (int): Last timestamp in the unit of the series.
+        checksum (int): Hash of up to 1024 evenly strided timestamps.
+        ns_per_unit (int): Nanoseconds per unit of the series.
+        tz (str | None): Time zone of the series.
+        backend (str): Library of the series.
+    """
+
+    length: int
+    first: int
+    last: int
+    checksum: int
+    ns_per_unit: int
+    tz: str | None
+    backend: str
+
+
+def fingerprint(idx: Any) -> IndexFingerprint | None:  # noqa: ANN401
+    """Get the fingerprint of a datetime series, None if it has no int64 view.
+
+    Only a strided sample of the timestamps is hashed, so a change of a single timestamp in between is not
+    detected, see `TimeGroupCache.invalidate`.
+    """
+    int64_view = datetime_int64(idx)
+    if int64_view is None:
+        return None
+    values = int64_view.values
+    if len(values) == 0:
+        return IndexFingerprint(0, 0, 0, 0, int64_view.ns_per_unit, None, int64_view.backend)
+    sample = np.ascontiguousarray(values[:: max(1, len(values) // _SAMPLE_SIZE)])
+    return IndexFingerprint(
+        len(values),
+        int(values[0]),
+        int(values[-1]),
+        hash(sample.tobytes()),
+        int64_view.ns_per_unit,
+        None if int64_view.tz is None else str(int64_view.tz),
+        int64_view.backend,
+    )
+
+
+def _nbytes(value: Any) -> int:  # noqa: ANN401
+    """Get the memory held by the arrays of a cached value."""
+    if isinstance(value, TimeGroupArray):
+        arrays = (value.starts, value.ends, value.offsets, value.lengths)
+        return sum(array.nbytes for array in arrays if array is not None)
+    return 0
+
+
+def _freeze(value: Any) -> Any:  # noqa: ANN401
+    """Make the arrays of a value read-only, so callers cannot change the cached value in place."""
+    if isinstance(value, TimeGroupArray):
+        for array in (value.starts, value.ends, value.offsets, value.lengths):
+            if array is not None:
+                array.flags.writeable = False
+    return value
+
+
+def _share(value: Any) -> Any:  # noqa: ANN401
+    """Get a new `TimeGroupArray` viewing the (read-only) arrays of a cached one."""
+    if isinstance(value, TimeGroupArray):
+        return value[:]
+    return value
+
+
+class TimeGroupCache:
+    """LRU cache of derived values (time groups, frequencies) keyed by an index fingerprint.
+
+    Attributes:
+        max_entries (int): Maximum number of cached values.
+        max_bytes (int | None): Maximum memory of the cached time groups.
+        hits (int): Number of lookups that found a value.
+        misses (int): Number of lookups that did not find a value.
+    """
+
+    def __init__(self, max_entries: int = 128, max_bytes: int | None = None) -> None:
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._nbytes = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def nbytes(self) -> int:
+        """Get the memory of the cached time groups."""
+        return self._nbytes
+
+    def get(self, key: Hashable) -> Any | None:  # noqa: ANN401
+        """Get a cached value and mark it as recently used, None if it is not cached."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return _share(entry[0])
+
+    def put(self, key: Hashable, value: Any) -> None:  # noqa: ANN401
+        """Cache a value, evicting the least recently used values beyond the limits."""
+        nbytes = _nbytes(value)
+        with self._lock:
+            if key in self._entries:
+                self._nbytes -= self._entries.pop(key)[1]
+            self._entries[key] = (_freeze(value), nbytes)
+            self._nbytes += nbytes
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self._nbytes > self.max_bytes and len(self._entries) > 1
+            ):
+                _, (_, evicted_nbytes) = self._entries.popitem(last=False)
+                self._nbytes -= evicted_nbytes
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], T]) -> T:
+        """Get a cached value, or compute and cache it if it is not cached."""
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+            value = _share(value)
+        return value
+
+    def invalidate(self, idx: Any = None) -> int:  # noqa: ANN401
+        """Drop the cached values of a timestamp series, or all values if `idx` is None.
+
+        Args:
+            idx (Any, optional): pandas or polars datetime series, e.g. after it was modified in place.
+             Defaults to None.
+
+        Returns:
+            int: Number of dropped values.
+        """
+        idx_fingerprint = None if idx is None else fingerprint(idx)
+        with self._lock:
+            keys = [key for key in self._entries if idx is None or key[0] == idx_fingerprint]  # type: ignore[index]
+            for key in keys:
+                self._nbytes -= self._entries.pop(key)[1]
+        return len(keys)
+
+    def clear(self) -> None:
+        """Drop all cached values and reset the counters."""
+        self.invalidate()
+        self.hits = self.misses = 0
+
+
+_current_cache: ContextVar[TimeGroupCache | None] = ContextVar("timegroups_cache", default=None)
+
+
+def get_cache() -> TimeGroupCache | None:
+    """Get the cache active in the current context, None if caching is disabled."""
+    return _current_cache.get()
+
+
+@contextmanager
+def use_cache(cache: TimeGroupCache | None = None) -> Iterator[TimeGroupCache]:
+    """Cache the results of `get_time_groups` and `guess_freq` within the context.
+
+    `get_freq_consistent_dfs` and the other functions calling them reuse cached values as well. Only series with an
+    int64 view (see `adapters.datetime_int64`) are cached, keyed by their `fingerprint` and the arguments of the
+    call.
+
+    Args:
+        cache (TimeGroupCache | None, optional): Cache to use, e.g. to share it between contexts.
+         Defaults to None (a new cache).
+
+    Yields:
+        TimeGroupCache: Active cache.
+    """
+    cache = TimeGroupCache() if cache is None else cache
+    token = _current_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _current_cache.reset(token)
+
+
+def cached(idx: Any, name: str, compute: Callable[[], T], *args: Hashable) -> T:  # noqa: ANN401
+    """Get the result of `compute` from the active cache, keyed by the fingerprint of `idx`, `name` and `args`.
+
+    Computes without caching if no cache is active or `idx` has no int64 view.
+    """
+    cache = _current_cache.get()
+    if cache is None:
+        return compute()
+    idx_fingerprint = fingerprint(idx)
+    if idx_fingerprint is None:
+        return compute()
+    return cache.get_or_compute((idx_fingerprint, name, *args), compute)
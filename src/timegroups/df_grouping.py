@@ -1,7 +1,32 @@
-from collections import Counter
+from __future__ import annotations
+
+import io
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import AbstractContextManager, nullcontext
+from contextvars import copy_context
 from datetime import timedelta
-from typing import Literal, TypeVar, cast
+from functools import partial
+from typing import TYPE_CHECKING, Literal, NamedTuple, TypeVar, cast, overload
+
+import numpy as np
 
+from timegroups.adapters import as_datetime_int64, datetime_int64, frame_backend
+from timegroups.cache import cached
+from timegroups.engine import (
+    Int64Timestamps,
+    entity_bounds,
+    entity_group_bounds,
+    group_bounds,
+    group_ids,
+    interpolate_within_groups,
+    keep_unique_sorted,
+    round_half_even,
+    sampled_steps,
+    sort_by_entity,
+    step_mode,
+    timedelta_from_ns,
+    timedelta_to_ns,
+)
 from timegroups.interfaces import DataFrameWithDatetimeIndex as PandasDataframe
 from timegroups.interfaces import (
     DateTimeIndexLike,
@@ -9,97 +34,591 @@ from timegroups.interfaces import (
     IndexSeries,
     PolarsDataFrame,
 )
-from timegroups.time_group import TimeGroup
+from timegroups.stats import get_stats, stage
+from timegroups.time_group import TimeGroup, TimeGroupArray
+
+if TYPE_CHECKING:
+    from collections.abc import Hashable, Iterable, Iterator, Sequence
+
+    import numpy.typing as npt
+    import pandas as pd
+    import polars as pl
+    import pyarrow as pa
 
 T = TypeVar('T')
 S = TypeVar('S', bound=PandasDataframe | PolarsDataFrame)
 
 
-def guess_freq(idx: IndexSeries) -> timedelta:
-    """Guess the frequency of a Timestamp Series."""
+class FreqEstimate(NamedTuple):
+    """Estimated frequency of a Timestamp Series.
+
+    Attributes:
+        freq (timedelta): Most common step.
+        support (float): Share of the inspected steps that equal `freq`.
+        n_steps (int): Number of inspected steps.
+        sampled (bool): Whether `freq` was derived from a sample instead of a full scan.
+    """
+
+    freq: timedelta
+    support: float
+    n_steps: int
+    sampled: bool
+
+
+def estimate_freq(
+    idx: IndexSeries,
+    max_points: int | None = None,
+    block_size: int = 64,
+    min_support: float = 0.5,
+    seed: int | None = None,
+) -> FreqEstimate:
+    """Estimate the frequency of a Timestamp Series, optionally from a sample.
+
+    With `max_points` set, only blocks of consecutive timestamps are inspected (see `engine.sampled_steps`).
+    If the sampled mode is ambiguous, i.e. tied or supported by less than `min_support` of the sampled steps,
+    the whole series is scanned instead. Within `use_cache` estimates are reused for the same timestamps and
+    arguments.
+
+    Args:
+        idx (IndexSeries): Timestamp Series, e.g. pd.DatetimeIndex / pd.Series / pl.Series.
+        max_points (int | None, optional): Maximum number of timestamps to sample. Defaults to None (full scan).
+        block_size (int, optional): Number of consecutive timestamps per sampled block. Defaults to 64.
+        min_support (float, optional): Minimum share of sampled steps the mode needs. Defaults to 0.5.
+        seed (int | None, optional): Seed for random block positions. Defaults to None (strided blocks).
+
+    Returns:
+        FreqEstimate: Estimated frequency with its support.
+    """
     if len(idx) < 2:
         raise ValueError("Could not guess frequency. Index must have at least two elements.")
-    idx_diff = cast(IndexSeries, idx[1:]) - cast(IndexSeries, idx[:-1])
-    most_common_freq, _ = Counter[timedelta](idx_diff).most_common(1)[0]
-    return most_common_freq
+    int64_view = as_datetime_int64(idx)
+
+    def estimate() -> FreqEstimate:
+        step, support, n_steps, sampled = _estimate_step(
+            int64_view.values, max_points=max_points, block_size=block_size, min_support=min_support, seed=seed
+        )
+        return FreqEstimate(timedelta_from_ns(step * int64_view.ns_per_unit, like=idx), support, n_steps, sampled)
+
+    return cached(idx, "estimate_freq", estimate, max_points, block_size, min_support, seed)
+
+
+def _estimate_step(
+    values: npt.NDArray[np.int64],
+    max_points: int | None = None,
+    block_size: int = 64,
+    min_support: float = 0.5,
+    seed: int | None = None,
+) -> tuple[int, float, int, bool]:
+    """Estimate the most common step of integer timestamps, see `estimate_freq`."""
+    if max_points is not None and max_points < len(values):
+        steps = sampled_steps(values, max_points, block_size=block_size, seed=seed)
+        step, count, tied = step_mode(steps)
+        if not tied and count / len(steps) >= min_support:
+            return step, count / len(steps), len(steps), True
+    steps = np.diff(values)
+    step, count, _ = step_mode(steps)
+    return step, count / len(steps), len(steps), False
+
+
+@overload
+def guess_freq(idx: IndexSeries, max_points: int | None = None, by: None = None) -> timedelta: ...
+
+
+@overload
+def guess_freq(idx: IndexSeries, max_points: int | None = None, *, by: npt.ArrayLike) -> dict[Hashable, timedelta]: ...
+
+
+def guess_freq(
+    idx: IndexSeries, max_points: int | None = None, by: npt.ArrayLike | None = None
+) -> timedelta | dict[Hashable, timedelta]:
+    """Guess the frequency of a Timestamp Series.
+
+    Timestamps are handled on their int64 view (see `adapters.datetime_int64`), other sequences of datetimes are
+    converted to nanoseconds first.
+
+    Args:
+        idx (IndexSeries): Timestamp Series, e.g. pd.DatetimeIndex / pd.Series / pl.Series, a datetime64
+         np.ndarray or a pa.TimestampArray.
+        max_points (int | None, optional): Maximum number of timestamps to sample, see `estimate_freq`.
+         Defaults to None (full scan).
+        by (npt.ArrayLike | None, optional): Entity key of every timestamp, e.g. a `device_id` column. If given, a
+         frequency is guessed per entity from a single sort by entity and time. Defaults to None.
+
+    Returns:
+        timedelta | dict[Hashable, timedelta]: Most common step, or most common step per entity if `by` is given.
+         Entities with fewer than two timestamps are left out.
+    """
+    if by is None:
+        return estimate_freq(idx, max_points=max_points).freq
+    panel = _get_panel(idx, by)
+    steps = _get_panel_steps(panel, max_points=max_points)
+    return {
+        entity: timedelta_from_ns(int(step) * panel.timestamps.ns_per_unit, like=idx)
+        for entity, step in zip(panel.entities, steps, strict=True)
+        if step > 0
+    }
 
 
+def _get_freq(idx: IndexSeries, max_points: int | None = None) -> timedelta:
+    """Get the frequency attached to `idx` or guess it."""
+    if hasattr(idx, 'freq') and idx.freq is not None:
+        return idx.freq
+    return guess_freq(idx, max_points=max_points)
+
+
+class _Panel(NamedTuple):
+    """Timestamps of several entities, sorted by entity and time."""
+
+    values: npt.NDArray[np.int64]
+    codes: npt.NDArray[np.int64]
+    entities: list[Hashable]
+    order: npt.NDArray[np.int64] | None
+    timestamps: Int64Timestamps
+
+
+def _get_panel(idx: IndexSeries, by: npt.ArrayLike) -> _Panel:
+    """Sort the timestamps of `idx` by the entity keys `by` and time."""
+    int64_view = datetime_int64(idx)
+    if int64_view is None:
+        raise ValueError("Grouping by entity requires a pandas or polars datetime series without nulls.")
+    keys = by.to_numpy() if hasattr(by, 'to_numpy') else np.asarray(by)
+    if len(keys) != len(int64_view.values):
+        raise ValueError("by must have the same length as the index.")
+    values, codes, uniques, order = sort_by_entity(int64_view.values, keys)
+    return _Panel(values, codes, cast('list[Hashable]', uniques.tolist()), order, int64_view)
+
+
+def _get_panel_steps(
+    panel: _Panel, freq: timedelta | None = None, max_points: int | None = None
+) -> npt.NDArray[np.float64]:
+    """Get the frequency of every entity in the unit of the timestamps, 0 for entities with a single timestamp."""
+    if freq is not None:
+        return np.full(len(panel.entities), timedelta_to_ns(freq) / panel.timestamps.ns_per_unit)
+    steps = np.zeros(len(panel.entities), dtype=np.float64)
+    for code, (begin, end) in enumerate(zip(*entity_bounds(panel.codes), strict=True)):
+        if end > begin:
+            steps[code], _, _, _ = _estimate_step(panel.values[begin : end + 1], max_points=max_points)
+    return steps
+
+
+def _get_panel_time_groups(
+    panel: _Panel, steps: npt.NDArray[np.float64], time_delta_factor: float
+) -> dict[Hashable, TimeGroupArray]:
+    """Get the time groups of every entity of a panel in one pass."""
+    ns_per_unit = panel.timestamps.ns_per_unit
+    begins, ends = entity_group_bounds(panel.values, panel.codes, time_delta_factor * steps)
+    tgs = TimeGroupArray(
+        panel.values[begins] * ns_per_unit,
+        panel.values[ends] * ns_per_unit,
+        offsets=begins,
+        lengths=ends - begins + 1,
+        tz=panel.timestamps.tz,
+        backend=panel.timestamps.backend,
+    )
+    first_groups, last_groups = entity_bounds(panel.codes[begins])
+    return {
+        panel.entities[panel.codes[begins[first]]]: tgs[first : last + 1]
+        for first, last in zip(first_groups, last_groups, strict=True)
+    }
+
+
+def _prune_time_groups(
+    tgs: TimeGroupArray,
+    freq: timedelta | None,
+    min_length: int | None,
+    min_duration: timedelta | None,
+    max_groups: int | None,
+) -> TimeGroupArray:
+    """Prune time groups if any of the thresholds is given, see `TimeGroupArray.prune`."""
+    if min_length is None and min_duration is None and max_groups is None:
+        return tgs
+    return tgs.prune(min_length=min_length, min_duration=min_duration, max_groups=max_groups, freq=freq)
+
+
+def _get_int64_time_groups(int64_view: Int64Timestamps, freq: timedelta, time_delta_factor: float) -> TimeGroupArray:
+    """Get the time groups of an int64 view of timestamps."""
+    values, ns_per_unit = int64_view.values, int64_view.ns_per_unit
+    begins, ends = group_bounds(values, time_delta_factor * timedelta_to_ns(freq) / ns_per_unit)
+    return TimeGroupArray(
+        values[begins] * ns_per_unit,
+        values[ends] * ns_per_unit,
+        offsets=begins,
+        lengths=ends - begins + 1,
+        tz=int64_view.tz,
+        backend=int64_view.backend,
+    )
+
+
+@overload
 def get_time_groups(
     idx: FilterableTimeseries | DateTimeIndexLike,
     time_delta_factor: float = 2.0,
     freq: timedelta | None = None,
-) -> list[TimeGroup]:
+    max_points: int | None = None,
+    by: None = None,
+    min_length: int | None = None,
+    min_duration: timedelta | None = None,
+    max_groups: int | None = None,
+) -> TimeGroupArray: ...
+
+
+@overload
+def get_time_groups(
+    idx: FilterableTimeseries | DateTimeIndexLike,
+    time_delta_factor: float = 2.0,
+    freq: timedelta | None = None,
+    max_points: int | None = None,
+    *,
+    by: npt.ArrayLike,
+    min_length: int | None = None,
+    min_duration: timedelta | None = None,
+    max_groups: int | None = None,
+) -> dict[Hashable, TimeGroupArray]: ...
+
+
+def get_time_groups(
+    idx: FilterableTimeseries | DateTimeIndexLike,
+    time_delta_factor: float = 2.0,
+    freq: timedelta | None = None,
+    max_points: int | None = None,
+    by: npt.ArrayLike | None = None,
+    min_length: int | None = None,
+    min_duration: timedelta | None = None,
+    max_groups: int | None = None,
+) -> TimeGroupArray | dict[Hashable, TimeGroupArray]:
     """Get time groups from a `FilterableTimeseries` or `DateTimeIndexLike`.
 
+    Timestamps are handled on their int64 view (see `adapters.datetime_int64`), the `TimeGroup`s are only created
+    when the result is iterated. The result also carries the row offset and length of each group in `idx`, and
+    within `use_cache` the result is reused for the same timestamps and arguments.
+
     Args:
-        idx (`FilterableTimeseries | DateTimeIndexLike`): Can be pd.DatetimeIndex / pd.Series / pl.Series.
+        idx (`FilterableTimeseries | DateTimeIndexLike`): Can be pd.DatetimeIndex / pd.Series / pl.Series, a
+         datetime64 np.ndarray, a pa.TimestampArray / pa.ChunkedArray or a sequence of datetimes (copied).
          Base to derive time groups on.
         time_delta_factor (float): Determine the gap (in combination with `freq`)
          that still will be considered all-over.
         freq (timedelta): Frequency of the idx.
+        max_points (int | None, optional): Maximum number of timestamps to sample if `freq` has to be guessed,
+         see `estimate_freq`. Defaults to None (full scan).
+        by (npt.ArrayLike | None, optional): Entity key of every timestamp, e.g. a `device_id` column. If given,
+         gaps are detected per entity in a single pass over the timestamps sorted by entity and time, with `freq`
+         guessed per entity if it is None. Defaults to None.
+        min_length (int | None, optional): Drop groups with fewer timestamps once aligned to `freq`, see
+         `TimeGroupArray.prune`. Defaults to None.
+        min_duration (timedelta | None, optional): Drop groups shorter than this. Defaults to None.
+        max_groups (int | None, optional): Keep only the longest groups (per entity), in chronological order.
+         Defaults to None.
 
     Returns:
-        list[TimeGroup]: List of TimeGroups.
+        TimeGroupArray | dict[Hashable, TimeGroupArray]: Columnar collection of TimeGroups, or one per entity if
+         `by` is given. Row offsets of the per entity collections refer to `idx` sorted by entity and time and
+         are only kept if `idx` already is sorted that way.
     """
-    if len(idx) < 1:
-        return []
+    prune = partial(_prune_time_groups, min_length=min_length, min_duration=min_duration, max_groups=max_groups)
+    if by is not None:
+        panel = _get_panel(idx, by)
+        steps = _get_panel_steps(panel, freq=freq, max_points=max_points)
+        tgs_by_entity = _get_panel_time_groups(panel, steps, time_delta_factor)
+        for code, (entity, tgs) in enumerate(tgs_by_entity.items()):
+            entity_freq = timedelta_from_ns(int(steps[code] * panel.timestamps.ns_per_unit), like=idx)
+            tgs_by_entity[entity] = prune(tgs, freq=entity_freq if steps[code] > 0 else None)
+            if panel.order is not None:
+                tgs_by_entity[entity].offsets = tgs_by_entity[entity].lengths = None
+        return tgs_by_entity
+    int64_view = as_datetime_int64(idx)
+    if len(int64_view.values) < 1:
+        return TimeGroupArray([], [], offsets=[], lengths=[], tz=int64_view.tz, backend=int64_view.backend)
+    if freq is None and len(int64_view.values) == 1:
+        # a single timestamp is a group of its own at any frequency, so there is none to guess
+        return prune(_get_int64_time_groups(int64_view, timedelta(0), time_delta_factor), freq=None)
+    if freq is None:
+        freq = _get_freq(idx, max_points=max_points)
+
+    min_duration_ns = None if min_duration is None else timedelta_to_ns(min_duration)
+    return cached(
+        idx,
+        "get_time_groups",
+        lambda: prune(_get_int64_time_groups(int64_view, freq, time_delta_factor), freq=freq),
+        timedelta_to_ns(freq),
+        time_delta_factor,
+        min_length,
+        min_duration_ns,
+        max_groups,
+    )
+
+
+def _get_datetime_series(
+    df: PandasDataframe | PolarsDataFrame, timestamp_column: str | None
+) -> FilterableTimeseries | DateTimeIndexLike:
+    """Get the DatetimeIndex or the timestamp column of a DataFrame."""
+    backend = frame_backend(df)
+    if backend == "pandas":
+        return cast('PandasDataframe', df).index
+    elif backend == "polars" and timestamp_column is not None:
+        return cast('PolarsDataFrame', df).get_column(timestamp_column)
+    elif backend == "pyarrow" and timestamp_column is not None:
+        return cast('pa.Table', df).column(timestamp_column)
+    raise ValueError("DataFrame must have either 'index' or 'get_column' method and timestamp_column must not be None.")
+
+
+def time_group_ids(
+    data: FilterableTimeseries | DateTimeIndexLike | PandasDataframe | PolarsDataFrame,
+    freq: timedelta | None = None,
+    time_delta_factor: float = 2.0,
+    timestamp_column: str | None = None,
+    max_points: int | None = None,
+) -> npt.NDArray[np.int32]:
+    """Get the time group id of every row.
+
+    Rows get the same id as long as the gap to the previous row is at most `time_delta_factor * freq`, i.e.
+    id `i` marks the rows of the `i`-th group of `get_time_groups`. The result can be used as a key for
+    `DataFrame.groupby` in pandas; for polars see `time_group_expr`.
+
+    Args:
+        data (FilterableTimeseries | DateTimeIndexLike | PandasDataframe | PolarsDataFrame): Datetime series or
+         array supported by `adapters.datetime_int64`, pandas DataFrame with DatetimeIndex or polars DataFrame /
+         pyarrow Table (with `timestamp_column`).
+        freq (timedelta | None, optional): Frequency of the data. Guessed if None. Defaults to None.
+        time_delta_factor (float, optional): Determine the gap that still will be considered all-over.
+         Defaults to 2.0.
+        timestamp_column (str | None, optional): Name of the timestamp column of a polars DataFrame or pyarrow
+         Table. Defaults to None.
+        max_points (int | None, optional): Maximum number of timestamps to sample if `freq` has to be guessed,
+         see `estimate_freq`. Defaults to None (full scan).
+
+    Returns:
+        npt.NDArray[np.int32]: Time group id of every row.
+    """
+    idx = (
+        _get_datetime_series(cast('PandasDataframe | PolarsDataFrame', data), timestamp_column)
+        if frame_backend(data) is not None
+        else cast('FilterableTimeseries | DateTimeIndexLike', data)
+    )
+    int64_view = datetime_int64(idx)
+    if int64_view is None:
+        raise ValueError("Data must be a datetime series or array without nulls.")
+    if len(idx) < 2:
+        return np.zeros(len(idx), dtype=np.int32)
     if freq is None:
-        freq = idx.freq if hasattr(idx, 'freq') and idx.freq is not None else guess_freq(idx)
-
-    idx_diff = idx.diff()
-    mask = idx_diff > time_delta_factor * freq
-    mask[0] = True
-    begin_mask = mask
-
-    if hasattr(mask, 'clone'):
-        end_mask = mask.clone()
-        end_mask = end_mask.shift(-1)
-        end_mask[-1] = True
-    else:
-        end_mask = mask.copy()
-        end_mask[:-1] = mask[1:]
-        end_mask[-1] = True
-
-    if hasattr(idx, 'filter'):
-        tgs_begins = idx.filter(begin_mask)
-        tgs_ends = idx.filter(end_mask)
-    else:
-        tgs_begins = idx[begin_mask]
-        tgs_ends = idx[end_mask]
-
-    return [TimeGroup(t_start, t_end) for t_start, t_end in (zip(tgs_begins, tgs_ends, strict=False))]
-
-
-def split_df_by_tgs(df: T, tgs: list[TimeGroup], timestamp_column: str | None = None) -> list[T]:
-    """Split a DataFrame by TimeGroups."""
+        freq = _get_freq(idx, max_points=max_points)
+    return group_ids(int64_view.values, time_delta_factor * timedelta_to_ns(freq) / int64_view.ns_per_unit)
+
+
+def time_group_expr(column: str | pl.Expr, freq: timedelta, time_delta_factor: float = 2.0) -> pl.Expr:
+    """Get a polars expression computing the time group id of every row, see `time_group_ids`.
+
+    Args:
+        column (str | pl.Expr): Name of (or expression for) a sorted Datetime column.
+        freq (timedelta): Frequency of the column.
+        time_delta_factor (float, optional): Determine the gap that still will be considered all-over.
+         Defaults to 2.0.
+
+    Returns:
+        pl.Expr: Int32 expression of time group ids, e.g. to be used in `group_by` or `over`.
+    """
+    import polars as pl
+
+    time_col = pl.col(column) if isinstance(column, str) else column
+    is_gap = time_col.diff().dt.total_nanoseconds() > time_delta_factor * timedelta_to_ns(freq)
+    return is_gap.fill_null(False).cum_sum().cast(pl.Int32)
+
+
+def _row_bounds(
+    time_col: FilterableTimeseries | DateTimeIndexLike, tgs: Sequence[TimeGroup]
+) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]] | None:
+    """Get the row offset and length of each TimeGroup in `time_col`.
+
+    The offsets of a `TimeGroupArray` are used as they are if they match `time_col`, otherwise the bounds are
+    searched in `time_col`. None if `time_col` has no int64 view or is not sorted.
+    """
+    int64_view = datetime_int64(time_col)
+    if int64_view is None:
+        return None
+    values, ns_per_unit = int64_view.values, int64_view.ns_per_unit
+    tga = TimeGroupArray.from_time_groups(tgs)
+    starts = -(-tga.starts // ns_per_unit)
+    ends = tga.ends // ns_per_unit
+    if tga.offsets is not None and tga.lengths is not None:
+        last_rows = tga.offsets + tga.lengths - 1
+        if len(tga) == 0 or (
+            last_rows.max() < len(values)
+            and np.array_equal(values[tga.offsets], starts)
+            and np.array_equal(values[last_rows], ends)
+        ):
+            return tga.offsets, tga.lengths
+    if np.any(values[1:] < values[:-1]):
+        return None
+    offsets = np.searchsorted(values, starts, side="left")
+    lengths = np.maximum(np.searchsorted(values, ends, side="right") - offsets, 0)
+    return offsets, lengths
+
+
+def split_df_by_tgs(
+    df: T,
+    tgs: Sequence[TimeGroup],
+    timestamp_column: str | None = None,
+    min_length: int | None = None,
+    min_duration: timedelta | None = None,
+    max_groups: int | None = None,
+) -> list[T]:
+    """Split a DataFrame by TimeGroups.
+
+    If the timestamps are sorted, every group is cut as a zero-copy slice in one pass, using the row offsets of a
+    `TimeGroupArray` from `get_time_groups` or a binary search otherwise. Unsorted timestamps fall back to a
+    filter per group.
+
+    Args:
+        df (T): pandas DataFrame with DatetimeIndex, polars DataFrame or pyarrow Table / RecordBatch sorted by
+         `timestamp_column`.
+        tgs (Sequence[TimeGroup]): TimeGroups to split by, e.g. the result of `get_time_groups`.
+        timestamp_column (str, optional): Name of the timestamp column, required for polars and pyarrow.
+         Defaults to None.
+        min_length (int | None, optional): Skip groups with fewer rows, requires a `TimeGroupArray` from
+         `get_time_groups`. Defaults to None.
+        min_duration (timedelta | None, optional): Skip groups shorter than this. Defaults to None.
+        max_groups (int | None, optional): Only split off the longest groups, in chronological order.
+         Defaults to None.
+
+    Returns:
+        list[T]: One DataFrame per (remaining) TimeGroup.
+    """
+    if min_length is not None or min_duration is not None or max_groups is not None:
+        tgs = _prune_time_groups(TimeGroupArray.from_time_groups(tgs), None, min_length, min_duration, max_groups)
     if hasattr(df, 'filter') and hasattr(df, 'get_column'):
         if timestamp_column is None:
             raise ValueError("timestamp_column must be provided.")
         time_col = df.get_column(timestamp_column)
+        bounds = _row_bounds(time_col, tgs)
+        if bounds is not None:
+            return [_slice_rows(df, offset, length) for offset, length in zip(*bounds, strict=True)]
         return [df.filter(time_col.is_between(tg.start, tg.end, closed="both")) for tg in tgs]
     elif hasattr(df, 'loc') and hasattr(df, 'index'):
+        bounds = _row_bounds(df.index, tgs)
+        if bounds is not None:
+            return [_slice_rows(df, offset, length) for offset, length in zip(*bounds, strict=True)]
         return [df.loc[tg.start : tg.end] for tg in tgs]
+    elif frame_backend(df) == "pyarrow":
+        if timestamp_column is None:
+            raise ValueError("timestamp_column must be provided.")
+        bounds = _row_bounds(cast('pa.Table', df).column(timestamp_column), tgs)
+        if bounds is None:
+            raise ValueError("pyarrow tables must be sorted by timestamp_column.")
+        return [_slice_rows(df, offset, length) for offset, length in zip(*bounds, strict=True)]
     raise NotImplementedError(
         "DataFrame must have either 'filter' (and 'timestamp_column' must be provided)  or 'loc' method (plus 'index')."
     )
 
 
+def _slice_rows(df: T, offset: int, length: int) -> T:
+    """Get `length` rows of a DataFrame from row `offset` on, as a view."""
+    if hasattr(df, 'iloc'):
+        return cast('T', df.iloc[offset : offset + length])
+    return cast('T', cast('pl.DataFrame | pa.Table', df).slice(offset, length))
+
+
+def _take_rows(df: T, rows: npt.NDArray[np.int64]) -> T:
+    """Get the rows of a DataFrame at the positions `rows`."""
+    if hasattr(df, 'iloc'):
+        return cast('T', df.iloc[rows])
+    return cast('T', cast('pl.DataFrame', df)[rows])
+
+
+def _round_index(idx: DateTimeIndexLike, freq: timedelta) -> DateTimeIndexLike:
+    """Round a DatetimeIndex to `freq`, on its int64 view if the rounding does not depend on a time zone."""
+    import pandas as pd
+
+    int64_view = datetime_int64(idx)
+    if int64_view is None or (int64_view.tz is not None and str(int64_view.tz) != "UTC"):
+        return idx.round(freq)
+    try:
+        unit, remainder = divmod(timedelta_to_ns(freq), int64_view.ns_per_unit)
+    except ValueError:  # non-fixed pandas offsets
+        return idx.round(freq)
+    if remainder or unit <= 0:
+        return idx.round(freq)
+    rounded = round_half_even(int64_view.values, unit).view(f"M8[{idx.unit}]")
+    rounded_idx = pd.DatetimeIndex(rounded, name=idx.name)
+    return rounded_idx if int64_view.tz is None else rounded_idx.tz_localize(int64_view.tz)
+
+
 def align_datetime_pandas(
-    df: PandasDataframe, freq: timedelta, keep_duplicates: Literal["first", "last", False] = "first"
+    df: PandasDataframe,
+    freq: timedelta,
+    keep_duplicates: Literal["first", "last", False] = "first",
+    inplace: bool = False,
 ) -> PandasDataframe:
     """Align the DatetimeIndex of a DataFrame to a frequency.
 
+    The caller's DataFrame is left untouched unless `inplace` is set. The index is rounded on its int64 view,
+    duplicates are found in one linear pass if the rounded index is sorted and the data is only reindexed if the
+    aligned index actually has gaps. Peak memory is therefore the input plus one rounded index (8 bytes per row)
+    and a boolean mask, plus a copy of the kept rows if there are duplicates, plus the upsampled frame if there
+    are gaps.
+
     Args:
         df (PandasDataframe): DataFrame to align.
         freq (timedelta): Frequency to align to.
         keep_duplicates (Literal["first", "last"] | False): How to handle duplicates. Defaults to "silent".
+        inplace (bool, optional): Replace the index of `df` itself by the rounded index instead of working on a
+         shallow copy. Defaults to False.
 
     Returns:
-        PandasDataframe: Aligned DataFrame.
+        PandasDataframe: Aligned DataFrame. Shares its data with `df` if neither duplicates nor gaps were found.
     """
-    df.index = df.index.round(freq)
-    df = df[~df.index.duplicated(keep=keep_duplicates)]
-    return df.asfreq(freq)
+    n_rows = len(df)
+    with stage("align.round", rows_in=n_rows) as timer:
+        rounded = _round_index(df.index, freq)
+        timer.rows_out = n_rows
+    if not inplace:
+        df = df.copy(deep=False)
+    df.index = rounded
+    with stage("align.deduplicate", rows_in=n_rows) as timer:
+        df, has_gaps = _deduplicate_pandas(df, freq, keep_duplicates)
+        timer.rows_out = len(df)
+    with stage("align.upsample", rows_in=len(df)) as timer:
+        aligned = df.asfreq(freq) if has_gaps else df
+        timer.rows_out = len(aligned)
+    _count_alignment(n_rows, len(df), len(aligned))
+    return aligned
+
+
+def _deduplicate_pandas(
+    df: PandasDataframe, freq: timedelta, keep_duplicates: Literal["first", "last", False]
+) -> tuple[PandasDataframe, bool]:
+    """Drop rows with duplicate (rounded) timestamps, also get whether the result still needs `asfreq`.
+
+    If the remaining timestamps are evenly spaced by `freq`, the index gets its `freq` set instead.
+    """
+    rounded = df.index
+    int64_view = datetime_int64(rounded)
+    if int64_view is None or not rounded.is_monotonic_increasing:
+        return df[~rounded.duplicated(keep=keep_duplicates)], True
+
+    keep = keep_unique_sorted(int64_view.values, keep_duplicates)
+    if not keep.all():
+        df = df[keep]
+    values = int64_view.values[keep]
+    try:
+        freq_in_unit = timedelta_to_ns(freq) / int64_view.ns_per_unit
+    except ValueError:  # non-fixed pandas offsets
+        return df, True
+    if len(values) > 0 and np.all(np.diff(values) == freq_in_unit):
+        aligned_index = df.index
+        try:
+            aligned_index.freq = freq
+        except ValueError:
+            return df, True
+        df.index = aligned_index
+        return df, False
+    return df, True
+
+
+def _count_alignment(n_rows: int, n_unique: int, n_aligned: int) -> None:
+    """Count the duplicates dropped and rows inserted by an alignment if stats are collected."""
+    stats = get_stats()
+    if stats is not None:
+        stats.count(duplicates_dropped=n_rows - n_unique, rows_inserted=n_aligned - n_unique)
 
 
 def align_datetime_polars(
@@ -107,6 +626,7 @@ def align_datetime_polars(
     freq: timedelta,
     timestamp_column: str,
     keep_duplicates: Literal["first", "last", "any", "none"] = "first",
+    inplace: bool = False,
 ) -> PolarsDataFrame:
     """Align the Timestamp column of a DataFrame to a frequency.
 
@@ -116,14 +636,28 @@ def align_datetime_polars(
         timestamp_column (str): Name of the timestamp column.
         keep_duplicates (Literal["first", "last", "any", "none"], optional): How to handle duplicates.
          Defaults to "first".
+        inplace (bool, optional): Replace the timestamp column of `df` itself by the rounded one. Defaults to False.
 
     Returns:
         PolarsDataFrame: Aligned DataFrame.
     """
-    aligned_time_col = df.get_column(timestamp_column).dt.round(freq)
-    df.replace_column(index=df.get_column_index(timestamp_column), column=aligned_time_col)
-    df = df.unique(subset=[timestamp_column], keep=keep_duplicates)
-    return df.sort(timestamp_column).upsample(time_column=timestamp_column, every=freq)  # TODO: Investigate shuffle
+    n_rows = df.height
+    with stage("align.round", rows_in=n_rows) as timer:
+        aligned_time_col = df.get_column(timestamp_column).dt.round(freq)
+        if inplace:
+            df.replace_column(index=df.get_column_index(timestamp_column), column=aligned_time_col)
+        else:
+            df = df.with_columns(aligned_time_col)
+        timer.rows_out = n_rows
+    with stage("align.deduplicate", rows_in=n_rows) as timer:
+        df = df.unique(subset=[timestamp_column], keep=keep_duplicates)
+        timer.rows_out = df.height
+    with stage("align.upsample", rows_in=df.height) as timer:
+        # TODO: Investigate shuffle
+        aligned = df.sort(timestamp_column).upsample(time_column=timestamp_column, every=freq)
+        timer.rows_out = aligned.height
+    _count_alignment(n_rows, df.height, aligned.height)
+    return aligned
 
 
 def align_datetime(
@@ -131,13 +665,20 @@ def align_datetime(
     freq: timedelta,
     timestamp_column: str | None,
     duplicates: Literal["silent", "error"] = "silent",
+    inplace: bool = False,
 ) -> S:
-    """Align the DatetimeIndex or a timestamp column of a DataFrame to a frequency."""
+    """Align the DatetimeIndex or a timestamp column of a DataFrame to a frequency.
+
+    `df` is not modified unless `inplace` is set, see `align_datetime_pandas` / `align_datetime_polars`.
+    """
     if hasattr(df, "index"):
         keep_duplicates_pd: Literal["first", "last", False] = "first"
         if duplicates == "error":
             keep_duplicates_pd = False
-        return cast(S, align_datetime_pandas(cast(PandasDataframe, df), freq, keep_duplicates=keep_duplicates_pd))
+        return cast(
+            S,
+            align_datetime_pandas(cast(PandasDataframe, df), freq, keep_duplicates=keep_duplicates_pd, inplace=inplace),
+        )
     elif hasattr(df, "get_column") and timestamp_column is not None:
         keep_duplicates_pl: Literal["first", "last", "any", "none"] = "first"
         if duplicates == "error":
@@ -145,42 +686,645 @@ def align_datetime(
         return cast(
             S,
             align_datetime_polars(
-                cast(PolarsDataFrame, df), freq, timestamp_column, keep_duplicates=keep_duplicates_pl
+                cast(PolarsDataFrame, df), freq, timestamp_column, keep_duplicates=keep_duplicates_pl, inplace=inplace
             ),
         )
     raise ValueError("DataFrame must have either 'index' or 'get_column' method and timestamp_column must not be None.")
 
 
-def get_freq_consistent_dfs(
+def get_freq_consistent_lazyframe(
+    lf: pl.LazyFrame,
+    freq: timedelta,
+    timestamp_column: str,
+    time_delta_factor: float = 2.0,
+    duplicates: Literal["silent", "error"] = "silent",
+    group_column: str = "time_group",
+    min_length: int | None = None,
+    min_duration: timedelta | None = None,
+    max_groups: int | None = None,
+) -> pl.LazyFrame:
+    """Get a LazyFrame with consistent frequency within each time group.
+
+    Gap detection, rounding, deduplication, upsampling and interpolation are expressed as one lazy query, so it
+    can run on the streaming engine and projections/predicates can be pushed down to e.g. `pl.scan_parquet`.
+    The rows of every time group are identified by `group_column` (see `time_group_expr`).
+
+    Args:
+        lf (pl.LazyFrame): LazyFrame to align.
+        freq (timedelta): Frequency to align to.
+        timestamp_column (str): Name of the timestamp column.
+        time_delta_factor (float, optional): Determine the gap that still will be considered all-over. Defaults to 2.0.
+        duplicates (Literal["silent", "error"], optional): How to handle duplicates. Defaults to "silent".
+        group_column (str, optional): Name of the time group id column to add. Defaults to "time_group".
+        min_length (int | None, optional): Drop groups with fewer timestamps once aligned to `freq` before
+         upsampling them. Defaults to None.
+        min_duration (timedelta | None, optional): Drop groups shorter than this. Defaults to None.
+        max_groups (int | None, optional): Keep only the longest groups. Defaults to None.
+
+    Returns:
+        pl.LazyFrame: Aligned and interpolated LazyFrame, sorted by `group_column` and `timestamp_column`.
+    """
+    import polars as pl
+
+    keep_duplicates: Literal["first", "any"] = "any" if duplicates == "error" else "first"
+    every = timedelta(microseconds=timedelta_to_ns(freq) / 1_000)
+    keys = [group_column, timestamp_column]
+    grouped = lf.sort(timestamp_column, maintain_order=True).with_columns(
+        time_group_expr(timestamp_column, freq, time_delta_factor).alias(group_column)
+    )
+    min_span = max((min_length or 1) - 1, 0) * timedelta_to_ns(freq)
+    if min_duration is not None:
+        min_span = max(min_span, timedelta_to_ns(min_duration))
+    if min_span > 0 or max_groups is not None:
+        span = (pl.col(timestamp_column).max() - pl.col(timestamp_column).min()).dt.total_nanoseconds()
+        kept = grouped.group_by(group_column).agg(span.alias("span")).filter(pl.col("span") >= min_span)
+        if max_groups is not None:
+            kept = kept.sort(["span", group_column], descending=[True, False]).head(max_groups)
+        grouped = grouped.join(kept.select(group_column), on=group_column, how="semi", maintain_order="left")
+    rounded = grouped.with_columns(pl.col(timestamp_column).dt.round(every)).unique(
+        subset=keys, keep=keep_duplicates, maintain_order=True
+    )
+    grid = (
+        rounded.group_by(group_column)
+        .agg(
+            pl.datetime_range(pl.col(timestamp_column).min(), pl.col(timestamp_column).max(), interval=every).alias(
+                timestamp_column
+            )
+        )
+        .explode(timestamp_column)
+    )
+    return (
+        grid.join(rounded, on=keys, how="left", coalesce=True)
+        .sort(keys)
+        .with_columns(pl.all().exclude(keys).interpolate().over(group_column))
+        .select(rounded.collect_schema().names())
+    )
+
+
+def _split_by_group_column(df: pl.DataFrame, group_column: str) -> list[pl.DataFrame]:
+    """Split a DataFrame sorted by `group_column` into zero-copy slices and drop `group_column`."""
+    if df.height == 0:
+        return []
+    begins, ends = group_bounds(df.get_column(group_column).to_numpy(), 0)
+    df = df.drop(group_column)
+    return [df.slice(begin, end - begin + 1) for begin, end in zip(begins, ends, strict=True)]
+
+
+def _get_freq_consistent_dfs_lazy(
+    lf: pl.LazyFrame,
+    freq: timedelta | None,
+    time_delta_factor: float,
+    timestamp_column: str | None,
+    duplicates: Literal["silent", "error"],
+    engine: Literal["streaming", "in-memory"] = "streaming",
+    min_length: int | None = None,
+    min_duration: timedelta | None = None,
+    max_groups: int | None = None,
+) -> list[pl.DataFrame]:
+    """Run `get_freq_consistent_lazyframe` and split the result by time group."""
+    if timestamp_column is None:
+        raise ValueError("timestamp_column must be provided for a LazyFrame.")
+    if freq is None:
+        with stage("guess_freq"):
+            timestamps = lf.select(timestamp_column).collect(engine="streaming").get_column(timestamp_column)
+            freq = guess_freq(cast('IndexSeries', timestamps))
+    group_column = f"__{timestamp_column}_time_group__"
+    with stage("batched") as timer:
+        aligned = get_freq_consistent_lazyframe(
+            lf,
+            freq,
+            timestamp_column,
+            time_delta_factor,
+            duplicates=duplicates,
+            group_column=group_column,
+            min_length=min_length,
+            min_duration=min_duration,
+            max_groups=max_groups,
+        ).collect(engine=engine)
+        timer.rows_out = aligned.height
+    return _split_by_group_column(aligned, group_column)
+
+
+def _get_freq_consistent_dfs_batched_pandas(
+    df: PandasDataframe,
+    tgs: TimeGroupArray,
+    freq: timedelta,
+    keep_duplicates: Literal["first", False],
+) -> list[PandasDataframe] | None:
+    """Align and interpolate all time groups of a pandas DataFrame at once.
+
+    The rounded rows of all groups are reindexed against one concatenated target grid and interpolated within
+    group boundaries; the result is split into views of that single frame. None if the index is not sorted or
+    rounding does not land on the grid, so the caller can fall back to aligning every group separately.
+    """
+    import pandas as pd
+
+    if tgs.lengths is None or not df.index.is_monotonic_increasing:
+        return None
+    rounded = datetime_int64(df.index.round(freq))
+    if rounded is None:
+        return None
+    freq_ns = timedelta_to_ns(freq)
+    values = rounded.values * rounded.ns_per_unit
+    ids = np.repeat(np.arange(len(tgs), dtype=np.int32), tgs.lengths)
+
+    same_as_prev = np.zeros(len(values), dtype=bool)
+    same_as_prev[1:] = (values[1:] == values[:-1]) & (ids[1:] == ids[:-1])
+    keep = ~same_as_prev
+    if keep_duplicates is False:
+        keep[:-1] &= ~same_as_prev[1:]
+    values, ids = values[keep], ids[keep]
+    if len(values) == 0:
+        return None
+    begins, ends = group_bounds(ids, 0)
+    if len(begins) != len(tgs):
+        return None
+    group_starts = np.repeat(values[begins], ends - begins + 1)
+    steps, remainders = np.divmod(values - group_starts, freq_ns)
+    if np.any(remainders):
+        return None
+
+    target_lengths = (values[ends] - values[begins]) // freq_ns + 1
+    target_offsets = np.concatenate(([0], np.cumsum(target_lengths)))
+    positions = np.repeat(target_offsets[:-1], ends - begins + 1) + steps
+    aligned = df[keep].set_axis(positions).reindex(np.arange(target_offsets[-1]))
+    target_ids = np.repeat(np.arange(len(tgs), dtype=np.int32), target_lengths)
+    for column in aligned.columns[[dtype.kind == "f" for dtype in aligned.dtypes]]:
+        column_values = aligned[column].to_numpy(copy=True)
+        interpolate_within_groups(column_values, target_ids)
+        aligned[column] = column_values
+
+    _count_alignment(len(df), len(values), int(target_offsets[-1]))
+    dfs: list[PandasDataframe] = []
+    for start, offset, length in zip(values[begins], target_offsets[:-1], target_lengths, strict=True):
+        sub_df = aligned.iloc[offset : offset + length]
+        sub_df.index = pd.date_range(
+            pd.Timestamp(start, tz=rounded.tz), periods=length, freq=freq, name=df.index.name, unit=df.index.unit
+        )
+        dfs.append(sub_df)
+    return dfs
+
+
+def _align_and_interpolate(
+    df: S, freq: timedelta, timestamp_column: str | None, duplicates: Literal["silent", "error"]
+) -> S:
+    """Align a single time group and interpolate it."""
+    with stage("align", rows_in=len(df)) as timer:
+        aligned = align_datetime(df, freq, timestamp_column=timestamp_column, duplicates=duplicates)
+        timer.rows_out = len(aligned)
+    with stage("interpolate", rows_in=len(aligned)) as timer:
+        interpolated = aligned.interpolate()
+        timer.rows_out = len(interpolated)
+    return interpolated
+
+
+def _align_and_interpolate_ipc(
+    payload: bytes, freq: timedelta, timestamp_column: str | None, duplicates: Literal["silent", "error"]
+) -> bytes:
+    """Align and interpolate a polars DataFrame passed as Arrow IPC bytes, e.g. in another process."""
+    import polars as pl
+
+    df = cast('PolarsDataFrame', pl.read_ipc(io.BytesIO(payload)))
+    aligned = cast('pl.DataFrame', _align_and_interpolate(df, freq, timestamp_column, duplicates))
+    buffer = io.BytesIO()
+    aligned.write_ipc(buffer)
+    return buffer.getvalue()
+
+
+def _get_executor(executor: Executor | None, n_jobs: int | None) -> AbstractContextManager[Executor | None]:
+    """Get the executor to fan the time groups out to, None for sequential execution."""
+    if executor is not None:
+        return nullcontext(executor)
+    if n_jobs is None or n_jobs == 1:
+        return nullcontext(None)
+    return ThreadPoolExecutor(max_workers=None if n_jobs < 0 else n_jobs)
+
+
+def _take_time_groups(df: S, tgs: TimeGroupArray) -> tuple[S, TimeGroupArray]:
+    """Keep only the rows of `df` covered by `tgs`, e.g. after groups were pruned."""
+    if tgs.offsets is None or tgs.lengths is None or tgs.lengths.sum() == len(df):
+        return df, tgs
+    offsets = np.cumsum(tgs.lengths) - tgs.lengths
+    rows = np.repeat(tgs.offsets - offsets, tgs.lengths) + np.arange(tgs.lengths.sum())
+    df = _take_rows(df, rows)
+    return df, TimeGroupArray(tgs.starts, tgs.ends, offsets, tgs.lengths, tz=tgs.tz, backend=tgs.backend)
+
+
+def _check_start_method(executor: ProcessPoolExecutor) -> None:
+    """Reject process pools that fork their workers, polars deadlocks in a forked child."""
+    mp_context = getattr(executor, '_mp_context', None)
+    if mp_context is not None and mp_context.get_start_method() == "fork":
+        raise ValueError(
+            "polars DataFrames cannot be aligned in forked processes, create the ProcessPoolExecutor with "
+            "mp_context=multiprocessing.get_context('spawn') or get_context('forkserver')."
+        )
+
+
+def _align_and_interpolate_all(
+    dfs: list[S],
+    freq: timedelta,
+    timestamp_column: str | None,
+    duplicates: Literal["silent", "error"],
+    executor: Executor | None,
+) -> list[S]:
+    """Align and interpolate every time group, sequentially or on `executor`, keeping the order."""
+    if executor is None:
+        for i in range(len(dfs)):
+            dfs[i] = _align_and_interpolate(dfs[i], freq, timestamp_column, duplicates)
+        return dfs
+    if isinstance(executor, ProcessPoolExecutor) and len(dfs) > 0 and hasattr(dfs[0], 'write_ipc'):
+        import polars as pl
+
+        payloads = []
+        for sub_df in dfs:
+            buffer = io.BytesIO()
+            cast('pl.DataFrame', sub_df).write_ipc(buffer)
+            payloads.append(buffer.getvalue())
+        align_ipc = partial(
+            _align_and_interpolate_ipc, freq=freq, timestamp_column=timestamp_column, duplicates=duplicates
+        )
+        return [cast('S', pl.read_ipc(io.BytesIO(payload))) for payload in executor.map(align_ipc, payloads)]
+    align = partial(_align_and_interpolate, freq=freq, timestamp_column=timestamp_column, duplicates=duplicates)
+    if get_stats() is not None and not isinstance(executor, ProcessPoolExecutor):
+        # worker threads do not inherit the context that collects the stats
+        contexts = [copy_context() for _ in dfs]
+        return list(executor.map(lambda context, sub_df: context.run(align, sub_df), contexts, dfs))
+    return list(executor.map(align, dfs))
+
+
+def _align_time_groups(
     df: S,
+    tgs: TimeGroupArray,
     freq: timedelta,
+    time_delta_factor: float,
+    timestamp_column: str | None,
+    duplicates: Literal["silent", "error"],
+    batched: bool,
+    executor: Executor | None = None,
+) -> list[S]:
+    """Split a DataFrame by its TimeGroups, then align and interpolate every group."""
+    if batched:
+        df, tgs = _take_time_groups(df, tgs)
+    stats = get_stats()
+    if stats is not None:
+        stats.count(n_groups=len(tgs))
+    if batched and hasattr(df, 'lazy') and hasattr(df, 'get_column'):
+        return cast(
+            'list[S]',
+            _get_freq_consistent_dfs_lazy(
+                df.lazy(), freq, time_delta_factor, timestamp_column, duplicates, engine="in-memory"
+            ),
+        )
+    if batched and hasattr(df, 'index'):
+        with stage("batched", rows_in=len(df)) as timer:
+            batched_dfs = _get_freq_consistent_dfs_batched_pandas(
+                cast('PandasDataframe', df), tgs, freq, keep_duplicates=False if duplicates == "error" else "first"
+            )
+            timer.rows_out = 0 if batched_dfs is None else sum(len(sub_df) for sub_df in batched_dfs)
+        if batched_dfs is not None:
+            return cast('list[S]', batched_dfs)
+    with stage("split", rows_in=len(df)) as timer:
+        dfs: list[S] = split_df_by_tgs(df, tgs, timestamp_column=timestamp_column)
+        timer.rows_out = sum(len(sub_df) for sub_df in dfs)
+    return _align_and_interpolate_all(dfs, freq, timestamp_column, duplicates, executor)
+
+
+def _get_freq_consistent_dfs_by(
+    df: S,
+    by: str,
+    freq: timedelta | None,
+    time_delta_factor: float,
+    timestamp_column: str | None,
+    duplicates: Literal["silent", "error"],
+    max_points: int | None,
+    batched: bool,
+    executor: Executor | None = None,
+    min_length: int | None = None,
+    min_duration: timedelta | None = None,
+    max_groups: int | None = None,
+) -> dict[Hashable, list[S]]:
+    """Get DataFrames with consistent frequency for every entity of a long DataFrame."""
+    datetime_series = _get_datetime_series(df, timestamp_column)
+    with stage("sort_by_entity", rows_in=len(df)) as timer:
+        panel = _get_panel(datetime_series, cast('pd.DataFrame | pl.DataFrame', df)[by])
+        if panel.order is not None:
+            df = _take_rows(df, panel.order)
+        timer.rows_out = len(df)
+    with stage("guess_freq", rows_in=len(df)):
+        steps = _get_panel_steps(panel, freq=freq, max_points=max_points)
+    with stage("get_time_groups", rows_in=len(df)) as timer:
+        tgs_by_entity = _get_panel_time_groups(panel, steps, time_delta_factor)
+        timer.rows_out = sum(len(tgs) for tgs in tgs_by_entity.values())
+    entity_begins, entity_ends = entity_bounds(panel.codes)
+    # the entity column is constant within an entity, it is refilled instead of aligned and interpolated
+    values_df = cast(
+        'S', cast('pd.DataFrame', df).drop(columns=[by]) if hasattr(df, 'iloc') else cast('pl.DataFrame', df).drop(by)
+    )
+
+    dfs_by_entity: dict[Hashable, list[S]] = {}
+    for code, (entity, tgs) in enumerate(tgs_by_entity.items()):
+        begin, end = entity_begins[code], entity_ends[code]
+        entity_df = _slice_rows(df, begin, end - begin + 1)
+        entity_tgs = TimeGroupArray(
+            tgs.starts, tgs.ends, tgs.offsets - begin, tgs.lengths, tz=tgs.tz, backend=tgs.backend
+        )
+        if steps[code] == 0:
+            dfs_by_entity[entity] = split_df_by_tgs(
+                entity_df,
+                _prune_time_groups(entity_tgs, None, min_length, min_duration, max_groups),
+                timestamp_column=timestamp_column,
+            )
+            continue
+        entity_freq = timedelta_from_ns(int(steps[code] * panel.timestamps.ns_per_unit), like=datetime_series)
+        entity_tgs = _prune_time_groups(entity_tgs, entity_freq, min_length, min_duration, max_groups)
+        aligned_dfs = _align_time_groups(
+            _slice_rows(values_df, begin, end - begin + 1),
+            entity_tgs,
+            entity_freq,
+            time_delta_factor,
+            timestamp_column,
+            duplicates,
+            batched,
+            executor,
+        )
+        dfs_by_entity[entity] = [_with_entity_column(aligned_df, df, by, entity) for aligned_df in aligned_dfs]
+    return dfs_by_entity
+
+
+def _with_entity_column(df: S, like: S, by: str, entity: Hashable) -> S:
+    """Insert the entity column `by` of `like` into an aligned DataFrame, filled with `entity`."""
+    position = list(like.columns).index(by)
+    if hasattr(df, 'iloc'):
+        import pandas as pd
+
+        pd_df = cast('pd.DataFrame', df).copy(deep=False)
+        pd_df.insert(position, by, pd.Series(entity, index=pd_df.index, dtype=cast('pd.DataFrame', like)[by].dtype))
+        return cast('S', pd_df)
+    import polars as pl
+
+    entity_column = pl.repeat(pl.lit(entity, dtype=cast('pl.DataFrame', like).schema[by]), len(df), eager=True)
+    return cast('S', cast('pl.DataFrame', df).insert_column(position, entity_column.alias(by)))
+
+
+@overload
+def get_freq_consistent_dfs(
+    df: S,
+    freq: timedelta | None = None,
     time_delta_factor: float = 2.0,
     timestamp_column: str | None = None,
     duplicates: Literal["silent", "error"] = "silent",
-) -> list[S]:
+    max_points: int | None = None,
+    batched: bool = False,
+    by: None = None,
+    n_jobs: int | None = None,
+    executor: Executor | None = None,
+    min_length: int | None = None,
+    min_duration: timedelta | None = None,
+    max_groups: int | None = None,
+) -> list[S]: ...
+
+
+@overload
+def get_freq_consistent_dfs(
+    df: S,
+    freq: timedelta | None = None,
+    time_delta_factor: float = 2.0,
+    timestamp_column: str | None = None,
+    duplicates: Literal["silent", "error"] = "silent",
+    max_points: int | None = None,
+    batched: bool = False,
+    *,
+    by: str,
+    n_jobs: int | None = None,
+    executor: Executor | None = None,
+    min_length: int | None = None,
+    min_duration: timedelta | None = None,
+    max_groups: int | None = None,
+) -> dict[Hashable, list[S]]: ...
+
+
+def get_freq_consistent_dfs(
+    df: S,
+    freq: timedelta | None = None,
+    time_delta_factor: float = 2.0,
+    timestamp_column: str | None = None,
+    duplicates: Literal["silent", "error"] = "silent",
+    max_points: int | None = None,
+    batched: bool = False,
+    by: str | None = None,
+    n_jobs: int | None = None,
+    executor: Executor | None = None,
+    min_length: int | None = None,
+    min_duration: timedelta | None = None,
+    max_groups: int | None = None,
+) -> list[S] | dict[Hashable, list[S]]:
     """Get DataFrames with consistent frequency.
 
     Args:
         df (S): DataFrame to split.
-        freq (timedelta): Frequency to split by.
+        freq (timedelta, optional): Frequency to split by. Guessed from the data if None. Defaults to None.
         time_delta_factor (float, optional): Determine the gap that still will be considered all-over. Defaults to 2.0.
         timestamp_column (str, optional): Name of the timestamp column. Defaults to None.
         duplicates (Literal["silent", "error"], optional): How to handle duplicates. Defaults to "silent".
+        max_points (int | None, optional): Maximum number of timestamps to sample if `freq` has to be guessed,
+         see `estimate_freq`. Defaults to None (full scan).
+        batched (bool, optional): Align and interpolate all groups in one operation instead of one group at a time.
+         polars DataFrames run through `get_freq_consistent_lazyframe`, pandas DataFrames are reindexed against one
+         concatenated grid and only float columns are interpolated (integer columns become float for all groups as
+         soon as one group is upsampled). The returned DataFrames are slices of a single aligned frame.
+         Defaults to False.
+        by (str | None, optional): Name of an entity column (e.g. `device_id`) of a long DataFrame. If given, the
+         rows are sorted by entity and time once, gaps are detected for all entities in a single pass and `freq`
+         is guessed per entity if it is None. The entity column is not interpolated, rows inserted by the
+         alignment get the entity key. Defaults to None.
+        n_jobs (int | None, optional): Number of threads to align and interpolate the groups with, -1 for a
+         default based on the number of CPUs. Only used for groups not handled by `batched`; pandas and polars
+         release the GIL for most of that work. Defaults to None (sequential).
+        executor (Executor | None, optional): Executor to align and interpolate the groups with instead of the
+         thread pool from `n_jobs`. Results are returned in order. polars groups are serialized to Arrow IPC bytes
+         for a `ProcessPoolExecutor` and read back from the results, i.e. every group is copied twice instead of
+         shared. polars deadlocks in forked workers, so the pool must use the "spawn" or "forkserver" start method,
+         e.g. `ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))`; a forking pool raises a
+         ValueError. Defaults to None.
+        min_length (int | None, optional): Drop groups with fewer rows once aligned to `freq`, e.g.
+         `input_chunk_length + output_chunk_length` of a Darts model. Groups are pruned right after gap detection,
+         so dropped groups are never split, aligned or interpolated. Defaults to None.
+        min_duration (timedelta | None, optional): Drop groups shorter than this. Defaults to None.
+        max_groups (int | None, optional): Keep only the longest groups (per entity), in chronological order.
+         Defaults to None.
 
     Returns:
-        list[S]: List of DataFrames with consistent frequency.
+        list[S] | dict[Hashable, list[S]]: List of DataFrames with consistent frequency, or one list per entity if
+         `by` is given. A polars LazyFrame is run through `get_freq_consistent_lazyframe` on the streaming engine
+         and yields a list of polars DataFrames. If `freq` is None and cannot be guessed because `df` has fewer
+         than two rows (and no pandas index `freq`), `df` is only split and pruned, not aligned: the result is
+         empty or holds `df` itself, with no index `freq` for pandas.
     """
-    if hasattr(df, 'index'):
-        datetime_series = df.index
-    elif hasattr(df, 'get_column') and timestamp_column is not None:
-        datetime_series = df.get_column(timestamp_column)
-    else:
-        raise ValueError(
-            "DataFrame must have either 'index' or 'get_column' method and timestamp_column must not be None."
+    if hasattr(df, 'collect') and hasattr(df, 'collect_schema'):
+        if by is not None:
+            raise ValueError("by is not supported for LazyFrames, use group_by on the result instead.")
+        lazy_dfs = _get_freq_consistent_dfs_lazy(
+            cast('pl.LazyFrame', df),
+            freq,
+            time_delta_factor,
+            timestamp_column,
+            duplicates,
+            min_length=min_length,
+            min_duration=min_duration,
+            max_groups=max_groups,
         )
-    tgs = get_time_groups(datetime_series, freq=freq, time_delta_factor=time_delta_factor)
-    dfs: list[S] = split_df_by_tgs(df, tgs, timestamp_column=timestamp_column)
-    for i in range(len(dfs)):
-        sub_df = align_datetime(dfs[i], freq, timestamp_column=timestamp_column, duplicates=duplicates)
-        dfs[i] = sub_df.interpolate()
-    return dfs
+        stats = get_stats()
+        if stats is not None:
+            stats.count(n_groups=len(lazy_dfs))
+        return cast('list[S]', lazy_dfs)
+    if isinstance(executor, ProcessPoolExecutor) and frame_backend(df) == "polars":
+        _check_start_method(executor)
+    with _get_executor(executor, n_jobs) as pool:
+        if by is not None:
+            return _get_freq_consistent_dfs_by(
+                df,
+                by,
+                freq,
+                time_delta_factor,
+                timestamp_column,
+                duplicates,
+                max_points,
+                batched,
+                pool,
+                min_length=min_length,
+                min_duration=min_duration,
+                max_groups=max_groups,
+            )
+        datetime_series = _get_datetime_series(df, timestamp_column)
+        if freq is None:
+            if len(datetime_series) < 2 and getattr(datetime_series, 'freq', None) is None:
+                tgs = get_time_groups(datetime_series)
+                return split_df_by_tgs(
+                    df,
+                    tgs,
+                    timestamp_column=timestamp_column,
+                    min_length=min_length,
+                    min_duration=min_duration,
+                    max_groups=max_groups,
+                )
+            with stage("guess_freq", rows_in=len(datetime_series)):
+                freq = _get_freq(datetime_series, max_points=max_points)
+        with stage("get_time_groups", rows_in=len(datetime_series)) as timer:
+            tgs = get_time_groups(
+                datetime_series,
+                freq=freq,
+                time_delta_factor=time_delta_factor,
+                min_length=min_length,
+                min_duration=min_duration,
+                max_groups=max_groups,
+            )
+            timer.rows_out = len(tgs)
+        return _align_time_groups(df, tgs, freq, time_delta_factor, timestamp_column, duplicates, batched, pool)
+
+
+def _concat(dfs: list[S]) -> S:
+    """Concatenate DataFrames of the same backend."""
+    if len(dfs) == 1:
+        return dfs[0]
+    if hasattr(dfs[0], 'vstack'):
+        import polars as pl
+
+        return cast('S', pl.concat(cast('list[pl.DataFrame]', dfs)))
+    import pandas as pd
+
+    return cast('S', pd.concat(cast('list[pd.DataFrame]', dfs)))
+
+
+def _close_time_group(
+    tgs: TimeGroupArray,
+    dfs: list[S] | None,
+    freq: timedelta,
+    timestamp_column: str | None,
+    duplicates: Literal["silent", "error"],
+) -> TimeGroup | tuple[TimeGroup, S]:
+    """Get the single time group of `tgs`, with its rows in `dfs` aligned and interpolated if given."""
+    if dfs is None:
+        return tgs[0]
+    return tgs[0], _align_and_interpolate(_concat(dfs), freq, timestamp_column, duplicates)
+
+
+@overload
+def iter_time_groups(
+    chunks: Iterable[S],
+    freq: timedelta,
+    time_delta_factor: float = 2.0,
+    timestamp_column: str | None = None,
+    aligned: Literal[False] = False,
+    duplicates: Literal["silent", "error"] = "silent",
+) -> Iterator[TimeGroup]: ...
+
+
+@overload
+def iter_time_groups(
+    chunks: Iterable[S],
+    freq: timedelta,
+    time_delta_factor: float = 2.0,
+    timestamp_column: str | None = None,
+    *,
+    aligned: Literal[True],
+    duplicates: Literal["silent", "error"] = "silent",
+) -> Iterator[tuple[TimeGroup, S]]: ...
+
+
+def iter_time_groups(
+    chunks: Iterable[S],
+    freq: timedelta,
+    time_delta_factor: float = 2.0,
+    timestamp_column: str | None = None,
+    aligned: bool = False,
+    duplicates: Literal["silent", "error"] = "silent",
+) -> Iterator[TimeGroup] | Iterator[tuple[TimeGroup, S]]:
+    """Get the time groups of a series that is read in chunks, e.g. parquet row groups or CSV chunks.
+
+    Every chunk is grouped like in `get_time_groups`. The last group of a chunk is kept open and merged with the
+    first group of the next chunk if the step between them is small enough, so groups spanning chunks are the
+    same as for the whole series. A group is yielded as soon as it is closed, so only the open group is held
+    in memory besides the current chunk.
+
+    Args:
+        chunks (Iterable[S]): pd.DataFrame with DatetimeIndex or pl.DataFrame chunks in chronological order.
+        freq (timedelta): Frequency of the series.
+        time_delta_factor (float, optional): Determine the gap (in combination with `freq`)
+         that still will be considered all-over. Defaults to 2.0.
+        timestamp_column (str | None, optional): Column with the timestamps, required for polars.
+         Defaults to None.
+        aligned (bool, optional): Also yield the rows of each group aligned to `freq` and interpolated, like
+         `get_freq_consistent_dfs`. The rows of the open group are kept until it is closed. Defaults to False.
+        duplicates (Literal["silent", "error"], optional): How to treat duplicates when aligning.
+         Defaults to "silent".
+
+    Raises:
+        ValueError: If the chunks are not in chronological order.
+
+    Yields:
+        TimeGroup | tuple[TimeGroup, S]: Time groups in chronological order, with their aligned rows if `aligned`.
+    """
+    threshold = time_delta_factor * timedelta_to_ns(freq)
+    open_tgs: TimeGroupArray | None = None
+    open_dfs: list[S] = []
+    close = partial(_close_time_group, freq=freq, timestamp_column=timestamp_column, duplicates=duplicates)
+
+    for chunk in chunks:
+        datetime_series = _get_datetime_series(chunk, timestamp_column)
+        if len(datetime_series) == 0:
+            continue
+        tgs = get_time_groups(datetime_series, time_delta_factor=time_delta_factor, freq=freq)
+        dfs = split_df_by_tgs(chunk, tgs, timestamp_column=timestamp_column) if aligned else []
+        if open_tgs is not None:
+            if tgs.starts[0] < open_tgs.ends[0]:
+                raise ValueError("Chunks must be in chronological order.")
+            if tgs.starts[0] - open_tgs.ends[0] <= threshold:
+                open_tgs.ends[0] = tgs.ends[0]
+                open_dfs += dfs[:1]
+                tgs, dfs = tgs[1:], dfs[1:]
+        for i in range(len(tgs)):
+            if open_tgs is not None:
+                yield close(open_tgs, open_dfs if aligned else None)
+            open_tgs, open_dfs = tgs[[i]], dfs[i : i + 1]
+    if open_tgs is not None:
+        yield close(open_tgs, open_dfs if aligned else None)
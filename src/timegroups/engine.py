@@ -0,0 +1,308 @@
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta, tzinfo
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple
+from zoneinfo import ZoneInfo
+
+import numpy as np
+
+if TYPE_CHECKING:
+    import numpy.typing as npt
+
+NS_PER_UNIT = {"ns": 1, "us": 1_000, "ms": 1_000_000, "s": 1_000_000_000}
+EPOCH = datetime(1970, 1, 1)  # noqa: DTZ001
+EPOCH_UTC = datetime(1970, 1, 1, tzinfo=UTC)
+
+Backend = Literal["pandas", "polars", "python"]
+
+
+class Int64Timestamps(NamedTuple):
+    """Integer view of a datetime series.
+
+    Attributes:
+        values (npt.NDArray[np.int64]): Timestamps in the native unit of the series.
+        ns_per_unit (int): Number of nanoseconds per unit of `values`.
+        tz (str | tzinfo | None): Time zone of the series.
+        backend (Backend): Library the series comes from.
+    """
+
+    values: npt.NDArray[np.int64]
+    ns_per_unit: int
+    tz: str | tzinfo | None
+    backend: Backend
+
+
+def timedelta_to_ns(freq: Any) -> int:  # noqa: ANN401
+    """Convert a timedelta, pd.Timedelta, fixed pandas offset or np.timedelta64 to nanoseconds."""
+    if hasattr(freq, "nanos"):
+        return int(freq.nanos)
+    value = getattr(freq, "value", None)
+    if value is not None and isinstance(freq, timedelta):
+        return int(value)
+    if isinstance(freq, np.timedelta64):
+        return int(freq.astype("timedelta64[ns]").astype(np.int64))
+    return (freq.days * 86_400 + freq.seconds) * 1_000_000_000 + freq.microseconds * 1_000
+
+
+def timestamp_to_ns(timestamp: Any) -> int:  # noqa: ANN401
+    """Convert a datetime, pd.Timestamp or np.datetime64 to nanoseconds since the epoch (UTC)."""
+    if isinstance(timestamp, np.datetime64):
+        return int(timestamp.astype("datetime64[ns]").astype(np.int64))
+    value = getattr(timestamp, "value", None)
+    if value is not None and isinstance(timestamp, datetime):
+        return int(value)
+    epoch = EPOCH if timestamp.tzinfo is None else EPOCH_UTC
+    return timedelta_to_ns(timestamp - epoch)
+
+
+def timestamp_from_ns(ns: int, tz: str | tzinfo | None = None, backend: Backend = "python") -> datetime:
+    """Convert nanoseconds since the epoch (UTC) to the timestamp type of `backend`.
+
+    Args:
+        ns (int): Nanoseconds since the epoch.
+        tz (str | tzinfo | None, optional): Time zone of the timestamp. Defaults to None.
+        backend (Backend, optional): pd.Timestamp for "pandas", datetime.datetime otherwise.
+         Defaults to "python".
+
+    Returns:
+        datetime: Timestamp.
+    """
+    if backend == "pandas":
+        import pandas as pd
+
+        return pd.Timestamp(ns, tz=tz)
+    delta = timedelta(microseconds=ns // 1_000)
+    if tz is None:
+        return EPOCH + delta
+    return (EPOCH_UTC + delta).astimezone(ZoneInfo(tz) if isinstance(tz, str) else tz)
+
+
+def step_mode(steps: npt.NDArray[np.int64]) -> tuple[int, int, bool]:
+    """Get the most common value of integer steps.
+
+    Ties are resolved in favour of the step that occurs first, like `collections.Counter.most_common`.
+
+    Args:
+        steps (npt.NDArray[np.int64]): Steps between consecutive timestamps, at least one element.
+
+    Returns:
+        tuple[int, int, bool]: Most common step, its count and whether another step is just as common.
+    """
+    unique_steps, first_seen, counts = np.unique(steps, return_index=True, return_counts=True)
+    candidates = np.flatnonzero(counts == counts.max())
+    winner = candidates[np.argmin(first_seen[candidates])]
+    return int(unique_steps[winner]), int(counts[winner]), len(candidates) > 1
+
+
+def mode_step(values: npt.NDArray[np.int64]) -> int:
+    """Get the most common step between consecutive integer timestamps.
+
+    Args:
+        values (npt.NDArray[np.int64]): Integer timestamps, at least two elements.
+
+    Returns:
+        int: Most common step.
+    """
+    step, _, _ = step_mode(np.diff(values))
+    return step
+
+
+def sampled_steps(
+    values: npt.NDArray[np.int64],
+    max_points: int,
+    block_size: int = 64,
+    seed: int | None = None,
+) -> npt.NDArray[np.int64]:
+    """Get the steps within blocks of consecutive timestamps.
+
+    Blocks are spread evenly over `values`, or drawn at random if a `seed` is given. At most `max_points`
+    timestamps are read, so memory and runtime do not depend on the length of `values`.
+
+    Args:
+        values (npt.NDArray[np.int64]): Integer timestamps.
+        max_points (int): Maximum number of timestamps to look at.
+        block_size (int, optional): Number of consecutive timestamps per block. Defaults to 64.
+        seed (int | None, optional): Seed for random block positions. Defaults to None (strided blocks).
+
+    Returns:
+        npt.NDArray[np.int64]: Steps of all blocks, in block order.
+    """
+    block_size = max(2, min(block_size, max_points, len(values)))
+    n_blocks = max(1, max_points // block_size)
+    last_start = len(values) - block_size
+    if seed is None:
+        block_starts = np.linspace(0, last_start, num=n_blocks, dtype=np.int64)
+    else:
+        rng = np.random.default_rng(seed)
+        block_starts = np.sort(rng.integers(0, last_start, size=n_blocks, endpoint=True))
+    blocks = values[block_starts[:, np.newaxis] + np.arange(block_size)]
+    return np.diff(blocks, axis=1).ravel()
+
+
+def timedelta_from_ns(ns: int, like: Any) -> timedelta:  # noqa: ANN401
+    """Convert nanoseconds to the timedelta type the backend of `like` would produce.
+
+    Args:
+        ns (int): Duration in nanoseconds.
+        like (Any): Series the duration was derived from.
+
+    Returns:
+        timedelta: pd.Timedelta for pandas inputs, datetime.timedelta otherwise.
+    """
+    if type(like).__module__.startswith("pandas"):
+        import pandas as pd
+
+        return pd.Timedelta(ns, unit="ns")
+    return timedelta(microseconds=ns // 1_000)
+
+
+def gap_rows(values: npt.NDArray[np.int64], threshold: float) -> npt.NDArray[np.int64]:
+    """Get the rows whose step to the next timestamp is larger than `threshold`."""
+    return np.flatnonzero(np.diff(values) > threshold)
+
+
+def group_bounds(
+    values: npt.NDArray[np.int64], threshold: float
+) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+    """Get the first and last row of each group of consecutive timestamps.
+
+    A new group starts wherever the step to the previous timestamp is larger than `threshold`.
+
+    Args:
+        values (npt.NDArray[np.int64]): Integer timestamps, at least one element.
+        threshold (float): Largest step (in the unit of `values`) that does not split a group.
+
+    Returns:
+        tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]: First and last (inclusive) row of each group.
+    """
+    gaps = gap_rows(values, threshold)
+    begins = np.concatenate(([0], gaps + 1))
+    ends = np.concatenate((gaps, [len(values) - 1]))
+    return begins, ends
+
+
+def group_ids(values: npt.NDArray[np.int64], threshold: float) -> npt.NDArray[np.int32]:
+    """Get the group id of every row, following the same rule as `group_bounds`.
+
+    Args:
+        values (npt.NDArray[np.int64]): Integer timestamps.
+        threshold (float): Largest step (in the unit of `values`) that does not split a group.
+
+    Returns:
+        npt.NDArray[np.int32]: Group id (0, 1, ...) of every row.
+    """
+    ids = np.zeros(len(values), dtype=np.int32)
+    if len(values) > 1:
+        np.cumsum(np.diff(values) > threshold, out=ids[1:])
+    return ids
+
+
+def interpolate_within_groups(values: npt.NDArray[np.float64], ids: npt.NDArray[np.int32]) -> None:
+    """Linearly interpolate NaNs in place, without bridging between groups.
+
+    Like `pd.Series.interpolate()` applied to every group separately: gaps between two valid values are
+    interpolated, trailing NaNs are filled with the last valid value and leading NaNs are kept.
+
+    Args:
+        values (npt.NDArray[np.float64]): Equally spaced values of all groups, one after another.
+        ids (npt.NDArray[np.int32]): Sorted group id of every value.
+    """
+    missing = np.isnan(values)
+    if not missing.any():
+        return
+    rows = np.arange(len(values))
+    prev_valid = np.maximum.accumulate(np.where(missing, -1, rows))
+    next_valid = np.minimum.accumulate(np.where(missing, len(values), rows)[::-1])[::-1]
+    has_prev = missing & (prev_valid >= 0)
+    has_prev[has_prev] = ids[prev_valid[has_prev]] == ids[has_prev]
+    has_next = has_prev & (next_valid < len(values))
+    has_next[has_next] = ids[next_valid[has_next]] == ids[has_next]
+
+    values[has_prev & ~has_next] = values[prev_valid[has_prev & ~has_next]]
+    prev_rows, next_rows = prev_valid[has_next], next_valid[has_next]
+    weights = (rows[has_next] - prev_rows) / (next_rows - prev_rows)
+    values[has_next] = values[prev_rows] + (values[next_rows] - values[prev_rows]) * weights
+
+
+def round_half_even(values: npt.NDArray[np.int64], unit: int) -> npt.NDArray[np.int64]:
+    """Round integer timestamps to multiples of `unit`, ties to even like `pd.DatetimeIndex.round`.
+
+    Args:
+        values (npt.NDArray[np.int64]): Integer timestamps.
+        unit (int): Positive step to round to, in the unit of `values`.
+
+    Returns:
+        npt.NDArray[np.int64]: Rounded timestamps (a new array).
+    """
+    quotients, remainders = np.divmod(values, unit)
+    round_up = (2 * remainders > unit) | ((2 * remainders == unit) & (quotients % 2 == 1))
+    quotients += round_up
+    quotients *= unit
+    return quotients
+
+
+def keep_unique_sorted(values: npt.NDArray[np.int64], keep: Literal["first", "last", False]) -> npt.NDArray[np.bool_]:
+    """Get the rows to keep when dropping duplicates from sorted integer timestamps in one linear pass.
+
+    Args:
+        values (npt.NDArray[np.int64]): Sorted integer timestamps.
+        keep (Literal["first", "last", False]): Which occurrence of a duplicate to keep, False to drop all of them.
+
+    Returns:
+        npt.NDArray[np.bool_]: Mask of rows to keep, like `~pd.Index.duplicated(keep=keep)`.
+    """
+    mask = np.ones(len(values), dtype=bool)
+    if len(values) < 2:
+        return mask
+    same_as_next = values[1:] == values[:-1]
+    if keep != "last":
+        mask[1:] &= ~same_as_next
+    if keep != "first":
+        mask[:-1] &= ~same_as_next
+    return mask
+
+
+def sort_by_entity(
+    values: npt.NDArray[np.int64], keys: npt.ArrayLike
+) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64], npt.NDArray[np.generic], npt.NDArray[np.int64] | None]:
+    """Sort integer timestamps by entity and time.
+
+    Args:
+        values (npt.NDArray[np.int64]): Integer timestamps.
+        keys (npt.ArrayLike): Entity key of every timestamp.
+
+    Returns:
+        tuple: Sorted timestamps, sorted entity codes, the unique (sorted) entity keys the codes refer to and the
+         sort order (None if `values` already were sorted by entity and time).
+    """
+    uniques, codes = np.unique(np.asarray(keys), return_inverse=True)
+    codes = codes.astype(np.int64, copy=False)
+    same_entity = codes[1:] == codes[:-1]
+    if np.all(codes[1:] >= codes[:-1]) and np.all(values[1:][same_entity] >= values[:-1][same_entity]):
+        return values, codes, uniques, None
+    order = np.lexsort((values, codes))
+    return values[order], codes[order], uniques, order
+
+
+def entity_bounds(codes: npt.NDArray[np.int64]) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+    """Get the first and last row of each entity in sorted entity codes."""
+    return group_bounds(codes, 0)
+
+
+def entity_group_bounds(
+    values: npt.NDArray[np.int64], codes: npt.NDArray[np.int64], thresholds: npt.NDArray[np.float64]
+) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+    """Get the first and last row of each group of consecutive timestamps of each entity in one pass.
+
+    Args:
+        values (npt.NDArray[np.int64]): Integer timestamps, sorted by entity and time.
+        codes (npt.NDArray[np.int64]): Sorted entity code of every timestamp.
+        thresholds (npt.NDArray[np.float64]): Largest step that does not split a group, per entity code.
+
+    Returns:
+        tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]: First and last (inclusive) row of each group.
+    """
+    gaps = np.flatnonzero((np.diff(values) > thresholds[codes[1:]]) | (codes[1:] != codes[:-1]))
+    begins = np.concatenate(([0], gaps + 1))
+    ends = np.concatenate((gaps, [len(values) - 1]))
+    return begins, ends
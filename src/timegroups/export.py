@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Literal, NamedTuple, cast
+
+import numpy as np
+
+from timegroups.adapters import datetime_int64, frame_backend
+from timegroups.df_grouping import _get_datetime_series
+from timegroups.engine import timedelta_from_ns
+from timegroups.windows import _get_values
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+    from datetime import timedelta
+
+    import numpy.typing as npt
+
+    from timegroups.interfaces import DataFrameWithDatetimeIndex as PandasDataframe
+    from timegroups.interfaces import PolarsDataFrame
+
+
+class SeriesBatch(NamedTuple):
+    """Values of many aligned time groups in one contiguous array.
+
+    Attributes:
+        values (npt.NDArray[np.floating]): Rows of all series one after another, shape (n_rows, n_features).
+        offsets (npt.NDArray[np.int64]): First row of each series in `values`.
+        lengths (npt.NDArray[np.int64]): Number of rows of each series.
+        starts (npt.NDArray[np.datetime64]): First timestamp of each series (UTC for time zone aware data).
+        freq (timedelta): Frequency of all series.
+        columns (list[str]): Names of the features.
+    """
+
+    values: npt.NDArray[np.floating]
+    offsets: npt.NDArray[np.int64]
+    lengths: npt.NDArray[np.int64]
+    starts: npt.NDArray[np.datetime64]
+    freq: timedelta
+    columns: list[str]
+
+    def series(self, i: int) -> npt.NDArray[np.floating]:
+        """Get a view of the values of one series, shape (length, n_features)."""
+        return self.values[self.offsets[i] : self.offsets[i] + self.lengths[i]]
+
+    def take(self, indices: npt.ArrayLike) -> SeriesBatch:
+        """Get a batch of a subset of the series, copying their values into a new contiguous array."""
+        indices = np.asarray(indices, dtype=np.int64)
+        lengths = self.lengths[indices]
+        offsets = np.cumsum(lengths) - lengths
+        rows = np.repeat(self.offsets[indices] - offsets, lengths) + np.arange(lengths.sum())
+        return SeriesBatch(self.values[rows], offsets, lengths, self.starts[indices], self.freq, self.columns)
+
+    def to_darts(self) -> list[Any]:
+        """Get a darts `TimeSeries` per series, requires the optional dependency darts.
+
+        The time index of each series is generated from its start and `freq`, so darts does not have to infer the
+        frequency again.
+        """
+        try:
+            from darts import TimeSeries  # type: ignore[import-not-found]
+        except ImportError as e:
+            raise ImportError("to_darts requires darts, install it with `pip install darts`.") from e
+        import pandas as pd
+
+        freq = pd.Timedelta(self.freq)
+        return [
+            TimeSeries.from_times_and_values(
+                pd.date_range(start, periods=int(length), freq=freq), self.series(i), columns=self.columns
+            )
+            for i, (start, length) in enumerate(zip(self.starts, self.lengths, strict=True))
+        ]
+
+
+class PaddedBatch(NamedTuple):
+    """Series padded to a common length.
+
+    Attributes:
+        values (npt.NDArray[np.floating]): Padded values of shape (n_series, length, n_features).
+        mask (npt.NDArray[np.bool_]): Whether a row holds a value (True) or padding, shape (n_series, length).
+        indices (npt.NDArray[np.int64]): Position of each series in the `SeriesBatch` it was padded from.
+    """
+
+    values: npt.NDArray[np.floating]
+    mask: npt.NDArray[np.bool_]
+    indices: npt.NDArray[np.int64]
+
+
+def _column_names(
+    df: PandasDataframe | PolarsDataFrame, columns: Sequence[str] | None, timestamp_column: str | None
+) -> list[str]:
+    """Get the names of the value columns of a DataFrame."""
+    if columns is not None:
+        return list(columns)
+    if frame_backend(df) == "pandas":
+        return [str(column) for column in df.columns]
+    return [column for column in cast('PolarsDataFrame', df).columns if column != timestamp_column]
+
+
+def _first_timestamp(df: PandasDataframe | PolarsDataFrame, timestamp_column: str | None) -> int:
+    """Get the first timestamp of a DataFrame in nanoseconds."""
+    int64_view = datetime_int64(_get_datetime_series(df, timestamp_column))
+    if int64_view is None:
+        raise ValueError("Timestamps must be a datetime series without nulls.")
+    return int(int64_view.values[0]) * int64_view.ns_per_unit
+
+
+def _aligned_freq(dfs: Sequence[PandasDataframe | PolarsDataFrame], timestamp_column: str | None) -> timedelta:
+    """Get the frequency of aligned groups from the first two timestamps of the first group with two rows."""
+    for df in dfs:
+        if len(df) > 1:
+            datetime_series = _get_datetime_series(df, timestamp_column)
+            int64_view = datetime_int64(datetime_series)
+            if int64_view is not None:
+                step_ns = int(int64_view.values[1] - int64_view.values[0]) * int64_view.ns_per_unit
+                return timedelta_from_ns(step_ns, like=datetime_series)
+    raise ValueError("freq must be provided if no time group has two rows.")
+
+
+def to_series_batch(
+    dfs: Sequence[PandasDataframe | PolarsDataFrame],
+    freq: timedelta | None = None,
+    columns: Sequence[str] | None = None,
+    timestamp_column: str | None = None,
+    dtype: npt.DTypeLike = np.float32,
+) -> SeriesBatch:
+    """Copy the values of aligned time groups into one contiguous array, e.g. to build darts `TimeSeries`.
+
+    The groups are expected to be aligned to `freq` already, e.g. by `get_freq_consistent_dfs`, so their
+    frequency is not checked again.
+
+    Args:
+        dfs (Sequence[PandasDataframe | PolarsDataFrame]): Aligned, non-empty time groups with the same columns.
+        freq (timedelta | None, optional): Frequency of the groups. Defaults to None (the step between the first
+         two timestamps of the first group with two rows).
+        columns (Sequence[str] | None, optional): Value columns. Defaults to None (all but the timestamps).
+        timestamp_column (str | None, optional): Name of the timestamp column, required for polars.
+         Defaults to None.
+        dtype (npt.DTypeLike, optional): Floating point type of the values. Defaults to np.float32.
+
+    Returns:
+        SeriesBatch: Values of all groups with their offsets, lengths, start timestamps and frequency.
+    """
+    if not np.issubdtype(np.dtype(dtype), np.floating):
+        raise ValueError("dtype must be a floating point type.")
+    lengths = np.array([len(df) for df in dfs], dtype=np.int64)
+    if np.any(lengths == 0):
+        raise ValueError("Time groups must not be empty.")
+    offsets = np.cumsum(lengths) - lengths
+    names = _column_names(dfs[0], columns, timestamp_column) if len(dfs) else list(columns or [])
+    values = np.empty((lengths.sum(), len(names)), dtype=dtype)
+    starts = np.empty(len(dfs), dtype=np.int64)
+    for i, df in enumerate(dfs):
+        values[offsets[i] : offsets[i] + lengths[i]] = _get_values(df, columns, timestamp_column)
+        starts[i] = _first_timestamp(df, timestamp_column)
+    if freq is None:
+        freq = _aligned_freq(dfs, timestamp_column)
+    return SeriesBatch(values, offsets, lengths, starts.view("datetime64[ns]"), freq, names)
+
+
+def pad_series(
+    batch: SeriesBatch,
+    length: int | None = None,
+    side: Literal["left", "right"] = "left",
+    pad_value: float = np.nan,
+) -> PaddedBatch:
+    """Pad all series of a batch to the same length.
+
+    Args:
+        batch (SeriesBatch): Series to pad.
+        length (int | None, optional): Length to pad to. Longer series keep their last `length` rows.
+         Defaults to None (the length of the longest series).
+        side (Literal["left", "right"], optional): Pad in front of the values, so all series end in the last row,
+         or behind them. Defaults to "left".
+        pad_value (float, optional): Value of the padded rows. Defaults to np.nan.
+
+    Returns:
+        PaddedBatch: Values of shape (n_series, length, n_features) with their mask.
+    """
+    n_series = len(batch.lengths)
+    if length is None:
+        length = int(batch.lengths.max()) if n_series else 0
+    series_ids = np.repeat(np.arange(n_series), batch.lengths)
+    rows = np.arange(len(batch.values)) - np.repeat(batch.offsets, batch.lengths)
+    shift = batch.lengths - length
+    keep = rows >= np.maximum(shift, 0)[series_ids]
+    positions = rows - (shift if side == "left" else np.maximum(shift, 0))[series_ids]
+
+    values = np.full((n_series, length, batch.values.shape[1]), pad_value, dtype=batch.values.dtype)
+    mask = np.zeros((n_series, length), dtype=np.bool_)
+    values[series_ids[keep], positions[keep]] = batch.values[keep]
+    mask[series_ids[keep], positions[keep]] = True
+    return PaddedBatch(values, mask, np.arange(n_series, dtype=np.int64))
+
+
+def bucket_series(
+    batch: SeriesBatch,
+    boundaries: Sequence[int],
+    side: Literal["left", "right"] = "left",
+    pad_value: float = np.nan,
+) -> list[PaddedBatch]:
+    """Group series of similar length and pad them to the upper boundary of their bucket.
+
+    Args:
+        batch (SeriesBatch): Series to bucket.
+        boundaries (Sequence[int]): Ascending upper lengths of the buckets. Longer series go into a last bucket
+         padded to the longest series.
+        side (Literal["left", "right"], optional): Side to pad on, see `pad_series`. Defaults to "left".
+        pad_value (float, optional): Value of the padded rows. Defaults to np.nan.
+
+    Returns:
+        list[PaddedBatch]: One padded batch per non-empty bucket, in order of the boundaries. `indices` refer to
+         `batch`.
+    """
+    bucket_ids = np.searchsorted(np.asarray(boundaries), batch.lengths, side="left")
+    buckets = []
+    for bucket_id in np.unique(bucket_ids):
+        indices = np.flatnonzero(bucket_ids == bucket_id)
+        length = int(boundaries[bucket_id]) if bucket_id < len(boundaries) else None
+        padded = pad_series(batch.take(indices), length=length, side=side, pad_value=pad_value)
+        buckets.append(PaddedBatch(padded.values, padded.mask, indices))
+    return buckets
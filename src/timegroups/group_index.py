@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from timegroups.adapters import timestamps_to_ns
+from timegroups.time_group import TimeGroup, TimeGroupArray
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+    import numpy.typing as npt
+
+
+class TimeGroupIndex:
+    """Sorted interval index over non-overlapping time groups.
+
+    Lookups are binary searches over the int64 starts and ends of the groups, so millions of timestamps can be
+    mapped to their time group at once, e.g. to join events or labels onto a grouped series.
+
+    Attributes:
+        tgs (TimeGroupArray): Indexed time groups, sorted by start.
+    """
+
+    __slots__ = ("tgs", "_order")
+
+    def __init__(self, tgs: Sequence[TimeGroup]) -> None:
+        tgs = TimeGroupArray.from_time_groups(tgs)
+        order = np.argsort(tgs.starts, kind="stable")
+        sorted_tgs = tgs[order]
+        if np.any(sorted_tgs.starts[1:] <= sorted_tgs.ends[:-1]):
+            raise ValueError("Time groups must not overlap.")
+        self.tgs = sorted_tgs
+        self._order = order
+
+    def __len__(self) -> int:
+        return len(self.tgs)
+
+    def get_group_ids(self, timestamps: Any) -> npt.NDArray[np.int64]:  # noqa: ANN401
+        """Get the time group containing each timestamp.
+
+        Args:
+            timestamps (Any): pd.DatetimeIndex / pd.Series / pl.Series / datetime64 array, an iterable of datetimes
+             or a single datetime.
+
+        Returns:
+            npt.NDArray[np.int64]: Position of the containing group in the time groups the index was built from,
+             -1 for timestamps (and nulls) outside of all groups.
+        """
+        values = timestamps_to_ns(timestamps)
+        if len(self) == 0:
+            return np.full(values.shape, -1, dtype=np.int64)
+        positions = np.maximum(np.searchsorted(self.tgs.starts, values, side="right") - 1, 0)
+        found = (values >= self.tgs.starts[positions]) & (values <= self.tgs.ends[positions])
+        return np.where(found, self._order[positions], -1)
+
+    def get_overlapping(
+        self,
+        start: Any,  # noqa: ANN401
+        end: Any,  # noqa: ANN401
+    ) -> tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+        """Get the time groups overlapping the closed intervals `[start, end]`.
+
+        Args:
+            start (Any): Start of each query interval, a single datetime or timestamps like in `get_group_ids`.
+            end (Any): End (inclusive) of each query interval.
+
+        Returns:
+            tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]: Half-open ranges `[begin, stop)` into `tgs`, i.e.
+             `tgs[begin:stop]` are the groups overlapping an interval. Empty if `begin == stop`.
+        """
+        begins = np.searchsorted(self.tgs.ends, timestamps_to_ns(start), side="left")
+        stops = np.searchsorted(self.tgs.starts, timestamps_to_ns(end), side="right")
+        return begins, np.maximum(stops, begins)
+
+    def overlapping(self, start: Any, end: Any) -> TimeGroupArray:  # noqa: ANN401
+        """Get the time groups overlapping a single closed interval `[start, end]`."""
+        begin, stop = self.get_overlapping(start, end)
+        return self.tgs[int(begin) : int(stop)]
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
-from collections.abc import Iterable, Sequence, Sized
+from collections.abc import Hashable, Iterable, Sequence, Sized
 from typing import TYPE_CHECKING, Literal, Protocol, TypeVar
 
 if TYPE_CHECKING:
     from datetime import timedelta
 
+    import numpy as np
+    import numpy.typing as npt
+
 
 C = TypeVar('C', covariant=True)
 
@@ -72,6 +75,21 @@ class FilterableTimeseries(Diffable, Filterable, IndexSeries, Protocol[C]):
 
 
 class DateTimeIndexLike(BooleanIndexable, Diffable, FrequencyProvider, IndexSeries, RoundablePandas, Protocol):
+    @property
+    def freq(self) -> timedelta: ...
+
+    @freq.setter
+    def freq(self, freq: timedelta) -> None: ...
+
+    @property
+    def name(self) -> Hashable: ...
+
+    @property
+    def unit(self) -> str: ...
+
+    @property
+    def is_monotonic_increasing(self) -> bool: ...
+
     def duplicated(self, keep: Literal["first", "last", False]) -> BooleanMaskProvider: ...
 
 
@@ -86,18 +104,31 @@ class DataFrameWithDatetimeIndex(BooleanIndexable, Interpolatable, Protocol[C]):
     @index.setter
     def index(self, idx: DateTimeIndexLike) -> None: ...
 
+    @property
+    def columns(self) -> Iterable[Hashable]: ...
+
     def asfreq(self, freq: timedelta) -> C: ...
 
-    def __getitem__(self, key: Sequence[bool]) -> C: ...
+    def copy(self, deep: bool = True) -> C: ...
 
+    def __getitem__(self, key: Sequence[bool] | npt.NDArray[np.bool_]) -> C: ...
+
+
+class PolarsDataFrame(Sized, Interpolatable, Protocol[C]):
+    @property
+    def height(self) -> int: ...
+
+    @property
+    def columns(self) -> list[str]: ...
 
-class PolarsDataFrame(Interpolatable, Protocol[C]):
     def get_column(self, name: str) -> FilterableTimeseries: ...
 
     def get_column_index(self, name: str) -> int: ...
 
     def replace_column(self, index: int, column: FilterableTimeseries) -> None: ...
 
+    def with_columns(self, *columns: FilterableTimeseries) -> C: ...
+
     def unique(self, subset: list[str], keep: str) -> C: ...
 
     def sort(self, by: str) -> C: ...
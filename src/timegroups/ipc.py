@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING, Literal, cast
+
+import numpy as np
+
+from timegroups.adapters import datetime_int64, frame_backend
+from timegroups.time_group import TimeGroupArray
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+    from os import PathLike
+    from types import TracebackType
+
+    import pandas as pd
+    import polars as pl
+    import pyarrow as pa
+
+_METADATA_KEY = b"timegroups"
+
+
+def _to_arrow(df: pd.DataFrame | pl.DataFrame) -> pa.Table:
+    """Convert a pandas DataFrame (with its DatetimeIndex as a column) or a polars DataFrame to an arrow table."""
+    if frame_backend(df) == "pandas":
+        import pyarrow as pa
+
+        return pa.Table.from_pandas(df, preserve_index=True)
+    return cast('pl.DataFrame', df).to_arrow()
+
+
+def _pandas_timestamp_column(table: pa.Table) -> str:
+    """Get the column a pandas DatetimeIndex was stored in."""
+    pandas_metadata = json.loads(table.schema.metadata[b"pandas"])
+    return pandas_metadata["index_columns"][0]
+
+
+def write_time_groups_ipc(
+    dfs: Sequence[pd.DataFrame] | Sequence[pl.DataFrame],
+    sink: str | PathLike[str],
+    timestamp_column: str | None = None,
+) -> None:
+    """Write time groups, e.g. the result of `get_freq_consistent_dfs`, to one uncompressed Arrow IPC file.
+
+    Every group is written as its own record batch, and the bounds and row offsets of all groups are stored in the
+    schema metadata. `TimeGroupFile` can memory-map the file, so several processes share the pages of the file
+    instead of receiving a pickled copy of every group.
+
+    Args:
+        dfs (Sequence[pd.DataFrame] | Sequence[pl.DataFrame]): Non-empty DataFrames of the same schema, pandas
+         DataFrames with a DatetimeIndex.
+        sink (str | PathLike[str]): Path of the file.
+        timestamp_column (str | None, optional): Name of the timestamp column, required for polars.
+         Defaults to None.
+
+    Raises:
+        ValueError: If `dfs` is empty, a DataFrame is empty or its timestamps have no int64 view.
+    """
+    import pyarrow as pa
+
+    if len(dfs) == 0:
+        raise ValueError("dfs must not be empty.")
+    tables = (_to_arrow(df) for df in dfs)
+    first = next(tables)
+    if frame_backend(dfs[0]) == "pandas":
+        timestamp_column = _pandas_timestamp_column(first)
+    elif timestamp_column is None:
+        raise ValueError("timestamp_column must be provided.")
+
+    lengths = np.array([len(df) for df in dfs], dtype=np.int64)
+    if np.any(lengths == 0):
+        raise ValueError("Time groups must not be empty.")
+    starts, ends, tz = [], [], None
+    for df in dfs:
+        timestamps = (
+            cast('pd.DataFrame', df).index
+            if frame_backend(df) == "pandas"
+            else cast('pl.DataFrame', df).get_column(timestamp_column)
+        )
+        int64_view = datetime_int64(timestamps)
+        if int64_view is None:
+            raise ValueError(f"Column '{timestamp_column}' must be a datetime column without nulls.")
+        starts.append(int(int64_view.values[0]) * int64_view.ns_per_unit)
+        ends.append(int(int64_view.values[-1]) * int64_view.ns_per_unit)
+        tz = None if int64_view.tz is None else str(int64_view.tz)
+
+    metadata = {
+        "timestamp_column": timestamp_column,
+        "backend": frame_backend(dfs[0]),
+        "tz": tz,
+        "starts": starts,
+        "ends": ends,
+        "lengths": lengths.tolist(),
+    }
+    schema = first.schema.with_metadata({**(first.schema.metadata or {}), _METADATA_KEY: json.dumps(metadata)})
+    with pa.OSFile(str(sink), "wb") as file, pa.ipc.new_file(file, schema) as writer:
+        writer.write_table(first.cast(schema))
+        for table in tables:
+            writer.write_table(table.cast(schema))
+
+
+class TimeGroupFile:
+    """Memory-mapped Arrow IPC file written by `write_time_groups_ipc`.
+
+    Opening the file only reads its footer and schema. Every group is a zero-copy slice of the mapped file for the
+    "pyarrow" and "polars" backends; pandas DataFrames are converted from the slice, which copies most columns.
+
+    Attributes:
+        tgs (TimeGroupArray): Time groups of the file, with their row offsets in `table`.
+        table (pa.Table): Memory-mapped rows of all groups.
+        timestamp_column (str): Name of the timestamp column.
+        backend (Literal["pandas", "polars", "pyarrow"]): Library of the returned groups.
+    """
+
+    def __init__(
+        self, source: str | PathLike[str], backend: Literal["pandas", "polars", "pyarrow"] | None = None
+    ) -> None:
+        import pyarrow as pa
+
+        self._source = pa.memory_map(str(source))
+        self.table = pa.ipc.open_file(self._source).read_all()
+        schema_metadata = self.table.schema.metadata or {}
+        if _METADATA_KEY not in schema_metadata:
+            self._source.close()
+            raise ValueError("File was not written by write_time_groups_ipc.")
+        metadata = json.loads(schema_metadata[_METADATA_KEY])
+        self.timestamp_column: str = metadata["timestamp_column"]
+        self.backend = backend or metadata["backend"]
+        lengths = np.asarray(metadata["lengths"], dtype=np.int64)
+        self.tgs = TimeGroupArray(
+            metadata["starts"],
+            metadata["ends"],
+            offsets=np.concatenate(([0], np.cumsum(lengths)[:-1])).astype(np.int64),
+            lengths=lengths,
+            tz=metadata["tz"],
+            backend="python" if self.backend == "pyarrow" else self.backend,
+        )
+
+    def __len__(self) -> int:
+        return len(self.tgs)
+
+    def __getitem__(self, key: int) -> pa.Table | pd.DataFrame | pl.DataFrame:
+        """Get the rows of a time group."""
+        offsets, lengths = cast('np.ndarray', self.tgs.offsets), cast('np.ndarray', self.tgs.lengths)
+        table = self.table.slice(int(offsets[key]), int(lengths[key]))
+        if self.backend == "polars":
+            import polars as pl
+
+            return pl.from_arrow(table, rechunk=False)
+        if self.backend == "pandas":
+            return table.to_pandas()
+        return table
+
+    def __iter__(self) -> Iterator[pa.Table | pd.DataFrame | pl.DataFrame]:
+        for i in range(len(self)):
+            yield self[i]
+
+    def close(self) -> None:
+        """Close the memory map, groups returned before must not be used afterwards."""
+        self._source.close()
+
+    def __enter__(self) -> TimeGroupFile:
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        self.close()
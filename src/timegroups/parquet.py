@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from os import PathLike
+from pathlib import Path
+from typing import TYPE_CHECKING, Literal, cast
+
+import numpy as np
+
+from timegroups.df_grouping import get_time_groups
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Sequence
+    from datetime import timedelta
+
+    import numpy.typing as npt
+    import pandas as pd
+    import polars as pl
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    from timegroups.interfaces import FilterableTimeseries
+    from timegroups.time_group import TimeGroupArray
+
+
+def _open_files(
+    source: str | PathLike[str] | pq.ParquetFile | Sequence[str | PathLike[str] | pq.ParquetFile],
+) -> list[pq.ParquetFile]:
+    """Open a parquet file, the `*.parquet` files of a directory sorted by name or a sequence of files."""
+    import pyarrow.parquet as pq
+
+    if isinstance(source, str | PathLike) and Path(source).is_dir():
+        source = sorted(Path(source).glob("*.parquet"))
+        if not source:
+            raise ValueError("Directory does not contain any parquet files.")
+    elif isinstance(source, str | PathLike | pq.ParquetFile):
+        source = [source]
+    return [file if isinstance(file, pq.ParquetFile) else pq.ParquetFile(file) for file in source]
+
+
+def _row_group_bounds(parquet_files: Sequence[pq.ParquetFile]) -> npt.NDArray[np.int64]:
+    """Get the first row of every row group of all files plus the total number of rows."""
+    num_rows = [
+        file.metadata.row_group(i).num_rows for file in parquet_files for i in range(file.metadata.num_row_groups)
+    ]
+    return np.concatenate(([0], np.cumsum(num_rows, dtype=np.int64)))
+
+
+def _needed_row_groups(
+    bounds: npt.NDArray[np.int64], offsets: npt.NDArray[np.int64], lengths: npt.NDArray[np.int64]
+) -> npt.NDArray[np.int64]:
+    """Get the row groups covering the rows `[offset, offset + length)` of each time group."""
+    first = np.searchsorted(bounds, offsets, side="right") - 1
+    last = np.searchsorted(bounds, offsets + lengths - 1, side="right") - 1
+    covered = np.zeros(len(bounds), dtype=np.int64)
+    np.add.at(covered, first, 1)
+    np.add.at(covered, last + 1, -1)
+    return np.flatnonzero(np.cumsum(covered[:-1]) > 0)
+
+
+def _from_arrow(
+    table: pa.Table, timestamp_column: str, backend: Literal["pandas", "polars"]
+) -> pd.DataFrame | pl.DataFrame:
+    """Convert an arrow table to a DataFrame of `backend`, indexed by the timestamps for pandas."""
+    if backend == "polars":
+        import polars as pl
+
+        return cast('pl.DataFrame', pl.from_arrow(table))
+    return table.to_pandas().set_index(timestamp_column)
+
+
+def read_parquet_time_groups(
+    source: str | PathLike[str] | pq.ParquetFile | Sequence[str | PathLike[str] | pq.ParquetFile],
+    timestamp_column: str,
+    select: Callable[[TimeGroupArray], npt.ArrayLike] | None = None,
+    freq: timedelta | None = None,
+    time_delta_factor: float = 2.0,
+    columns: Sequence[str] | None = None,
+    backend: Literal["pandas", "polars"] = "polars",
+) -> tuple[TimeGroupArray, list[pd.DataFrame] | list[pl.DataFrame]]:
+    """Read the time groups of a parquet dataset that satisfy a condition, without reading the other rows.
+
+    Only the timestamp column is read to derive the time groups. The rows of the selected groups are then mapped
+    to row groups via the row counts in the file metadata, and only those row groups are read. The files have to
+    be sorted by `timestamp_column`, one after another; the row counts then locate the groups exactly, so the
+    min/max statistics of the row groups are not used.
+
+    Args:
+        source (str | PathLike[str] | pq.ParquetFile | Sequence[str | PathLike[str] | pq.ParquetFile]): Parquet
+         file, directory of parquet files (read in the order of their names) or sequence of parquet files.
+        timestamp_column (str): Column with the timestamps.
+        select (Callable[[TimeGroupArray], npt.ArrayLike] | None, optional): Get a boolean mask of the time groups
+         to read, e.g. `lambda tgs: tgs.duration >= np.timedelta64(7, "D")`. Defaults to None (all groups).
+        freq (timedelta | None, optional): Frequency of the timestamps, guessed if None. Defaults to None.
+        time_delta_factor (float, optional): Determine the gap (in combination with `freq`)
+         that still will be considered all-over. Defaults to 2.0.
+        columns (Sequence[str] | None, optional): Columns to read besides `timestamp_column`.
+         Defaults to None (all columns).
+        backend (Literal["pandas", "polars"], optional): Library of the returned DataFrames, pandas DataFrames
+         are indexed by `timestamp_column`. Defaults to "polars".
+
+    Raises:
+        ValueError: If the timestamp column contains nulls or a directory contains no parquet files.
+
+    Returns:
+        tuple[TimeGroupArray, list[pd.DataFrame] | list[pl.DataFrame]]: Selected time groups and their rows.
+    """
+    import pyarrow as pa
+
+    parquet_files = _open_files(source)
+    timestamps = pa.chunked_array(
+        [
+            chunk
+            for file in parquet_files
+            for chunk in file.read(columns=[timestamp_column]).column(timestamp_column).chunks
+        ]
+    )
+    if backend == "polars":
+        import polars as pl
+
+        idx = cast('FilterableTimeseries', pl.Series(timestamp_column, timestamps))
+    else:
+        import pandas as pd
+
+        idx = pd.DatetimeIndex(timestamps.to_pandas())
+    tgs = get_time_groups(idx, time_delta_factor=time_delta_factor, freq=freq)
+    if select is not None:
+        tgs = tgs.filter(select(tgs))
+    if len(tgs) == 0:
+        return tgs, []
+
+    # time groups of a single series always carry their row offsets
+    offsets, lengths = cast('npt.NDArray[np.int64]', tgs.offsets), cast('npt.NDArray[np.int64]', tgs.lengths)
+    bounds = _row_group_bounds(parquet_files)
+    row_groups = _needed_row_groups(bounds, offsets, lengths)
+    if columns is not None and timestamp_column not in columns:
+        columns = [timestamp_column, *columns]
+    file_starts = np.cumsum([0] + [file.metadata.num_row_groups for file in parquet_files])
+    tables = []
+    for i, file in enumerate(parquet_files):
+        local_row_groups = row_groups[(row_groups >= file_starts[i]) & (row_groups < file_starts[i + 1])]
+        if len(local_row_groups):
+            tables.append(file.read_row_groups((local_row_groups - file_starts[i]).tolist(), columns=columns))
+    table = pa.concat_tables(tables)
+
+    # row of the read table each row group starts at
+    read_starts = np.zeros(len(bounds) - 1, dtype=np.int64)
+    read_starts[row_groups] = np.concatenate(([0], np.cumsum(np.diff(bounds)[row_groups])[:-1]))
+    first = np.searchsorted(bounds, offsets, side="right") - 1
+    table_offsets = offsets - bounds[first] + read_starts[first]
+    dfs = [
+        _from_arrow(table.slice(int(offset), int(length)), timestamp_column, backend)
+        for offset, length in zip(table_offsets, lengths, strict=True)
+    ]
+    return tgs, cast('list[pd.DataFrame] | list[pl.DataFrame]', dfs)
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+from timegroups.time_group import TimeGroup, TimeGroupArray
+
+if TYPE_CHECKING:
+    from collections.abc import Sequence
+
+
+def _sweep(
+    collections: Sequence[TimeGroupArray], weights: Sequence[int], lower: int, upper: int | None = None
+) -> TimeGroupArray:
+    """Get the periods where the weighted number of covering collections is within `[lower, upper]`.
+
+    Every closed group `[start, end]` is treated as the half-open interval `[start, end + 1)` in nanoseconds, so
+    each group adds `weight` at its start and removes it one nanosecond after its end.
+    """
+    times = np.concatenate([np.concatenate((tgs.starts, tgs.ends + 1)) for tgs in collections])
+    deltas = np.concatenate(
+        [np.repeat([weight, -weight], len(tgs)) for tgs, weight in zip(collections, weights, strict=True)]
+    )
+    tz, backend = collections[0].tz, collections[0].backend
+    if len(times) == 0:
+        return TimeGroupArray([], [], tz=tz, backend=backend)
+
+    event_times, inverse = np.unique(times, return_inverse=True)
+    counts = np.cumsum(np.bincount(inverse, weights=deltas, minlength=len(event_times)).astype(np.int64))
+    inside = counts >= lower if upper is None else (counts >= lower) & (counts <= upper)
+    changes = np.diff(np.concatenate(([False], inside)).astype(np.int8))
+    return TimeGroupArray(
+        event_times[changes == 1], event_times[np.flatnonzero(changes == -1)] - 1, tz=tz, backend=backend
+    )
+
+
+def _normalize(tgs: Sequence[TimeGroup]) -> TimeGroupArray:
+    """Merge overlapping groups of a collection, so it counts at most once at any time."""
+    tgs = TimeGroupArray.from_time_groups(tgs)
+    sorted_tgs = tgs.sort("start")
+    if np.all(sorted_tgs.starts[1:] > sorted_tgs.ends[:-1]):
+        return sorted_tgs
+    return _sweep([sorted_tgs], [1], 1)
+
+
+def coverage_time_groups(collections: Sequence[Sequence[TimeGroup]], min_count: int) -> TimeGroupArray:
+    """Get the periods covered by at least `min_count` of several time group collections.
+
+    All groups are swept once in order of their bounds, so the runtime is O(n log n) for n groups in total.
+
+    Args:
+        collections (Sequence[Sequence[TimeGroup]]): Time groups of every series, e.g. from `get_time_groups`.
+        min_count (int): Minimum number of collections covering a period.
+
+    Returns:
+        TimeGroupArray: Covered periods in chronological order, usable with `split_df_by_tgs`.
+    """
+    if len(collections) == 0:
+        return TimeGroupArray([], [])
+    normalized = [_normalize(tgs) for tgs in collections]
+    return _sweep(normalized, [1] * len(normalized), max(min_count, 1))
+
+
+def intersect_time_groups(*collections: Sequence[TimeGroup]) -> TimeGroupArray:
+    """Get the periods covered by all time group collections, e.g. where all sensors are continuous."""
+    return coverage_time_groups(collections, len(collections))
+
+
+def union_time_groups(*collections: Sequence[TimeGroup]) -> TimeGroupArray:
+    """Get the periods covered by any of the time group collections."""
+    return coverage_time_groups(collections, 1)
+
+
+def difference_time_groups(tgs: Sequence[TimeGroup], *others: Sequence[TimeGroup]) -> TimeGroupArray:
+    """Get the periods covered by `tgs` but by none of `others`, e.g. without maintenance windows."""
+    others_union = union_time_groups(*others) if others else TimeGroupArray([], [])
+    return _sweep([_normalize(tgs), others_union], [1, -1], 1, 1)
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+import threading
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+    from types import TracebackType
+
+
+@dataclass(slots=True)
+class StageStats:
+    """Accumulated measurements of one stage.
+
+    Attributes:
+        seconds (float): Wall time spent in the stage.
+        calls (int): Number of times the stage ran, e.g. once per time group.
+        rows_in (int): Rows passed into the stage.
+        rows_out (int): Rows (or groups for `get_time_groups`) coming out of the stage.
+    """
+
+    seconds: float = 0.0
+    calls: int = 0
+    rows_in: int = 0
+    rows_out: int = 0
+
+
+@dataclass(slots=True)
+class GroupingStats:
+    """Measurements collected by `collect_stats`.
+
+    Attributes:
+        stages (dict[str, StageStats]): Measurements per stage, in the order the stages first ran.
+        n_groups (int): Number of time groups.
+        duplicates_dropped (int): Rows dropped because their rounded timestamp was already present.
+        rows_inserted (int): Rows inserted by upsampling.
+    """
+
+    stages: dict[str, StageStats] = field(default_factory=dict)
+    n_groups: int = 0
+    duplicates_dropped: int = 0
+    rows_inserted: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    @property
+    def total_seconds(self) -> float:
+        """Get the wall time of all top level stages (stages without a `.` in their name)."""
+        return sum(stage.seconds for name, stage in self.stages.items() if "." not in name)
+
+    def add(self, name: str, seconds: float, rows_in: int = 0, rows_out: int = 0) -> None:
+        """Add a measurement of a stage."""
+        with self._lock:
+            stage = self.stages.get(name)
+            if stage is None:
+                stage = self.stages[name] = StageStats()
+            stage.seconds += seconds
+            stage.calls += 1
+            stage.rows_in += rows_in
+            stage.rows_out += rows_out
+
+    def count(self, n_groups: int = 0, duplicates_dropped: int = 0, rows_inserted: int = 0) -> None:
+        """Add to the counters."""
+        with self._lock:
+            self.n_groups += n_groups
+            self.duplicates_dropped += duplicates_dropped
+            self.rows_inserted += rows_inserted
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get the measurements as a JSON-serializable dict."""
+        return {
+            "stages": {
+                name: {"seconds": s.seconds, "calls": s.calls, "rows_in": s.rows_in, "rows_out": s.rows_out}
+                for name, s in self.stages.items()
+            },
+            "n_groups": self.n_groups,
+            "duplicates_dropped": self.duplicates_dropped,
+            "rows_inserted": self.rows_inserted,
+            "total_seconds": self.total_seconds,
+        }
+
+
+_current_stats: ContextVar[GroupingStats | None] = ContextVar("timegroups_stats", default=None)
+
+
+def get_stats() -> GroupingStats | None:
+    """Get the stats collected in the current context, None if collection is disabled."""
+    return _current_stats.get()
+
+
+@contextmanager
+def collect_stats() -> Iterator[GroupingStats]:
+    """Collect stage timings and row counts of the calls made within the context.
+
+    Collection is scoped to the current thread / asyncio task (and the worker threads `get_freq_consistent_dfs`
+    starts for `n_jobs`). Work done in other processes is not measured. Without this context the instrumented
+    functions only pay for one context variable lookup per stage.
+
+    Yields:
+        GroupingStats: Stats that are filled while the context is active.
+    """
+    stats = GroupingStats()
+    token = _current_stats.set(stats)
+    try:
+        yield stats
+    finally:
+        _current_stats.reset(token)
+
+
+class _Stage:
+    __slots__ = ("stats", "name", "rows_in", "rows_out", "start")
+
+    def __init__(self, stats: GroupingStats | None, name: str, rows_in: int) -> None:
+        self.stats = stats
+        self.name = name
+        self.rows_in = rows_in
+        self.rows_out = 0
+        self.start = 0.0
+
+    def __enter__(self) -> _Stage:
+        if self.stats is not None:
+            self.start = perf_counter()
+        return self
+
+    def __exit__(
+        self, exc_type: type[BaseException] | None, exc: BaseException | None, traceback: TracebackType | None
+    ) -> None:
+        if self.stats is not None:
+            self.stats.add(self.name, perf_counter() - self.start, self.rows_in, self.rows_out)
+
+
+# Shared stage that records nothing, returned while stats are not collected.
+_NO_STAGE = _Stage(None, "", 0)
+
+
+def stage(name: str, rows_in: int = 0) -> _Stage:
+    """Time a stage if stats are collected, set `rows_out` on the returned object to record the output size."""
+    stats = _current_stats.get()
+    if stats is None:
+        return _NO_STAGE
+    return _Stage(stats, name, rows_in)
@@ -1,20 +1,223 @@
+from __future__ import annotations
+
+from collections.abc import Iterator, Sequence
 from dataclasses import dataclass
+from typing import TYPE_CHECKING, Literal, overload
+
+import numpy as np
+
+from timegroups.engine import Backend, timedelta_to_ns, timestamp_from_ns, timestamp_to_ns
 
-import pandas as pd
+if TYPE_CHECKING:
+    from datetime import datetime, timedelta, tzinfo
 
+    import numpy.typing as npt
+    import pandas as pd
+    import polars as pl
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class TimeGroup:
-    """Dataclass to represent a time group."""
+    """Dataclass to represent a time group.
+
+    `start` and `end` are `pd.Timestamp`s for groups derived from pandas, `datetime`s otherwise.
+    """
 
-    start: pd.Timestamp
-    end: pd.Timestamp
+    start: datetime
+    end: datetime
 
     @property
-    def duration(self) -> pd.Timedelta:
+    def duration(self) -> timedelta:
         """Get the duration of the time group."""
         return self.end - self.start
 
     def __repr__(self) -> str:
         """Return a string representation of the TimeGroup."""
         return f"TimeGroup({self.start}, {self.end})"
+
+
+class TimeGroupArray(Sequence[TimeGroup]):
+    """Columnar collection of time groups.
+
+    Starts and ends are stored as int64 nanoseconds since the epoch (UTC). `TimeGroup`s are only created on
+    access, so a `TimeGroupArray` can be used wherever a list of `TimeGroup`s was used before.
+
+    Attributes:
+        starts (npt.NDArray[np.int64]): Start of each group in nanoseconds.
+        ends (npt.NDArray[np.int64]): End (inclusive) of each group in nanoseconds.
+        offsets (npt.NDArray[np.int64] | None): Row of the source series each group starts at.
+        lengths (npt.NDArray[np.int64] | None): Number of rows of the source series in each group.
+        tz (str | tzinfo | None): Time zone of the timestamps.
+        backend (Backend): Library the groups were derived from, determines the type of `TimeGroup.start/end`.
+    """
+
+    __slots__ = ("starts", "ends", "offsets", "lengths", "tz", "backend")
+
+    def __init__(
+        self,
+        starts: npt.ArrayLike,
+        ends: npt.ArrayLike,
+        offsets: npt.ArrayLike | None = None,
+        lengths: npt.ArrayLike | None = None,
+        tz: str | tzinfo | None = None,
+        backend: Backend = "pandas",
+    ) -> None:
+        self.starts = np.asarray(starts, dtype=np.int64)
+        self.ends = np.asarray(ends, dtype=np.int64)
+        if self.starts.shape != self.ends.shape:
+            raise ValueError("starts and ends must have the same length.")
+        if (offsets is None) != (lengths is None):
+            raise ValueError("offsets and lengths must be given together.")
+        self.offsets = None if offsets is None else np.asarray(offsets, dtype=np.int64)
+        self.lengths = None if lengths is None else np.asarray(lengths, dtype=np.int64)
+        self.tz = tz
+        self.backend = backend
+
+    @classmethod
+    def from_time_groups(
+        cls, tgs: Sequence[TimeGroup], tz: str | tzinfo | None = None, backend: Backend | None = None
+    ) -> TimeGroupArray:
+        """Create a `TimeGroupArray` from `TimeGroup`s, by default of the backend of their timestamps."""
+        if isinstance(tgs, TimeGroupArray):
+            return tgs
+        if tz is None and len(tgs) > 0:
+            tz = getattr(tgs[0].start, "tzinfo", None)
+        if backend is None:
+            from_pandas = len(tgs) > 0 and type(tgs[0].start).__module__.startswith("pandas")
+            backend = "pandas" if from_pandas else "python"
+        return cls(
+            np.fromiter((timestamp_to_ns(tg.start) for tg in tgs), dtype=np.int64, count=len(tgs)),
+            np.fromiter((timestamp_to_ns(tg.end) for tg in tgs), dtype=np.int64, count=len(tgs)),
+            tz=tz,
+            backend=backend,
+        )
+
+    def _take(self, key: slice | npt.NDArray[np.generic]) -> TimeGroupArray:
+        return TimeGroupArray(
+            self.starts[key],
+            self.ends[key],
+            offsets=None if self.offsets is None else self.offsets[key],
+            lengths=None if self.lengths is None else self.lengths[key],
+            tz=self.tz,
+            backend=self.backend,
+        )
+
+    def _box(self, ns: np.int64) -> datetime:
+        return timestamp_from_ns(int(ns), tz=self.tz, backend=self.backend)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    @overload
+    def __getitem__(self, key: int) -> TimeGroup: ...
+
+    @overload
+    def __getitem__(self, key: slice | Sequence[int] | npt.NDArray[np.generic]) -> TimeGroupArray: ...
+
+    def __getitem__(self, key: int | slice | Sequence[int] | npt.NDArray[np.generic]) -> TimeGroup | TimeGroupArray:
+        if isinstance(key, int | np.integer):
+            return TimeGroup(self._box(self.starts[key]), self._box(self.ends[key]))
+        return self._take(key if isinstance(key, slice) else np.asarray(key))
+
+    def __iter__(self) -> Iterator[TimeGroup]:
+        for start, end in zip(self.starts, self.ends, strict=True):
+            yield TimeGroup(self._box(start), self._box(end))
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, TimeGroupArray):
+            return bool(np.array_equal(self.starts, other.starts) and np.array_equal(self.ends, other.ends))
+        if isinstance(other, Sequence):
+            return len(self) == len(other) and all(tg == other_tg for tg, other_tg in zip(self, other, strict=True))
+        return NotImplemented
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        """Return a string representation of the TimeGroupArray."""
+        return f"TimeGroupArray({list(self)})"
+
+    @property
+    def duration(self) -> npt.NDArray[np.timedelta64]:
+        """Get the duration of each time group."""
+        return (self.ends - self.starts).astype("timedelta64[ns]")
+
+    def filter(self, mask: npt.ArrayLike) -> TimeGroupArray:
+        """Keep the time groups where `mask` is True."""
+        return self._take(np.asarray(mask, dtype=bool))
+
+    def sort(self, by: Literal["start", "end", "duration"] = "start", descending: bool = False) -> TimeGroupArray:
+        """Sort the time groups (stable)."""
+        keys = {"start": self.starts, "end": self.ends, "duration": self.ends - self.starts}[by]
+        order = np.argsort(-keys if descending else keys, kind="stable")
+        return self._take(order)
+
+    def prune(
+        self,
+        min_length: int | None = None,
+        min_duration: timedelta | None = None,
+        max_groups: int | None = None,
+        freq: timedelta | None = None,
+    ) -> TimeGroupArray:
+        """Drop short time groups.
+
+        Args:
+            min_length (int | None, optional): Minimum number of timestamps of a group once aligned to `freq`,
+             i.e. `duration // freq + 1`. The number of rows (`lengths`) if `freq` is None. Defaults to None.
+            min_duration (timedelta | None, optional): Minimum duration of a group. Defaults to None.
+            max_groups (int | None, optional): Keep only the longest groups (by duration, the earlier one on
+             ties), in chronological order. Defaults to None.
+            freq (timedelta | None, optional): Frequency the groups will be aligned to. Defaults to None.
+
+        Raises:
+            ValueError: If `min_length` is given without `freq` and the groups have no `lengths`.
+
+        Returns:
+            TimeGroupArray: Remaining time groups.
+        """
+        durations = self.ends - self.starts
+        mask = np.ones(len(self), dtype=bool)
+        if min_length is not None:
+            if freq is not None:
+                mask &= durations // timedelta_to_ns(freq) + 1 >= min_length
+            elif self.lengths is not None:
+                mask &= self.lengths >= min_length
+            else:
+                raise ValueError("min_length requires freq or a TimeGroupArray with lengths.")
+        if min_duration is not None:
+            mask &= durations >= timedelta_to_ns(min_duration)
+        if max_groups is not None and np.count_nonzero(mask) > max_groups:
+            candidates = np.flatnonzero(mask)
+            longest = candidates[np.argsort(-durations[candidates], kind="stable")[:max_groups]]
+            mask[:] = False
+            mask[longest] = True
+        return self.filter(mask)
+
+    def to_pandas(self) -> pd.DataFrame:
+        """Convert to a pandas DataFrame with `start`, `end` and `duration` (plus `offset`, `length`) columns."""
+        import pandas as pd
+
+        starts = pd.to_datetime(self.starts, unit="ns", utc=self.tz is not None)
+        ends = pd.to_datetime(self.ends, unit="ns", utc=self.tz is not None)
+        if self.tz is not None:
+            starts, ends = starts.tz_convert(self.tz), ends.tz_convert(self.tz)
+        columns = {"start": starts, "end": ends, "duration": pd.to_timedelta(self.ends - self.starts, unit="ns")}
+        if self.offsets is not None and self.lengths is not None:
+            columns |= {"offset": self.offsets, "length": self.lengths}
+        return pd.DataFrame(columns)
+
+    def to_polars(self) -> pl.DataFrame:
+        """Convert to a polars DataFrame with `start`, `end` and `duration` (plus `offset`, `length`) columns."""
+        import polars as pl
+
+        time_zone = None if self.tz is None else str(self.tz)
+        columns = [
+            pl.Series("start", self.starts, dtype=pl.Int64).cast(pl.Datetime("ns", time_zone="UTC")),
+            pl.Series("end", self.ends, dtype=pl.Int64).cast(pl.Datetime("ns", time_zone="UTC")),
+            pl.Series("duration", self.ends - self.starts, dtype=pl.Int64).cast(pl.Duration("ns")),
+        ]
+        if self.offsets is not None and self.lengths is not None:
+            columns += [pl.Series("offset", self.offsets), pl.Series("length", self.lengths)]
+        df = pl.DataFrame(columns)
+        if time_zone is None:
+            return df.with_columns(pl.col("start", "end").dt.replace_time_zone(None))
+        return df.with_columns(pl.col("start", "end").dt.convert_time_zone(time_zone))
@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import json
+from bisect import bisect_left, bisect_right
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any, cast
+
+import numpy as np
+
+from timegroups.adapters import datetime_int64
+from timegroups.engine import Backend, group_bounds, timedelta_to_ns, timestamp_to_ns
+from timegroups.time_group import TimeGroup, TimeGroupArray
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+    from datetime import tzinfo
+
+    import numpy.typing as npt
+
+
+def _timestamps_ns(timestamps: Any) -> tuple[npt.NDArray[np.int64], str | tzinfo | None, Backend | None]:  # noqa: ANN401
+    """Get sorted nanoseconds since the epoch (UTC) of a batch of timestamps, nulls are dropped."""
+    int64_view = datetime_int64(timestamps)
+    if int64_view is None and hasattr(timestamps, 'drop_nulls'):
+        int64_view = datetime_int64(timestamps.drop_nulls())
+    elif int64_view is None and hasattr(timestamps, 'dropna'):
+        int64_view = datetime_int64(timestamps.dropna())
+    if int64_view is not None:
+        return np.sort(int64_view.values * int64_view.ns_per_unit), int64_view.tz, int64_view.backend
+    if isinstance(timestamps, np.ndarray) and timestamps.dtype.kind == "M":
+        values = timestamps[~np.isnat(timestamps)].astype("datetime64[ns]").view(np.int64)
+        return np.sort(values), None, None
+    values = np.fromiter((timestamp_to_ns(t) for t in timestamps if t is not None), dtype=np.int64)
+    return np.sort(values), None, None
+
+
+def _to_list(values: npt.NDArray[np.int64]) -> list[int]:
+    """Get int64 values as a list of Python ints."""
+    return cast('list[int]', values.tolist())
+
+
+class TimeGroupTracker:
+    """Incrementally maintained time groups of an append-only series.
+
+    Time groups are split wherever the step between consecutive timestamps is larger than
+    `time_delta_factor * freq`, like in `get_time_groups`. New timestamps can only merge groups, so an update only
+    re-merges the groups within that threshold of the new timestamps. For a live feed these are the last few
+    groups, which makes an update independent of the length of the series. Late, out-of-order timestamps are
+    handled the same way, just further back.
+
+    Attributes:
+        freq (timedelta): Frequency of the series.
+        time_delta_factor (float): Determine the gap (in combination with `freq`) that still will be considered
+         all-over.
+        tz (str | tzinfo | None): Time zone of the timestamps.
+        backend (Backend): Library the timestamps come from, determines the type of `TimeGroup.start/end`.
+    """
+
+    def __init__(
+        self,
+        freq: timedelta,
+        time_delta_factor: float = 2.0,
+        tz: str | tzinfo | None = None,
+        backend: Backend = "pandas",
+    ) -> None:
+        self.freq = freq
+        self.time_delta_factor = time_delta_factor
+        self.tz = tz
+        self.backend = backend
+        self._threshold = time_delta_factor * timedelta_to_ns(freq)
+        self._starts: list[int] = []
+        self._ends: list[int] = []
+
+    @classmethod
+    def from_time_groups(
+        cls, tgs: Sequence[TimeGroup], freq: timedelta, time_delta_factor: float = 2.0
+    ) -> TimeGroupTracker:
+        """Create a tracker seeded with time groups, e.g. the result of `get_time_groups`.
+
+        Args:
+            tgs (Sequence[TimeGroup]): Time groups derived with the same `freq` and `time_delta_factor`.
+            freq (timedelta): Frequency of the series.
+            time_delta_factor (float, optional): Determine the gap (in combination with `freq`) that still will be
+             considered all-over. Defaults to 2.0.
+
+        Returns:
+            TimeGroupTracker: Tracker holding `tgs`.
+        """
+        tgs = TimeGroupArray.from_time_groups(tgs)
+        tracker = cls(freq, time_delta_factor=time_delta_factor, tz=tgs.tz, backend=tgs.backend)
+        order = np.argsort(tgs.starts, kind="stable")
+        tracker._starts = _to_list(tgs.starts[order])
+        tracker._ends = _to_list(tgs.ends[order])
+        return tracker
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    @property
+    def time_groups(self) -> TimeGroupArray:
+        """Get the current time groups."""
+        return TimeGroupArray(self._starts, self._ends, tz=self.tz, backend=self.backend)
+
+    def update(self, timestamps: Any) -> int:  # noqa: ANN401
+        """Add a batch of timestamps.
+
+        Args:
+            timestamps (Any): pd.DatetimeIndex / pd.Series / pl.Series / datetime64 array or an iterable of
+             datetimes. Need not be sorted and may overlap the existing groups.
+
+        Returns:
+            int: Position of the first time group that changed, `len(self)` if none did. All groups before that
+             position are unchanged.
+        """
+        values, tz, backend = _timestamps_ns(timestamps)
+        if len(values) == 0:
+            return len(self)
+        if len(self) == 0 and backend is not None:
+            self.tz, self.backend = tz, backend
+
+        begins, ends = group_bounds(values, self._threshold)
+        lo = bisect_left(self._ends, int(values[0]) - self._threshold)
+        hi = bisect_right(self._starts, int(values[-1]) + self._threshold)
+        candidates = sorted(
+            zip(self._starts[lo:hi] + _to_list(values[begins]), self._ends[lo:hi] + _to_list(values[ends]), strict=True)
+        )
+
+        starts, group_ends = [candidates[0][0]], [candidates[0][1]]
+        for start, end in candidates[1:]:
+            if start - group_ends[-1] > self._threshold:
+                starts.append(start)
+                group_ends.append(end)
+            elif end > group_ends[-1]:
+                group_ends[-1] = end
+        self._starts[lo:hi] = starts
+        self._ends[lo:hi] = group_ends
+        return lo
+
+    def extend(self, batches: Iterable[Any]) -> None:
+        """Add several batches of timestamps, see `update`."""
+        for batch in batches:
+            self.update(batch)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Get the state of the tracker as a JSON-serializable dict."""
+        return {
+            "freq_ns": timedelta_to_ns(self.freq),
+            "time_delta_factor": self.time_delta_factor,
+            "tz": None if self.tz is None else str(self.tz),
+            "backend": self.backend,
+            "starts": list(self._starts),
+            "ends": list(self._ends),
+        }
+
+    @classmethod
+    def from_dict(cls, state: dict[str, Any]) -> TimeGroupTracker:
+        """Restore a tracker from the result of `to_dict`."""
+        tracker = cls(
+            timedelta(microseconds=state["freq_ns"] / 1_000),
+            time_delta_factor=state["time_delta_factor"],
+            tz=state["tz"],
+            backend=state["backend"],
+        )
+        tracker._threshold = tracker.time_delta_factor * state["freq_ns"]
+        tracker._starts = [int(start) for start in state["starts"]]
+        tracker._ends = [int(end) for end in state["ends"]]
+        return tracker
+
+    def to_json(self) -> str:
+        """Get the state of the tracker as a JSON string."""
+        return json.dumps(self.to_dict())
+
+    @classmethod
+    def from_json(cls, state: str) -> TimeGroupTracker:
+        """Restore a tracker from the result of `to_json`."""
+        return cls.from_dict(json.loads(state))
@@ -0,0 +1,184 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, NamedTuple, cast
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+from timegroups.adapters import datetime_int64
+from timegroups.df_grouping import _get_datetime_series
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator, Sequence
+
+    import numpy.typing as npt
+    import pandas as pd
+    import polars as pl
+
+    from timegroups.interfaces import DataFrameWithDatetimeIndex as PandasDataframe
+    from timegroups.interfaces import PolarsDataFrame
+
+
+class Windows(NamedTuple):
+    """Fixed-length windows over time groups, e.g. training samples of a forecasting model.
+
+    Attributes:
+        values (npt.NDArray[Any]): Windows of shape (n_windows, input_len + output_len, n_features).
+        group_ids (npt.NDArray[np.int64]): Time group each window belongs to.
+        positions (npt.NDArray[np.int64]): Row of the first timestamp of each window within its time group.
+        starts (npt.NDArray[np.datetime64]): First timestamp of each window (UTC for time zone aware data).
+        input_len (int): Number of input timestamps of each window, the rest are targets.
+    """
+
+    values: npt.NDArray[Any]
+    group_ids: npt.NDArray[np.int64]
+    positions: npt.NDArray[np.int64]
+    starts: npt.NDArray[np.datetime64]
+    input_len: int
+
+    @property
+    def inputs(self) -> npt.NDArray[Any]:
+        """Get the input part of the windows, shape (n_windows, input_len, n_features)."""
+        return self.values[:, : self.input_len]
+
+    @property
+    def targets(self) -> npt.NDArray[Any]:
+        """Get the target part of the windows, shape (n_windows, output_len, n_features)."""
+        return self.values[:, self.input_len :]
+
+
+def sliding_windows(values: npt.NDArray[Any], window: int, stride: int = 1) -> npt.NDArray[Any]:
+    """Get a read-only view of all windows of consecutive rows.
+
+    Args:
+        values (npt.NDArray[Any]): Array of shape (n_rows, n_features).
+        window (int): Number of rows per window.
+        stride (int, optional): Step between the first rows of consecutive windows. Defaults to 1.
+
+    Returns:
+        npt.NDArray[Any]: View of shape (n_windows, window, n_features), empty if `values` is shorter than `window`.
+    """
+    if len(values) < window:
+        return np.empty((0, window, values.shape[1]), dtype=values.dtype)
+    return sliding_window_view(values, window, axis=0).transpose(0, 2, 1)[::stride]
+
+
+def _get_values(
+    df: PandasDataframe | PolarsDataFrame, columns: Sequence[str] | None, timestamp_column: str | None
+) -> npt.NDArray[Any]:
+    """Get the value columns of a DataFrame as one array of shape (n_rows, n_features)."""
+    if hasattr(df, 'index'):
+        pd_df = cast('pd.DataFrame', df)
+        return (pd_df if columns is None else pd_df[list(columns)]).to_numpy()
+    if timestamp_column is None:
+        raise ValueError("timestamp_column must be provided.")
+    pl_df = cast('pl.DataFrame', df)
+    if columns is None:
+        return pl_df.drop(timestamp_column).to_numpy()
+    return pl_df.select(columns).to_numpy()
+
+
+def _get_timestamps(df: PandasDataframe | PolarsDataFrame, timestamp_column: str | None) -> npt.NDArray[np.datetime64]:
+    """Get the timestamps of a DataFrame as datetime64[ns] (UTC for time zone aware data)."""
+    datetime_series = _get_datetime_series(df, timestamp_column)
+    int64_view = datetime_int64(datetime_series)
+    if int64_view is None:
+        raise ValueError("Timestamps must be a datetime series without nulls.")
+    return (int64_view.values * int64_view.ns_per_unit).view("datetime64[ns]")
+
+
+def iter_windows(
+    dfs: Sequence[PandasDataframe | PolarsDataFrame],
+    input_len: int,
+    output_len: int = 0,
+    stride: int = 1,
+    columns: Sequence[str] | None = None,
+    timestamp_column: str | None = None,
+) -> Iterator[npt.NDArray[Any]]:
+    """Get the windows of every time group without copying them.
+
+    The value columns of each group are converted to an array once, the windows are views of that array.
+
+    Args:
+        dfs (Sequence[PandasDataframe | PolarsDataFrame]): Aligned time groups, e.g. from `get_freq_consistent_dfs`.
+        input_len (int): Number of input timestamps per window.
+        output_len (int, optional): Number of target timestamps per window. Defaults to 0.
+        stride (int, optional): Step between the first rows of consecutive windows. Defaults to 1.
+        columns (Sequence[str] | None, optional): Value columns. Defaults to None (all but the timestamps).
+        timestamp_column (str | None, optional): Name of the timestamp column, required for polars.
+         Defaults to None.
+
+    Yields:
+        npt.NDArray[Any]: Read-only view of shape (n_windows, input_len + output_len, n_features) per time group.
+    """
+    for df in dfs:
+        yield sliding_windows(_get_values(df, columns, timestamp_column), input_len + output_len, stride=stride)
+
+
+def get_windows(
+    data: PandasDataframe | PolarsDataFrame | Sequence[PandasDataframe | PolarsDataFrame],
+    input_len: int,
+    output_len: int = 0,
+    stride: int = 1,
+    columns: Sequence[str] | None = None,
+    timestamp_column: str | None = None,
+    lengths: npt.ArrayLike | None = None,
+) -> Windows:
+    """Get the windows of all time groups as one batch.
+
+    Windows never cross time group boundaries. Only the selected windows are copied into the batch, from a sliding
+    window view of every group, or by a single gather over a sliding window view of a single DataFrame.
+
+    Args:
+        data (PandasDataframe | PolarsDataFrame | Sequence[PandasDataframe | PolarsDataFrame]): Aligned time
+         groups, or a single DataFrame of consecutive time groups with their `lengths`.
+        input_len (int): Number of input timestamps per window.
+        output_len (int, optional): Number of target timestamps per window. Defaults to 0.
+        stride (int, optional): Step between the first rows of consecutive windows of a group. Defaults to 1.
+        columns (Sequence[str] | None, optional): Value columns. Defaults to None (all but the timestamps).
+        timestamp_column (str | None, optional): Name of the timestamp column, required for polars.
+         Defaults to None.
+        lengths (npt.ArrayLike | None, optional): Number of rows of each time group if `data` is a single DataFrame.
+         Defaults to None (a single group).
+
+    Returns:
+        Windows: Batch of shape (n_windows, input_len + output_len, n_features) and the origin of each window.
+    """
+    window = input_len + output_len
+    if isinstance(data, list | tuple):
+        values_per_group = [_get_values(df, columns, timestamp_column) for df in data]
+        group_lengths = np.array([len(group_values) for group_values in values_per_group], dtype=np.int64)
+    else:
+        frame = cast('PandasDataframe | PolarsDataFrame', data)
+        values = _get_values(frame, columns, timestamp_column)
+        group_lengths = np.asarray([len(values)] if lengths is None else lengths, dtype=np.int64)
+        if group_lengths.sum() != len(values):
+            raise ValueError("lengths must sum up to the number of rows.")
+
+    n_windows = np.maximum((group_lengths - window) // stride + 1, 0)
+    group_ids = np.repeat(np.arange(len(group_lengths), dtype=np.int64), n_windows)
+    window_offsets = np.cumsum(n_windows) - n_windows
+    positions = (np.arange(n_windows.sum(), dtype=np.int64) - np.repeat(window_offsets, n_windows)) * stride
+    if not isinstance(data, list | tuple):
+        rows = np.concatenate(([0], np.cumsum(group_lengths)[:-1]))[group_ids] + positions
+        return Windows(
+            sliding_windows(values, window)[rows]
+            if len(rows)
+            else np.empty((0, window, values.shape[1]), values.dtype),
+            group_ids,
+            positions,
+            _get_timestamps(frame, timestamp_column)[rows].astype("datetime64[ns]"),
+            input_len,
+        )
+
+    # copy the windows of every group straight from a view of its own rows, without concatenating all groups first
+    n_features = values_per_group[0].shape[1] if values_per_group else 0
+    batch = np.empty(
+        (n_windows.sum(), window, n_features), np.result_type(*values_per_group) if values_per_group else np.float64
+    )
+    starts = np.empty(n_windows.sum(), dtype="datetime64[ns]")
+    for group_id in np.flatnonzero(n_windows):
+        section = slice(window_offsets[group_id], window_offsets[group_id] + n_windows[group_id])
+        batch[section] = sliding_windows(values_per_group[group_id], window, stride=stride)
+        starts[section] = _get_timestamps(data[group_id], timestamp_column)[positions[section]]
+    return Windows(batch, group_ids, positions, starts, input_len)
@@ -1,10 +1,12 @@
+from datetime import timedelta
 from typing import NamedTuple
 
+import numpy as np
 import pandas as pd
 
 from timegroups.interfaces import DataFrameWithDatetimeIndex as PandasDataframe
 from timegroups.interfaces import PolarsDataFrame
-from timegroups.time_group import TimeGroup
+from timegroups.time_group import TimeGroup, TimeGroupArray
 
 
 class TestDataframeRecord(NamedTuple):
@@ -92,3 +94,60 @@ test_dataframes: list[TestDataframeRecord] = [
         expected_time_groups=[],
     ),
 ]
+
+
+def get_minute_dataframe(days: int = 0) -> pd.DataFrame:
+    """Get two time groups at a one minute frequency, the first one missing a minute, shifted by `days`."""
+    idx = pd.DatetimeIndex(
+        ["2022-01-01 00:00", "2022-01-01 00:01", "2022-01-01 00:03", "2022-01-01 01:00", "2022-01-01 01:01"],
+        name="time",
+    )
+    return pd.DataFrame({"value": np.arange(len(idx), dtype=float)}, index=idx + pd.Timedelta(days=days))
+
+
+def get_aligned_dataframes() -> list[pd.DataFrame]:
+    """Get three hourly time groups of 10, 4 and 7 rows, aligned by `get_freq_consistent_dfs`."""
+    from timegroups.df_grouping import get_freq_consistent_dfs
+
+    idx = pd.date_range("2022-01-01", periods=10, freq="h").append(pd.date_range("2022-01-02", periods=4, freq="h"))
+    idx = idx.append(pd.date_range("2022-01-03", periods=7, freq="h")).rename("time")
+    df = pd.DataFrame({"a": np.arange(len(idx), dtype=float), "b": -np.arange(len(idx), dtype=float)}, index=idx)
+    return get_freq_consistent_dfs(df, freq=timedelta(hours=1))
+
+
+def get_long_dataframe() -> pd.DataFrame:
+    """Stack `test_dataframes` as entities of one long DataFrame, with rows in reverse order."""
+    return pd.concat(
+        [df.assign(entity=f"e{i}", value=df["value"].astype(float)) for i, (df, _, _) in enumerate(test_dataframes)]
+    ).iloc[::-1]
+
+
+def get_time_group_array() -> TimeGroupArray:
+    """Get the three time groups of the fourth of `test_dataframes`."""
+    from timegroups.df_grouping import get_time_groups
+
+    df, _, _ = test_dataframes[3]
+    return get_time_groups(df.index)
+
+
+def get_gappy_dataframe(
+    n_rows: int,
+    gap_probability: float,
+    gap: int,
+    unit: str = "h",
+    skip_probability: float = 0.0,
+    nan_probability: float = 0.0,
+) -> pd.DataFrame:
+    """Get random values at random timestamps with a frequency of one `unit`.
+
+    Each step skips a single timestamp with `skip_probability`, which stays within a time group, and jumps `gap`
+    units with `gap_probability`, which starts a new one.
+    """
+    rng = np.random.default_rng(0)
+    steps = np.ones(n_rows, dtype=np.int64)
+    steps[rng.random(n_rows) < skip_probability] = 2
+    steps[rng.random(n_rows) < gap_probability] = gap
+    idx = pd.DatetimeIndex(pd.Timestamp("2022-01-01") + pd.to_timedelta(np.cumsum(steps), unit=unit), name="time")
+    values = rng.normal(size=n_rows)
+    values[rng.random(n_rows) < nan_probability] = np.nan
+    return pd.DataFrame({"value": values}, index=idx)
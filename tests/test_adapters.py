@@ -0,0 +1,74 @@
+from collections.abc import Callable
+from datetime import UTC, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pytest
+
+from tests.data import get_minute_dataframe
+from timegroups.adapters import datetime_int64, frame_backend
+from timegroups.df_grouping import get_time_groups, guess_freq, split_df_by_tgs, time_group_ids
+
+
+@pytest.mark.parametrize(
+    "to_input",
+    [
+        lambda idx: idx.to_numpy(),
+        lambda idx: idx.to_numpy().astype("datetime64[s]"),
+        lambda idx: pa.array(idx.to_numpy()),
+        lambda idx: pa.chunked_array([idx.to_numpy()[:2], idx.to_numpy()[2:]]),
+        lambda idx: idx.to_pydatetime().tolist(),
+    ],
+)
+def test_get_time_groups(to_input: Callable[[pd.DatetimeIndex], Any]) -> None:
+    """Test that numpy, pyarrow and python inputs give the same time groups as pandas."""
+    idx = get_minute_dataframe().index
+    data = to_input(idx)
+    tgs = get_time_groups(data)
+    assert tgs == get_time_groups(idx)
+    assert tgs.offsets.tolist() == [0, 3]
+    assert guess_freq(data) == timedelta(minutes=1)
+    assert time_group_ids(get_minute_dataframe().index.to_numpy()).tolist() == [0, 0, 0, 1, 1]
+
+
+def test_datetime_int64_zero_copy() -> None:
+    """Test that numpy and pyarrow timestamps are viewed without copying."""
+    values = get_minute_dataframe().index.to_numpy()
+    assert np.shares_memory(datetime_int64(values).values, values)
+
+    array = pa.array(values.astype("datetime64[ms]"), type=pa.timestamp("ms", tz="UTC"))
+    int64_view = datetime_int64(array)
+    assert int64_view.ns_per_unit == 1_000_000
+    assert int64_view.tz == "UTC"
+    assert np.shares_memory(int64_view.values, array.to_numpy(zero_copy_only=True))
+    assert get_time_groups(array)[0].start == datetime(2022, 1, 1, tzinfo=UTC)
+
+
+def test_datetime_int64_unsupported() -> None:
+    """Test inputs without an int64 view."""
+    assert datetime_int64(np.array(["2022-01-01", "NaT"], dtype="datetime64[ns]")) is None
+    assert datetime_int64(np.array(["2022-01"], dtype="datetime64[M]")) is None
+    assert datetime_int64(pa.array([datetime(2022, 1, 1, tzinfo=UTC), None])) is None
+    assert datetime_int64([datetime(2022, 1, 1, tzinfo=UTC)]) is None
+    with pytest.raises(ValueError, match="nulls"):
+        get_time_groups([datetime(2022, 1, 1, tzinfo=UTC), None])
+
+
+def test_memory_mapped_arrow_file(tmp_path: Path) -> None:
+    """Test grouping and splitting a memory-mapped Arrow file."""
+    idx = get_minute_dataframe().index
+    table = pa.table({"time": pa.array(idx.to_numpy()), "value": np.arange(len(idx), dtype=float)})
+    path = tmp_path / "data.arrow"
+    with pa.OSFile(str(path), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+
+    with pa.memory_map(str(path)) as source:
+        mapped = pa.ipc.open_file(source).read_all()
+        assert frame_backend(mapped) == "pyarrow"
+        tgs = get_time_groups(mapped.column("time"))
+        dfs = split_df_by_tgs(mapped, tgs, timestamp_column="time")
+        assert [df.column("value").to_pylist() for df in dfs] == [[0.0, 1.0, 2.0], [3.0, 4.0]]
+        assert time_group_ids(mapped, timestamp_column="time").tolist() == [0, 0, 0, 1, 1]
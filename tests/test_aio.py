@@ -0,0 +1,105 @@
+import asyncio
+import multiprocessing
+import threading
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import timedelta
+from typing import Any
+
+import pandas as pd
+import polars as pl
+import pytest
+
+from tests.data import get_minute_dataframe
+from timegroups.aio import agroup_frames
+from timegroups.df_grouping import get_freq_consistent_dfs
+from timegroups.stats import collect_stats
+
+
+def get_test_frames(n_frames: int = 5) -> list[pd.DataFrame]:
+    return [get_minute_dataframe(days=i) + i for i in range(n_frames)]
+
+
+async def load_frames(frames: list[Any]) -> AsyncIterator[Any]:
+    """Local stand-in for loading frames from object storage."""
+    for frame in frames:
+        await asyncio.sleep(0.001)
+        yield frame
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    """Thread pool recording the maximum number of tasks submitted but not finished."""
+
+    def __init__(self) -> None:
+        super().__init__(max_workers=8)
+        self.active = 0
+        self.max_active = 0
+        self.lock = threading.Lock()
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Future:  # noqa: ANN401
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        future = super().submit(fn, *args, **kwargs)
+        future.add_done_callback(lambda _: self._done())
+        return future
+
+    def _done(self) -> None:
+        with self.lock:
+            self.active -= 1
+
+
+async def collect(**kwargs: Any) -> list[pd.DataFrame]:  # noqa: ANN401
+    return [group async for group in agroup_frames(load_frames(get_test_frames()), **kwargs)]
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+def test_agroup_frames(ordered: bool) -> None:
+    """Test that all groups are aligned like with get_freq_consistent_dfs."""
+    freq = timedelta(minutes=1)
+    expected = [group for frame in get_test_frames() for group in get_freq_consistent_dfs(frame, freq=freq)]
+    with collect_stats() as stats:
+        groups = asyncio.run(collect(freq=freq, ordered=ordered))
+    assert stats.n_groups == 10
+    if not ordered:
+        groups = sorted(groups, key=lambda group: group.index[0])
+    assert len(groups) == len(expected) == 10
+    for group, expected_group in zip(groups, expected, strict=True):
+        pd.testing.assert_frame_equal(group, expected_group)
+
+
+@pytest.mark.parametrize("max_in_flight", [1, 3])
+def test_backpressure(max_in_flight: int) -> None:
+    """Test that at most max_in_flight frames are processed at a time."""
+    with CountingExecutor() as executor:
+        groups = asyncio.run(collect(max_in_flight=max_in_flight, executor=executor))
+    assert len(groups) == 10
+    assert 1 <= executor.max_active <= max_in_flight
+
+
+def test_process_pool() -> None:
+    """Test that frames are processed on a process pool, without the context of the caller."""
+    expected = [group for frame in get_test_frames() for group in get_freq_consistent_dfs(frame)]
+    with (
+        ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("spawn")) as executor,
+        collect_stats() as stats,
+    ):
+        groups = asyncio.run(collect(executor=executor, ordered=True))
+    assert stats.n_groups == 0
+    assert len(groups) == len(expected) == 10
+    for group, expected_group in zip(groups, expected, strict=True):
+        pd.testing.assert_frame_equal(group, expected_group)
+
+
+def test_errors() -> None:
+    """Test that errors of the processing are raised to the consumer."""
+    with pytest.raises(ValueError, match="max_in_flight"):
+        asyncio.run(collect(max_in_flight=0))
+    frame = pl.from_pandas(get_test_frames(1)[0], include_index=True)
+
+    async def consume() -> None:
+        async for _ in agroup_frames(load_frames([frame]), freq=timedelta(minutes=1)):
+            pass
+
+    with pytest.raises(ValueError, match="timestamp_column"):
+        asyncio.run(consume())
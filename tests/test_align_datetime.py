@@ -0,0 +1,77 @@
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pytest
+
+
+def get_test_dataframe(tz: str | None = None) -> pd.DataFrame:
+    return pd.DataFrame(
+        {"value": [1.0, 2.0, 3.0, 4.0, 5.0]},
+        index=pd.DatetimeIndex(
+            [
+                "2022-01-01 00:00:10",
+                "2022-01-01 00:00:50",
+                "2022-01-01 00:01:10",
+                "2022-01-01 00:04:00",
+                "2022-01-01 00:05:01",
+            ],
+            name="time",
+        ).tz_localize(tz),
+    )
+
+
+@pytest.mark.parametrize("tz", [None, "UTC", "Europe/Berlin"])
+@pytest.mark.parametrize("keep_duplicates", ["first", "last", False])
+def test_align_datetime_pandas(tz: str | None, keep_duplicates: str) -> None:
+    """Test align_datetime_pandas matches round + drop duplicates + asfreq without touching the input."""
+    from timegroups.df_grouping import align_datetime_pandas
+
+    df = get_test_dataframe(tz)
+    original_df = df.copy()
+    aligned_df = align_datetime_pandas(df, timedelta(minutes=1), keep_duplicates=keep_duplicates)  # type: ignore[arg-type]
+
+    expected_df = df.copy()
+    expected_df.index = expected_df.index.round(timedelta(minutes=1))
+    expected_df = expected_df[~expected_df.index.duplicated(keep=keep_duplicates)].asfreq(timedelta(minutes=1))  # type: ignore[arg-type]
+    pd.testing.assert_frame_equal(aligned_df, expected_df, check_freq=True)
+    pd.testing.assert_frame_equal(df, original_df, check_freq=True)
+
+
+def test_align_datetime_pandas_copy_free() -> None:
+    """Test align_datetime_pandas shares the data of a gap-free DataFrame and only mutates it if inplace."""
+    from timegroups.df_grouping import align_datetime_pandas
+
+    df = pd.DataFrame(
+        {"value": np.arange(5.0)},
+        index=pd.DatetimeIndex(pd.date_range("2022-01-01", periods=5, freq="min") + pd.Timedelta(seconds=5)),
+    )
+    original_index = df.index
+    aligned_df = align_datetime_pandas(df, timedelta(minutes=1))
+    assert aligned_df.index.freq == timedelta(minutes=1)
+    assert aligned_df.index[0] == pd.Timestamp("2022-01-01")
+    assert np.shares_memory(aligned_df["value"].to_numpy(), df["value"].to_numpy())
+    assert df.index is original_index
+
+    aligned_df = align_datetime_pandas(df, timedelta(minutes=1), inplace=True)
+    assert aligned_df is df
+    assert df.index[0] == pd.Timestamp("2022-01-01")
+
+
+def test_align_datetime_polars_not_mutating() -> None:
+    """Test align_datetime_polars only replaces the timestamp column of the input if inplace."""
+    from timegroups.df_grouping import align_datetime_polars
+
+    df = pl.from_pandas(get_test_dataframe(), include_index=True)
+    original_df = df.clone()
+    aligned_df = align_datetime_polars(df, timedelta(minutes=1), "time")
+    assert aligned_df.height == 6
+    assert df.equals(original_df)
+
+    align_datetime_polars(df, timedelta(minutes=1), "time", inplace=True)
+    assert df.get_column("time").to_list() == list(
+        pd.DatetimeIndex(
+            ["2022-01-01 00:00", "2022-01-01 00:01", "2022-01-01 00:01", "2022-01-01 00:04", "2022-01-01 00:05"]
+        )
+    )
@@ -0,0 +1,96 @@
+from datetime import timedelta
+
+import pandas as pd
+import polars as pl
+import pytest
+
+from tests.data import get_long_dataframe, test_dataframes
+
+
+def test_guess_freq_by_entity() -> None:
+    """Test guess_freq method per entity."""
+    from timegroups.df_grouping import guess_freq
+
+    df = get_long_dataframe()
+    minutely = pd.DataFrame(
+        {"entity": "minutely"}, index=pd.date_range("2022-01-01", periods=5, freq="min", name="time")
+    )
+    df = pd.concat([df, minutely])
+    assert guess_freq(df.index, by=df["entity"]) == {
+        "e0": timedelta(days=1),
+        "e1": timedelta(days=1),
+        "e2": timedelta(days=1),
+        "e3": timedelta(days=1),
+        "minutely": timedelta(minutes=1),
+    }
+
+
+def test_get_time_groups_by_entity() -> None:
+    """Test get_time_groups method per entity."""
+    from timegroups.df_grouping import get_time_groups
+
+    df = get_long_dataframe()
+    tgs_by_entity = get_time_groups(df.index, freq=timedelta(days=1), by=df["entity"])
+    assert isinstance(tgs_by_entity, dict)
+    for i, (_, _, time_groups) in enumerate(test_dataframes[:-1]):
+        assert tgs_by_entity[f"e{i}"] == time_groups
+        assert tgs_by_entity[f"e{i}"].offsets is None
+
+
+@pytest.mark.parametrize("backend", ["pandas", "polars"])
+@pytest.mark.parametrize("batched", [False, True])
+def test_get_freq_consistent_dfs_by_entity(backend: str, batched: bool) -> None:
+    """Test get_freq_consistent_dfs method per entity matches one call per entity."""
+    from timegroups.df_grouping import get_freq_consistent_dfs
+
+    df = get_long_dataframe()
+    if backend == "polars":
+        df = pl.from_pandas(df, include_index=True)
+    dfs_by_entity = get_freq_consistent_dfs(df, timestamp_column="time", by="entity", batched=batched)
+    assert isinstance(dfs_by_entity, dict)
+    assert list(dfs_by_entity) == ["e0", "e1", "e2", "e3"]
+    for i, (entity_df, timestamp_col, time_groups) in enumerate(test_dataframes[:-1]):
+        dfs = dfs_by_entity[f"e{i}"]
+        assert len(dfs) == len(time_groups)
+        expected_dfs = [
+            expected_df.assign(entity=f"e{i}")
+            for expected_df in get_freq_consistent_dfs(entity_df.astype(float), freq=timedelta(days=1))
+        ]
+        for expected_df, df in zip(expected_dfs, dfs, strict=True):
+            if backend == "polars":
+                assert df.get_column(timestamp_col).to_list() == expected_df.index.to_list()
+                assert df.get_column("value").to_list() == expected_df["value"].to_list()
+            else:
+                pd.testing.assert_frame_equal(df, expected_df, check_freq=True)
+
+
+@pytest.mark.parametrize("backend", ["pandas", "polars"])
+@pytest.mark.parametrize("batched", [False, True])
+def test_get_freq_consistent_dfs_by_entity_gap(backend: str, batched: bool) -> None:
+    """Test that rows inserted into a gap within a group get the entity key instead of being interpolated."""
+    from timegroups.df_grouping import get_freq_consistent_dfs
+
+    idx = pd.DatetimeIndex(["2022-01-01", "2022-01-02", "2022-01-04", "2022-01-05"], name="time")
+    df = pd.concat(
+        [
+            pd.DataFrame({"entity": "a", "value": [0.0, 1.0, 3.0, 4.0]}, index=idx),
+            pd.DataFrame(
+                {"entity": "b", "value": [5.0, 6.0, 7.0]}, index=idx[:2].append(idx[2:3] - pd.Timedelta(days=1))
+            ),
+        ]
+    )
+    if backend == "polars":
+        df = pl.from_pandas(df, include_index=True)
+    dfs_by_entity = get_freq_consistent_dfs(df, timestamp_column="time", by="entity", batched=batched)
+    assert [len(dfs) for dfs in dfs_by_entity.values()] == [1, 1]
+    aligned = dfs_by_entity["a"][0]
+    if backend == "polars":
+        assert aligned.columns == ["time", "entity", "value"]
+        assert aligned.get_column("entity").to_list() == ["a"] * 5
+        assert aligned.get_column("value").to_list() == [0.0, 1.0, 2.0, 3.0, 4.0]
+    else:
+        assert list(aligned.columns) == ["entity", "value"]
+        assert aligned["entity"].dtype == object
+        assert aligned["entity"].tolist() == ["a"] * 5
+        assert aligned["value"].tolist() == [0.0, 1.0, 2.0, 3.0, 4.0]
+        assert aligned.index.freq == pd.Timedelta(days=1)
@@ -0,0 +1,97 @@
+from datetime import timedelta
+
+import pandas as pd
+import polars as pl
+import pytest
+
+from tests.data import get_minute_dataframe
+from timegroups.cache import TimeGroupCache, fingerprint, get_cache, use_cache
+from timegroups.df_grouping import get_freq_consistent_dfs, get_time_groups, guess_freq
+
+
+@pytest.mark.parametrize("backend", ["pandas", "polars"])
+def test_use_cache(backend: str) -> None:
+    """Test that repeated calls on the same timestamps are served from the cache."""
+    idx = get_minute_dataframe().index
+    if backend == "polars":
+        idx = pl.Series(idx)
+    expected = get_time_groups(idx)
+    with use_cache() as cache:
+        assert get_cache() is cache
+        first = get_time_groups(idx)
+        misses = cache.misses
+        second = get_time_groups(idx.copy() if backend == "pandas" else idx.clone())
+        assert cache.misses == misses
+        assert cache.hits >= 2
+        assert guess_freq(idx) == timedelta(minutes=1)
+    assert get_cache() is None
+    assert first == expected
+    assert second == expected
+    assert second is not first
+    with pytest.raises(ValueError, match="read-only"):
+        second.ends[0] = 0
+
+
+def test_cache_key_arguments() -> None:
+    """Test that different arguments are cached separately."""
+    idx = get_minute_dataframe().index
+    with use_cache() as cache:
+        assert len(get_time_groups(idx)) == 2
+        assert len(get_time_groups(idx, time_delta_factor=100.0)) == 1
+        assert len(get_time_groups(idx, min_length=3)) == 1
+        assert len(get_time_groups(idx, freq=timedelta(hours=1))) == 1
+        assert cache.hits == 2  # guessed freq of the second and third call
+        assert len(get_time_groups(idx[:3])) == 1
+
+
+def test_get_freq_consistent_dfs_reuses_cache() -> None:
+    """Test that get_freq_consistent_dfs reuses time groups cached by an earlier stage."""
+    df = get_minute_dataframe()
+    with use_cache() as cache:
+        get_time_groups(df.index)
+        hits = cache.hits
+        dfs = get_freq_consistent_dfs(df)
+        assert cache.hits == hits + 2
+    assert [len(df) for df in dfs] == [4, 2]
+
+
+def test_eviction() -> None:
+    """Test LRU eviction by entry count and bytes."""
+    indices = [get_minute_dataframe().index + pd.Timedelta(days=day) for day in range(3)]
+    with use_cache(TimeGroupCache(max_entries=2)) as cache:
+        for idx in indices:
+            get_time_groups(idx, freq=timedelta(minutes=1))
+        assert len(cache) == 2
+        get_time_groups(indices[0], freq=timedelta(minutes=1))
+        assert cache.misses == 4
+
+    cache = TimeGroupCache(max_bytes=100)
+    with use_cache(cache):
+        for idx in indices:
+            get_time_groups(idx, freq=timedelta(minutes=1))
+    assert len(cache) == 1
+    assert cache.nbytes == 64
+
+
+def test_invalidate() -> None:
+    """Test dropping the cached values of one index and of all indices."""
+    idx, other = get_minute_dataframe().index, get_minute_dataframe().index + pd.Timedelta(days=1)
+    with use_cache() as cache:
+        get_time_groups(idx)
+        get_time_groups(other)
+        assert cache.invalidate(idx) == 2
+        assert len(cache) == 2
+        assert cache.invalidate() == 2
+        assert len(cache) == 0
+        cache.clear()
+        assert cache.hits == cache.misses == 0
+
+
+def test_fingerprint() -> None:
+    """Test that the fingerprint depends on the timestamps and their unit but not on the container."""
+    idx = get_minute_dataframe().index
+    assert fingerprint(idx) == fingerprint(pd.Series(idx))
+    assert fingerprint(idx) != fingerprint(idx.as_unit("us"))
+    assert fingerprint(idx) != fingerprint(idx.tz_localize("UTC"))
+    assert fingerprint(idx) != fingerprint(idx + pd.Timedelta(seconds=1))
+    assert fingerprint(pd.DatetimeIndex(["2022-01-01", None])) is None
@@ -0,0 +1,85 @@
+from datetime import timedelta
+
+import numpy as np
+import polars as pl
+import pytest
+
+from tests.data import get_aligned_dataframes
+from timegroups.export import bucket_series, pad_series, to_series_batch
+
+
+@pytest.mark.parametrize("backend", ["pandas", "polars"])
+def test_to_series_batch(backend: str) -> None:
+    """Test that all groups are copied into one contiguous array."""
+    dfs = get_aligned_dataframes()
+    kwargs = {}
+    if backend == "polars":
+        dfs = [pl.from_pandas(df, include_index=True) for df in dfs]
+        kwargs["timestamp_column"] = "time"
+    batch = to_series_batch(dfs, **kwargs)
+    assert batch.values.dtype == np.float32
+    assert batch.values.flags.c_contiguous
+    assert batch.columns == ["a", "b"]
+    assert batch.lengths.tolist() == [10, 4, 7]
+    assert batch.offsets.tolist() == [0, 10, 14]
+    assert batch.freq == timedelta(hours=1)
+    np.testing.assert_array_equal(
+        batch.starts, np.array(["2022-01-01", "2022-01-02", "2022-01-03"], dtype="datetime64[ns]")
+    )
+    np.testing.assert_array_equal(batch.series(1), [[10, -10], [11, -11], [12, -12], [13, -13]])
+    assert np.shares_memory(batch.series(1), batch.values)
+
+    batch = to_series_batch(dfs, columns=["b"], dtype=np.float64, **kwargs)
+    assert batch.values.dtype == np.float64
+    np.testing.assert_array_equal(batch.values[:, 0], -np.arange(21))
+
+
+def test_pad_series() -> None:
+    """Test left and right padding and truncation to a length."""
+    batch = to_series_batch(get_aligned_dataframes(), columns=["a"])
+    padded = pad_series(batch)
+    assert padded.values.shape == (3, 10, 1)
+    np.testing.assert_array_equal(padded.values[1, :, 0], [np.nan] * 6 + [10, 11, 12, 13])
+    assert padded.mask.tolist()[1] == [False] * 6 + [True] * 4
+    assert padded.mask.sum(axis=1).tolist() == [10, 4, 7]
+
+    padded = pad_series(batch, length=5, side="right", pad_value=0.0)
+    np.testing.assert_array_equal(padded.values[..., 0], [[5, 6, 7, 8, 9], [10, 11, 12, 13, 0], [16, 17, 18, 19, 20]])
+    assert padded.mask.sum(axis=1).tolist() == [5, 4, 5]
+
+
+def test_bucket_series() -> None:
+    """Test that series are padded to the boundary of their bucket."""
+    batch = to_series_batch(get_aligned_dataframes(), columns=["a"])
+    buckets = bucket_series(batch, [5, 8])
+    assert [bucket.indices.tolist() for bucket in buckets] == [[1], [2], [0]]
+    assert [bucket.values.shape for bucket in buckets] == [(1, 5, 1), (1, 8, 1), (1, 10, 1)]
+    np.testing.assert_array_equal(buckets[0].values[0, :, 0], [np.nan, 10, 11, 12, 13])
+
+
+def test_errors() -> None:
+    """Test invalid inputs."""
+    dfs = get_aligned_dataframes()
+    with pytest.raises(ValueError, match="floating"):
+        to_series_batch(dfs, dtype=np.int64)
+    single_rows = [df.iloc[:1] for df in dfs]
+    with pytest.raises(ValueError, match="freq"):
+        to_series_batch(single_rows)
+    assert to_series_batch(single_rows, freq=timedelta(hours=1)).freq == timedelta(hours=1)
+
+
+def test_to_darts_without_darts(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that darts is only required to build darts TimeSeries."""
+    monkeypatch.setitem(__import__("sys").modules, "darts", None)
+    batch = to_series_batch(get_aligned_dataframes())
+    with pytest.raises(ImportError, match="darts"):
+        batch.to_darts()
+
+
+def test_to_darts() -> None:
+    """Test building darts TimeSeries."""
+    pytest.importorskip("darts")
+    batch = to_series_batch(get_aligned_dataframes())
+    series = batch.to_darts()
+    assert [len(s) for s in series] == [10, 4, 7]
+    np.testing.assert_array_equal(series[0].values(), batch.series(0))
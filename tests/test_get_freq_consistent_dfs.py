@@ -1,5 +1,8 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from datetime import timedelta
 
+import numpy as np
 import pandas as pd
 import polars as pl
 import pytest
@@ -54,3 +57,169 @@ def test_get_freq_consistent_dfs_polars(
         assert df.get_column(timestamp_col)[0] == tg.start
         assert df.get_column(timestamp_col)[-1] == tg.end
         assert df.null_count().sum_horizontal()[0] == 0
+
+
+@pytest.mark.parametrize(
+    "df, timestamp_col, time_groups",
+    [
+        TestDataframeRecord(
+            input_df=pl.from_pandas(df, include_index=True).lazy(),
+            input_timestamp_col=timestamp_col,
+            expected_time_groups=time_groups,
+        )
+        for df, timestamp_col, time_groups in test_dataframes
+    ],
+)
+def test_get_freq_consistent_dfs_polars_lazy(
+    df: pl.LazyFrame,
+    timestamp_col: str,
+    time_groups: list[TimeGroup],
+) -> None:
+    """Test get_freq_consistent_dfs method on a LazyFrame."""
+    from timegroups.df_grouping import get_freq_consistent_dfs
+
+    dfs = get_freq_consistent_dfs(df, freq=timedelta(days=1), timestamp_column=timestamp_col)
+    expected_dfs = get_freq_consistent_dfs(df.collect(), freq=timedelta(days=1), timestamp_column=timestamp_col)
+    assert len(dfs) == len(time_groups)
+    for expected_df, df in zip(expected_dfs, dfs, strict=True):
+        assert df.equals(expected_df)
+
+
+def test_get_freq_consistent_lazyframe() -> None:
+    """Test get_freq_consistent_lazyframe method adds the time group column."""
+    from timegroups.df_grouping import get_freq_consistent_lazyframe
+
+    df, timestamp_col, time_groups = test_dataframes[3]
+    lf = get_freq_consistent_lazyframe(
+        pl.from_pandas(df, include_index=True).lazy(), freq=timedelta(days=1), timestamp_column=timestamp_col
+    )
+    result = lf.collect(engine="streaming")
+    assert result.columns == [timestamp_col, "value", "time_group"]
+    assert result.get_column("time_group").to_list() == [0] * 5 + [1] + [2] * 5
+    assert result.null_count().sum_horizontal()[0] == 0
+
+
+@pytest.mark.parametrize(
+    "df, timestamp_col, time_groups",
+    test_dataframes,
+)
+@pytest.mark.parametrize("backend", ["pandas", "polars"])
+@pytest.mark.parametrize("unit", ["ns", "s"])
+def test_get_freq_consistent_dfs_batched(
+    df: pd.DataFrame,
+    timestamp_col: str,
+    time_groups: list[TimeGroup],
+    backend: str,
+    unit: str,
+) -> None:
+    """Test get_freq_consistent_dfs method in batched mode matches the per-group mode."""
+    from timegroups.df_grouping import get_freq_consistent_dfs
+
+    df = df.astype(float).set_axis(df.index.as_unit(unit))
+    df.iloc[1::4] = float("nan")
+    if backend == "polars":
+        df = pl.from_pandas(df, include_index=True)
+    expected_dfs = get_freq_consistent_dfs(
+        df.clone() if backend == "polars" else df.copy(), freq=timedelta(days=1), timestamp_column=timestamp_col
+    )
+    dfs = get_freq_consistent_dfs(df, freq=timedelta(days=1), timestamp_column=timestamp_col, batched=True)
+    assert len(dfs) == len(time_groups)
+    for expected_df, df in zip(expected_dfs, dfs, strict=True):
+        if backend == "polars":
+            assert df.equals(expected_df)
+        else:
+            pd.testing.assert_frame_equal(df, expected_df, check_freq=True)
+            assert df.index.unit == unit
+
+
+@pytest.mark.parametrize("backend", ["pandas", "polars"])
+def test_get_freq_consistent_dfs_batched_unsorted_duplicates(backend: str) -> None:
+    """Test that batched mode keeps the same duplicate rows of unsorted timestamps as the per-group mode."""
+    from timegroups.df_grouping import get_freq_consistent_dfs
+
+    minutes = (3 * np.arange(1000)[:, None] + np.array([0, 2, 1, 1, 3, 1])).ravel()
+    idx = pd.DatetimeIndex(np.datetime64("2022-01-01", "ns") + minutes.astype("timedelta64[m]"), name="time")
+    df = pd.DataFrame({"value": np.arange(len(idx), dtype=float)}, index=idx)
+    if backend == "polars":
+        df = pl.from_pandas(df, include_index=True)
+    kwargs = {"freq": timedelta(minutes=1), "timestamp_column": "time"}
+    expected_dfs = get_freq_consistent_dfs(df, **kwargs)
+    dfs = get_freq_consistent_dfs(df, batched=True, **kwargs)
+    assert len(dfs) == len(expected_dfs) == 1
+    if backend == "polars":
+        assert dfs[0].equals(expected_dfs[0])
+    else:
+        pd.testing.assert_frame_equal(dfs[0], expected_dfs[0], check_freq=True)
+
+
+@pytest.mark.parametrize("backend", ["pandas", "polars"])
+@pytest.mark.parametrize("use_process_pool", [False, True])
+def test_get_freq_consistent_dfs_executor(backend: str, use_process_pool: bool) -> None:
+    """Test get_freq_consistent_dfs method with an executor matches the sequential mode."""
+    from timegroups.df_grouping import get_freq_consistent_dfs
+
+    record = test_dataframes[0]
+    df = record.input_df.astype(float)
+    df.iloc[1::4] = float("nan")
+    if backend == "polars":
+        df = pl.from_pandas(df, include_index=True)
+    kwargs = {"freq": timedelta(days=1), "timestamp_column": record.input_timestamp_col}
+    expected_dfs = get_freq_consistent_dfs(df, **kwargs)
+    if use_process_pool:
+        with ProcessPoolExecutor(max_workers=2, mp_context=multiprocessing.get_context("spawn")) as executor:
+            dfs = get_freq_consistent_dfs(df, executor=executor, **kwargs)
+    else:
+        dfs = get_freq_consistent_dfs(df, n_jobs=2, **kwargs)
+    assert len(dfs) == len(expected_dfs) == len(record.expected_time_groups)
+    for expected_df, df in zip(expected_dfs, dfs, strict=True):
+        if backend == "polars":
+            assert df.equals(expected_df)
+        else:
+            pd.testing.assert_frame_equal(df, expected_df, check_freq=True)
+
+
+def test_get_freq_consistent_dfs_fork_pool_polars() -> None:
+    """Test that a forking process pool is rejected for polars DataFrames instead of deadlocking."""
+    from timegroups.df_grouping import get_freq_consistent_dfs
+
+    record = test_dataframes[0]
+    df = pl.from_pandas(record.input_df.astype(float), include_index=True)
+    with (
+        ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("fork")) as executor,
+        pytest.raises(ValueError, match="spawn"),
+    ):
+        get_freq_consistent_dfs(
+            df, freq=timedelta(days=1), timestamp_column=record.input_timestamp_col, executor=executor
+        )
+
+
+@pytest.mark.parametrize("backend", ["pandas", "polars"])
+@pytest.mark.parametrize("n_rows", [0, 1])
+def test_get_freq_consistent_dfs_too_short_to_guess_freq(backend: str, n_rows: int) -> None:
+    """Test that frames with fewer than two rows are split without guessing the frequency."""
+    from timegroups.df_grouping import get_freq_consistent_dfs
+
+    df = pd.DataFrame({"value": [1.0]}, index=pd.DatetimeIndex(["2022-01-01"], name="time")).iloc[:n_rows]
+    kwargs = {}
+    if backend == "polars":
+        df = pl.from_pandas(df, include_index=True)
+        kwargs = {"timestamp_column": "time"}
+    dfs = get_freq_consistent_dfs(df, **kwargs)
+    assert len(dfs) == n_rows
+    if n_rows:
+        assert dfs[0].equals(df)
+        if backend == "pandas":
+            assert dfs[0].index.freq is None
+    assert get_freq_consistent_dfs(df, min_length=2, **kwargs) == []
+    assert get_freq_consistent_dfs(df, min_duration=timedelta(hours=1), **kwargs) == []
+    assert len(get_freq_consistent_dfs(df, max_groups=1, **kwargs)) == n_rows
+
+
+def test_get_freq_consistent_dfs_single_row_index_freq() -> None:
+    """Test that a single row is aligned to the freq of its pandas index instead of guessing one."""
+    from timegroups.df_grouping import get_freq_consistent_dfs
+
+    df = pd.DataFrame({"value": [1.0]}, index=pd.date_range("2022-01-01", periods=1, freq="h"))
+    dfs = get_freq_consistent_dfs(df)
+    assert len(dfs) == 1
+    assert dfs[0].index.freq == pd.Timedelta(hours=1)
@@ -0,0 +1,44 @@
+import numpy as np
+import pandas as pd
+import polars as pl
+import pytest
+
+from tests.data import get_time_group_array
+from timegroups.group_index import TimeGroupIndex
+from timegroups.time_group import TimeGroup
+
+
+def test_get_group_ids() -> None:
+    """Test point lookups against a loop over the time groups."""
+    index = TimeGroupIndex(get_time_group_array())
+    timestamps = pd.date_range("2021-12-31", "2022-01-18", freq="6h")
+    expected = [
+        next((i for i, tg in enumerate(index.tgs) if tg.start <= timestamp <= tg.end), -1) for timestamp in timestamps
+    ]
+    np.testing.assert_array_equal(index.get_group_ids(timestamps), expected)
+    np.testing.assert_array_equal(index.get_group_ids(pl.Series(timestamps)), expected)
+    np.testing.assert_array_equal(index.get_group_ids(timestamps.to_numpy()), expected)
+    assert index.get_group_ids(pd.Timestamp("2022-01-08")) == 1
+    np.testing.assert_array_equal(index.get_group_ids([None, pd.Timestamp("2022-01-12")]), [-1, 2])
+
+
+def test_get_group_ids_unsorted() -> None:
+    """Test ids refer to the time groups the index was built from."""
+    tgs = list(TimeGroupIndex(get_time_group_array()).tgs)[::-1]
+    index = TimeGroupIndex(tgs)
+    np.testing.assert_array_equal(index.get_group_ids(pd.DatetimeIndex(["2022-01-01", "2022-01-16"])), [2, 0])
+    with pytest.raises(ValueError, match="overlap"):
+        TimeGroupIndex([*tgs, TimeGroup(pd.Timestamp("2022-01-02"), pd.Timestamp("2022-01-09"))])
+    assert TimeGroupIndex([]).get_group_ids(pd.DatetimeIndex(["2022-01-01"])).tolist() == [-1]
+
+
+def test_get_overlapping() -> None:
+    """Test range queries."""
+    index = TimeGroupIndex(get_time_group_array())
+    begins, stops = index.get_overlapping(
+        pd.DatetimeIndex(["2022-01-04", "2022-01-06", "2022-01-06", "2022-01-20"]),
+        pd.DatetimeIndex(["2022-01-12", "2022-01-07", "2022-01-08", "2022-01-21"]),
+    )
+    np.testing.assert_array_equal(begins, [0, 1, 1, 3])
+    np.testing.assert_array_equal(stops, [3, 1, 2, 3])
+    assert index.overlapping(pd.Timestamp("2022-01-05"), pd.Timestamp("2022-01-08")) == index.tgs[:2]
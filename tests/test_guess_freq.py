@@ -1,6 +1,7 @@
 from datetime import timedelta
 from typing import NamedTuple
 
+import numpy as np
 import pandas as pd
 import polars as pl
 import pytest
@@ -53,3 +54,56 @@ def test_guess_freq(
     from timegroups.df_grouping import guess_freq
 
     assert guess_freq(idx) == dt
+
+
+@pytest.mark.parametrize(
+    "idx, dt",
+    [
+        TestDataRecord(
+            input_data=pl.Series(pd.date_range("2022-01-01", periods=10, freq="min")).dt.cast_time_unit("ms"),
+            expected_outcome=timedelta(minutes=1),
+        ),
+        TestDataRecord(
+            input_data=pd.Series(pd.date_range("2022-01-01", periods=10, freq="s", tz="Europe/Berlin")),
+            expected_outcome=timedelta(seconds=1),
+        ),
+        TestDataRecord(
+            input_data=pd.DatetimeIndex(["2022-01-01", "2022-01-03", "2022-01-04", "2022-01-06", "2022-01-07"]),
+            expected_outcome=timedelta(days=2),
+        ),
+        TestDataRecord(
+            input_data=pd.date_range("2022-01-01", periods=10, freq="h").values.astype("datetime64[us]"),
+            expected_outcome=timedelta(hours=1),
+        ),
+    ],
+)
+def test_guess_freq_int64_engine(
+    idx: IndexSeries,
+    dt: timedelta,
+) -> None:
+    """Test guess_freq on other time units, tz-aware series, ties and the generic fallback."""
+    from timegroups.df_grouping import guess_freq
+
+    assert guess_freq(idx) == dt
+
+
+def test_estimate_freq_sampled() -> None:
+    """Test estimate_freq only samples when the sampled mode is unambiguous."""
+    from timegroups.df_grouping import estimate_freq
+
+    idx = pd.date_range("2022-01-01", periods=100_000, freq="s")
+    idx = idx[(idx.minute % 10) != 0]
+    estimate = estimate_freq(idx, max_points=1_000)
+    assert estimate.freq == timedelta(seconds=1)
+    assert estimate.sampled
+    assert estimate.n_steps < 1_000
+    assert estimate.support > 0.9
+
+    estimate = estimate_freq(pl.from_pandas(idx), max_points=1_000, seed=42)
+    assert estimate.freq == timedelta(seconds=1)
+    assert estimate.sampled
+
+    alternating = pd.DatetimeIndex(pd.Timestamp("2022-01-01") + pd.to_timedelta(np.cumsum([1, 2] * 5_000), unit="s"))
+    estimate = estimate_freq(alternating, max_points=100, min_support=0.9)
+    assert not estimate.sampled
+    assert estimate.n_steps == len(alternating) - 1
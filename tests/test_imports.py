@@ -0,0 +1,57 @@
+import subprocess
+import sys
+
+
+def run_python(code: str) -> str:
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return result.stdout.strip()
+
+
+def test_import_loads_no_backend() -> None:
+    """Test importing timegroups does not import pandas, polars or pyarrow."""
+    backends = "{'pandas', 'polars', 'pyarrow'}"
+    code = f"import sys, timegroups; print(sorted({{m.split('.')[0] for m in sys.modules}} & {backends}))"
+    assert run_python(code) == "[]"
+
+
+def test_polars_workflow_loads_no_pandas() -> None:
+    """Test grouping and aligning polars data does not import pandas."""
+    code = """
+import sys
+import polars as pl
+import timegroups
+
+times = pl.datetime_range(pl.datetime(2022, 1, 1), pl.datetime(2022, 1, 2), "1h", eager=True)
+df = pl.DataFrame({"time": times, "value": range(len(times))}).filter(pl.col("value") != 5)
+tgs = timegroups.get_time_groups(df.get_column("time"))
+list(tgs)
+timegroups.guess_freq(df.get_column("time"))
+timegroups.split_df_by_tgs(df, tgs, timestamp_column="time")
+timegroups.get_freq_consistent_dfs(df, timestamp_column="time")
+timegroups.get_freq_consistent_dfs(df, timestamp_column="time", batched=True)
+print("pandas" in sys.modules)
+"""
+    assert run_python(code) == "False"
+
+
+def test_import_defers_optional_modules() -> None:
+    """Test importing timegroups imports the optional modules (and asyncio) only on first access."""
+    optional = (
+        "{'asyncio', 'timegroups.aio', 'timegroups.export', 'timegroups.group_index', 'timegroups.ipc', "
+        "'timegroups.parquet', 'timegroups.set_ops', 'timegroups.tracker', 'timegroups.windows'}"
+    )
+    code = f"""
+import sys, timegroups
+print(sorted(set(sys.modules) & {optional}))
+timegroups.agroup_frames
+print(sorted(set(sys.modules) & {optional}))
+"""
+    assert run_python(code).splitlines() == ["[]", "['asyncio', 'timegroups.aio']"]
+
+
+def test_all_names_resolve() -> None:
+    """Test every name in `__all__` can be imported from timegroups."""
+    import timegroups
+
+    assert all(hasattr(timegroups, name) for name in timegroups.__all__)
+    assert set(timegroups.__all__) <= set(dir(timegroups))
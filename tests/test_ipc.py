@@ -0,0 +1,68 @@
+from datetime import timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pyarrow as pa
+import pytest
+
+from tests.data import get_minute_dataframe
+from timegroups.df_grouping import get_freq_consistent_dfs
+from timegroups.ipc import TimeGroupFile, write_time_groups_ipc
+
+
+@pytest.mark.parametrize("backend", ["pandas", "polars"])
+def test_write_and_read(tmp_path: Path, backend: str) -> None:
+    """Test that every group read from the file equals the written group."""
+    df = get_minute_dataframe()
+    kwargs = {}
+    if backend == "polars":
+        df = pl.from_pandas(df, include_index=True)
+        kwargs["timestamp_column"] = "time"
+    dfs = get_freq_consistent_dfs(df, freq=timedelta(minutes=1), **kwargs)
+    path = tmp_path / "groups.arrow"
+    write_time_groups_ipc(dfs, path, **kwargs)
+
+    with TimeGroupFile(path) as file:
+        assert len(file) == len(dfs) == 2
+        assert file.timestamp_column == "time"
+        assert file.tgs.lengths.tolist() == [4, 2]
+        timestamps = [df.index if backend == "pandas" else df.get_column("time") for df in dfs]
+        assert [(tg.start, tg.end) for tg in file.tgs] == [(ts[0], ts[-1]) for ts in timestamps]
+        for read_df, expected_df in zip(file, dfs, strict=True):
+            if backend == "polars":
+                assert read_df.equals(expected_df)
+            else:
+                pd.testing.assert_frame_equal(read_df, expected_df, check_freq=False)
+
+
+def test_zero_copy(tmp_path: Path) -> None:
+    """Test that groups are slices of the memory-mapped file."""
+    rng = np.random.default_rng(0)
+    idx = pd.date_range("2022-01-01", periods=200_000, freq="min", name="time")
+    df = pd.DataFrame({"value": rng.normal(size=len(idx))}, index=idx)
+    path = tmp_path / "groups.arrow"
+    write_time_groups_ipc([df.iloc[:100_000], df.iloc[100_000:]], path)
+
+    allocated = pa.total_allocated_bytes()
+    with TimeGroupFile(path, backend="pyarrow") as file:
+        groups = list(file)
+        polars_group = TimeGroupFile(path, backend="polars")[1]
+        assert pa.total_allocated_bytes() - allocated < 100_000
+    assert [group.num_rows for group in groups] == [100_000, 100_000]
+    assert polars_group.get_column("value").to_numpy()[0] == df["value"].iloc[100_000]
+
+
+def test_errors(tmp_path: Path) -> None:
+    """Test invalid inputs."""
+    with pytest.raises(ValueError, match="empty"):
+        write_time_groups_ipc([], tmp_path / "groups.arrow")
+    with pytest.raises(ValueError, match="timestamp_column"):
+        write_time_groups_ipc([pl.from_pandas(get_minute_dataframe(), include_index=True)], tmp_path / "groups.arrow")
+    path = tmp_path / "plain.arrow"
+    table = pa.table({"value": [1.0]})
+    with pa.OSFile(str(path), "wb") as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+    with pytest.raises(ValueError, match="write_time_groups_ipc"):
+        TimeGroupFile(path)
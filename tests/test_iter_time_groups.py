@@ -0,0 +1,43 @@
+from datetime import timedelta
+
+import pandas as pd
+import polars as pl
+import pytest
+
+from tests.data import get_gappy_dataframe
+from timegroups.df_grouping import get_freq_consistent_dfs, get_time_groups, iter_time_groups
+
+
+@pytest.mark.parametrize("chunk_size", [1, 10, 97, 5_000])
+def test_iter_time_groups_pandas(chunk_size: int) -> None:
+    """Test iter_time_groups matches get_time_groups and get_freq_consistent_dfs on the whole DataFrame."""
+    df = get_gappy_dataframe(1_000, gap_probability=0.03, gap=7, nan_probability=0.1)
+    chunks = (df.iloc[begin : begin + chunk_size] for begin in range(0, len(df), chunk_size))
+    assert list(iter_time_groups(chunks, freq=timedelta(hours=1))) == get_time_groups(df.index)
+
+    chunks = (df.iloc[begin : begin + chunk_size] for begin in range(0, len(df), chunk_size))
+    expected_dfs = get_freq_consistent_dfs(df, freq=timedelta(hours=1))
+    results = list(iter_time_groups(chunks, freq=timedelta(hours=1), aligned=True))
+    assert len(results) == len(expected_dfs)
+    for (tg, aligned_df), expected_df in zip(results, expected_dfs, strict=True):
+        assert tg.start == expected_df.index[0]
+        pd.testing.assert_frame_equal(aligned_df, expected_df, check_freq=True)
+
+
+def test_iter_time_groups_polars() -> None:
+    """Test iter_time_groups with polars chunks."""
+    df = pl.from_pandas(
+        get_gappy_dataframe(1_000, gap_probability=0.03, gap=7, nan_probability=0.1), include_index=True
+    )
+    expected_dfs = get_freq_consistent_dfs(df, freq=timedelta(hours=1), timestamp_column="time")
+    results = list(iter_time_groups(df.iter_slices(64), freq=timedelta(hours=1), timestamp_column="time", aligned=True))
+    assert [tg for tg, _ in results] == get_time_groups(df.get_column("time"))
+    for (_, aligned_df), expected_df in zip(results, expected_dfs, strict=True):
+        assert aligned_df.equals(expected_df)
+
+
+def test_iter_time_groups_unordered() -> None:
+    """Test iter_time_groups raises on chunks out of chronological order."""
+    df = get_gappy_dataframe(1_000, gap_probability=0.03, gap=7, nan_probability=0.1)
+    with pytest.raises(ValueError, match="chronological"):
+        list(iter_time_groups([df.iloc[100:], df.iloc[:100]], freq=timedelta(hours=1)))
@@ -0,0 +1,87 @@
+from datetime import timedelta
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pyarrow.parquet as pq
+import pytest
+
+from tests.data import get_gappy_dataframe
+from timegroups.df_grouping import get_time_groups, split_df_by_tgs
+from timegroups.parquet import read_parquet_time_groups
+
+
+def write_test_parquet(path: Path) -> pl.DataFrame:
+    df = pl.from_pandas(get_gappy_dataframe(3_000, gap_probability=0.01, gap=30), include_index=True)
+    df = df.with_columns(other=pl.int_range(pl.len()))
+    df.write_parquet(path, row_group_size=100)
+    return df
+
+
+@pytest.mark.parametrize("backend", ["pandas", "polars"])
+def test_read_parquet_time_groups(tmp_path: Path, backend: str) -> None:
+    """Test read_parquet_time_groups reads the rows of the selected groups."""
+    path = tmp_path / "data.parquet"
+    df = write_test_parquet(path)
+    all_tgs = get_time_groups(df.get_column("time"))
+    expected_dfs = split_df_by_tgs(df, all_tgs, timestamp_column="time")
+
+    def select(tgs):  # noqa: ANN001, ANN202
+        return tgs.duration >= np.timedelta64(7, "D")
+
+    tgs, dfs = read_parquet_time_groups(path, "time", select=select, columns=["value"], backend=backend)
+    mask = select(all_tgs)
+    assert 0 < len(tgs) < len(all_tgs)
+    assert tgs == all_tgs.filter(mask)
+    for read_df, expected_df in zip(dfs, [expected_dfs[i] for i in np.flatnonzero(mask)], strict=True):
+        expected_df = expected_df.select("time", "value")
+        if backend == "polars":
+            assert read_df.equals(expected_df)
+        else:
+            pd.testing.assert_frame_equal(read_df, expected_df.to_pandas().set_index("time"))
+
+
+def test_read_parquet_time_groups_row_groups(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test read_parquet_time_groups only reads the row groups covering the selected groups."""
+    path = tmp_path / "data.parquet"
+    write_test_parquet(path)
+    read_row_groups = pq.ParquetFile.read_row_groups
+    requested: list[list[int]] = []
+
+    def spy(self: pq.ParquetFile, row_groups: list[int], **kwargs: object) -> object:
+        requested.append(row_groups)
+        return read_row_groups(self, row_groups, **kwargs)
+
+    monkeypatch.setattr(pq.ParquetFile, "read_row_groups", spy)
+    tgs, dfs = read_parquet_time_groups(
+        path, "time", select=lambda tgs: np.arange(len(tgs)) == 1, freq=timedelta(hours=1)
+    )
+    assert len(dfs) == 1
+    assert len(dfs[0]) == tgs.lengths[0]
+    first, last = tgs.offsets[0] // 100, (tgs.offsets[0] + tgs.lengths[0] - 1) // 100
+    assert requested == [list(range(first, last + 1))]
+
+
+@pytest.mark.parametrize("as_directory", [False, True])
+def test_read_parquet_time_groups_multiple_files(tmp_path: Path, as_directory: bool) -> None:
+    """Test read_parquet_time_groups on a dataset split into several files matches a single file."""
+    df = write_test_parquet(tmp_path / "data.parquet")
+    dataset = tmp_path / "dataset"
+    dataset.mkdir()
+    paths = [dataset / f"part-{i}.parquet" for i in range(3)]
+    for i, path in enumerate(paths):
+        df.slice(i * 1_050, 1_050).write_parquet(path, row_group_size=100)
+
+    def select(tgs):  # noqa: ANN001, ANN202
+        return tgs.duration >= np.timedelta64(7, "D")
+
+    expected_tgs, expected_dfs = read_parquet_time_groups(tmp_path / "data.parquet", "time", select=select)
+    tgs, dfs = read_parquet_time_groups(dataset if as_directory else paths, "time", select=select)
+    assert tgs == expected_tgs
+    assert len(dfs) == len(expected_dfs) > 0
+    for read_df, expected_df in zip(dfs, expected_dfs, strict=True):
+        assert read_df.equals(expected_df)
+    (tmp_path / "empty").mkdir()
+    with pytest.raises(ValueError, match="parquet files"):
+        read_parquet_time_groups(tmp_path / "empty", "time")
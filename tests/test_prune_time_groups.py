@@ -0,0 +1,83 @@
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pytest
+
+from tests.data import get_gappy_dataframe
+from timegroups.df_grouping import get_freq_consistent_dfs, get_time_groups, split_df_by_tgs
+from timegroups.time_group import TimeGroupArray
+
+
+def get_test_df() -> pd.DataFrame:
+    return get_gappy_dataframe(500, gap_probability=0.08, gap=5, skip_probability=0.1)
+
+
+def test_prune() -> None:
+    """Test TimeGroupArray.prune thresholds."""
+    tgs = get_time_groups(get_test_df().index)
+    grid_lengths = (tgs.ends - tgs.starts) // 3_600_000_000_000 + 1
+
+    pruned = tgs.prune(min_length=10, freq=timedelta(hours=1))
+    assert pruned == tgs.filter(grid_lengths >= 10)
+    assert tgs.prune(min_length=10) == tgs.filter(tgs.lengths >= 10)
+    assert tgs.prune(min_duration=timedelta(hours=9)) == pruned
+
+    longest = tgs.prune(max_groups=3)
+    assert len(longest) == 3
+    assert np.all(np.diff(longest.starts) > 0)
+    assert longest.duration.min() >= np.sort(tgs.duration)[-3]
+
+    with pytest.raises(ValueError, match="min_length"):
+        TimeGroupArray(tgs.starts, tgs.ends).prune(min_length=2)
+
+
+def test_get_time_groups_prune() -> None:
+    """Test pruning in get_time_groups and split_df_by_tgs."""
+    df = get_test_df()
+    tgs = get_time_groups(df.index)
+    pruned = get_time_groups(df.index, min_length=10, max_groups=5)
+    assert pruned == tgs.prune(min_length=10, max_groups=5, freq=timedelta(hours=1))
+
+    dfs = split_df_by_tgs(df, tgs, min_duration=timedelta(hours=9), max_groups=5)
+    assert [sub_df.index[0] for sub_df in dfs] == [tg.start for tg in pruned]
+
+    by_entity = get_time_groups(df.index, by=np.arange(len(df)) % 2, min_length=3)
+    for entity_tgs in by_entity.values():
+        assert np.all(entity_tgs.duration >= np.timedelta64(4, "h"))
+
+
+@pytest.mark.parametrize("mode", ["pandas", "pandas-batched", "polars", "polars-batched", "polars-lazy"])
+def test_get_freq_consistent_dfs_prune(mode: str) -> None:
+    """Test pruning in get_freq_consistent_dfs drops the same groups as after aligning."""
+    df = get_test_df()
+    kwargs = {"freq": timedelta(hours=1), "batched": mode.endswith("batched")}
+    if mode.startswith("polars"):
+        df = pl.from_pandas(df, include_index=True)
+        kwargs["timestamp_column"] = "time"
+    if mode == "polars-lazy":
+        df = df.lazy()
+    expected_dfs = [sub_df for sub_df in get_freq_consistent_dfs(df, **kwargs) if len(sub_df) >= 12]
+    longest = sorted(sorted(range(len(expected_dfs)), key=lambda i: len(expected_dfs[i]), reverse=True)[:4])
+    expected_dfs = [expected_dfs[i] for i in longest]
+    dfs = get_freq_consistent_dfs(df, min_length=12, max_groups=4, **kwargs)
+    assert len(dfs) == len(expected_dfs) == 4
+    for sub_df, expected_df in zip(dfs, expected_dfs, strict=True):
+        if mode.startswith("polars"):
+            assert sub_df.equals(expected_df)
+        else:
+            pd.testing.assert_frame_equal(sub_df, expected_df)
+
+
+@pytest.mark.parametrize("mode", ["pandas", "pandas-batched", "polars", "polars-batched", "polars-lazy"])
+def test_get_freq_consistent_dfs_prune_all(mode: str) -> None:
+    """Test pruning every group in get_freq_consistent_dfs returns no DataFrames."""
+    df = get_test_df().iloc[:4]
+    kwargs = {"freq": timedelta(hours=1), "batched": mode.endswith("batched")}
+    if mode.startswith("polars"):
+        df = pl.from_pandas(df, include_index=True)
+        kwargs["timestamp_column"] = "time"
+    if mode == "polars-lazy":
+        df = df.lazy()
+    assert get_freq_consistent_dfs(df, min_length=10, **kwargs) == []
@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+
+from timegroups.df_grouping import get_time_groups, split_df_by_tgs
+from timegroups.set_ops import (
+    coverage_time_groups,
+    difference_time_groups,
+    intersect_time_groups,
+    union_time_groups,
+)
+from timegroups.time_group import TimeGroup, TimeGroupArray
+
+
+def tgs_from_strings(*bounds: tuple[str, str]) -> TimeGroupArray:
+    return TimeGroupArray.from_time_groups([TimeGroup(pd.Timestamp(start), pd.Timestamp(end)) for start, end in bounds])
+
+
+def covered_minutes(tgs: TimeGroupArray, minutes: pd.DatetimeIndex) -> np.ndarray:
+    return np.array([any(tg.start <= minute <= tg.end for tg in tgs) for minute in minutes])
+
+
+def get_test_collections() -> list[TimeGroupArray]:
+    rng = np.random.default_rng(0)
+    collections = []
+    for _ in range(4):
+        minutes = pd.date_range("2022-01-01", periods=600, freq="min")
+        collections.append(get_time_groups(minutes[rng.random(len(minutes)) < 0.8]))
+    return collections
+
+
+def test_set_operations() -> None:
+    """Test set operations against a brute force check on a minute grid."""
+    collections = get_test_collections()
+    minutes = pd.date_range("2022-01-01", periods=600, freq="min")
+    covered = np.array([covered_minutes(tgs, minutes) for tgs in collections])
+
+    for result, expected in [
+        (intersect_time_groups(*collections), covered.all(axis=0)),
+        (union_time_groups(*collections), covered.any(axis=0)),
+        (difference_time_groups(collections[0], *collections[1:]), covered[0] & ~covered[1:].any(axis=0)),
+        (coverage_time_groups(collections, 3), covered.sum(axis=0) >= 3),
+    ]:
+        np.testing.assert_array_equal(covered_minutes(result, minutes), expected)
+        assert np.all(result.starts[1:] > result.ends[:-1])
+
+
+def test_set_operations_bounds() -> None:
+    """Test closed bounds are kept exactly."""
+    a = tgs_from_strings(("2022-01-01", "2022-01-05"), ("2022-01-08", "2022-01-10"))
+    b = tgs_from_strings(("2022-01-05", "2022-01-08"))
+    assert intersect_time_groups(a, b) == tgs_from_strings(("2022-01-05", "2022-01-05"), ("2022-01-08", "2022-01-08"))
+    assert union_time_groups(a, b) == tgs_from_strings(("2022-01-01", "2022-01-10"))
+    difference = difference_time_groups(a, b)
+    assert difference[0] == TimeGroup(pd.Timestamp("2022-01-01"), pd.Timestamp("2022-01-05") - pd.Timedelta(1))
+    assert difference[1].start == pd.Timestamp("2022-01-08") + pd.Timedelta(1)
+    assert len(intersect_time_groups(a, TimeGroupArray([], []))) == 0
+
+
+def test_set_operations_split() -> None:
+    """Test the result of a set operation can be used to split a DataFrame."""
+    df = pd.DataFrame({"value": range(10)}, index=pd.date_range("2022-01-01", periods=10, freq="D"))
+    tgs = intersect_time_groups(get_time_groups(df.index), tgs_from_strings(("2022-01-03", "2022-01-05")))
+    (sub_df,) = split_df_by_tgs(df, tgs)
+    assert sub_df["value"].tolist() == [2, 3, 4]
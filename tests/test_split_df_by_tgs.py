@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import polars as pl
 import pytest
@@ -49,3 +50,42 @@ def test_split_df_by_tgs_polars(
     for i, tg in enumerate(time_groups):
         assert dfs[i].get_column(timestamp_col)[0] == tg.start
         assert dfs[i].get_column(timestamp_col)[-1] == tg.end
+
+
+def test_get_time_groups_offsets() -> None:
+    """Test get_time_groups exposes the row offsets and lengths of the groups."""
+    from timegroups.df_grouping import get_time_groups
+
+    df, _, _ = test_dataframes[3]
+    tgs = get_time_groups(df.index)
+    assert tgs.offsets is not None
+    assert tgs.lengths is not None
+    assert tgs.offsets.tolist() == [0, 5, 6]
+    assert tgs.lengths.tolist() == [5, 1, 5]
+
+
+@pytest.mark.parametrize("as_list", [False, True])
+def test_split_df_by_tgs_slices(as_list: bool) -> None:
+    """Test split_df_by_tgs cuts views by row offsets or by binary search on plain TimeGroups."""
+    from timegroups.df_grouping import get_time_groups, split_df_by_tgs
+
+    df, timestamp_col, _ = test_dataframes[3]
+    tgs = get_time_groups(df.index)
+    dfs = split_df_by_tgs(df, list(tgs) if as_list else tgs)
+    assert [len(sub_df) for sub_df in dfs] == [5, 1, 5]
+    assert all(np.shares_memory(sub_df["value"].to_numpy(), df["value"].to_numpy()) for sub_df in dfs)
+
+    df_pl = pl.from_pandas(df, include_index=True)
+    dfs_pl = split_df_by_tgs(df_pl, list(tgs) if as_list else tgs, timestamp_col)
+    assert [sub_df.get_column("value").to_list() for sub_df in dfs_pl] == [sub_df["value"].tolist() for sub_df in dfs]
+
+
+def test_split_df_by_tgs_unsorted() -> None:
+    """Test split_df_by_tgs falls back to filtering on unsorted timestamps."""
+    from timegroups.df_grouping import get_time_groups, split_df_by_tgs
+
+    df, timestamp_col, _ = test_dataframes[3]
+    tgs = get_time_groups(df.index)
+    df_pl = pl.from_pandas(df, include_index=True).reverse()
+    dfs = split_df_by_tgs(df_pl, tgs, timestamp_col)
+    assert [sub_df.get_column("value").to_list() for sub_df in dfs] == [[5, 4, 3, 2, 1], [6], [11, 10, 9, 8, 7]]
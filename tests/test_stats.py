@@ -0,0 +1,73 @@
+from datetime import timedelta
+
+import pandas as pd
+import polars as pl
+import pytest
+
+from tests.data import get_minute_dataframe
+from timegroups.df_grouping import get_freq_consistent_dfs
+from timegroups.stats import collect_stats, get_stats, stage
+
+
+def get_test_df() -> pd.DataFrame:
+    """Get the minute DataFrame with a row that becomes a duplicate once rounded."""
+    duplicate = pd.DataFrame({"value": [-1.0]}, index=pd.DatetimeIndex(["2022-01-01 00:01:10"], name="time"))
+    return pd.concat([get_minute_dataframe(), duplicate]).sort_index()
+
+
+@pytest.mark.parametrize("backend", ["pandas", "polars"])
+@pytest.mark.parametrize("n_jobs", [None, 2])
+def test_collect_stats(backend: str, n_jobs: int | None) -> None:
+    """Test stage timings and counts of get_freq_consistent_dfs."""
+    df = get_test_df()
+    kwargs = {}
+    if backend == "polars":
+        df = pl.from_pandas(df, include_index=True)
+        kwargs["timestamp_column"] = "time"
+    with collect_stats() as stats:
+        dfs = get_freq_consistent_dfs(df, n_jobs=n_jobs, **kwargs)
+    assert get_stats() is None
+    assert set(stats.stages) == {
+        "guess_freq",
+        "get_time_groups",
+        "split",
+        "align.round",
+        "align.deduplicate",
+        "align.upsample",
+        "align",
+        "interpolate",
+    }
+    assert stats.n_groups == len(dfs) == 2
+    assert stats.duplicates_dropped == 1
+    assert stats.rows_inserted == 1
+    assert stats.stages["get_time_groups"].rows_out == 2
+    assert stats.stages["align"].calls == 2
+    assert stats.stages["align"].rows_in == 6
+    assert stats.stages["interpolate"].rows_out == sum(len(sub_df) for sub_df in dfs) == 6
+    assert stats.total_seconds > 0
+    assert stats.to_dict()["stages"]["split"]["rows_out"] == 6
+
+
+def test_collect_stats_batched() -> None:
+    """Test counts of the batched pandas path match the per-group path."""
+    with collect_stats() as stats:
+        get_freq_consistent_dfs(get_test_df(), freq=timedelta(minutes=1), batched=True)
+    assert "batched" in stats.stages
+    assert (stats.n_groups, stats.duplicates_dropped, stats.rows_inserted) == (2, 1, 1)
+
+
+def test_stats_disabled() -> None:
+    """Test nothing is collected outside of collect_stats."""
+    assert get_stats() is None
+    get_freq_consistent_dfs(get_test_df())
+    assert get_stats() is None
+
+
+def test_stage() -> None:
+    """Test a stage is only recorded while stats are collected."""
+    with stage("outside", rows_in=3) as timer:
+        timer.rows_out = 2
+    with collect_stats() as stats, stage("inside", rows_in=3) as timer:
+        timer.rows_out = 2
+    assert list(stats.stages) == ["inside"]
+    assert (stats.stages["inside"].rows_in, stats.stages["inside"].rows_out) == (3, 2)
@@ -0,0 +1,54 @@
+import dataclasses
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+import polars as pl
+import pytest
+
+from tests.data import get_time_group_array
+from timegroups.time_group import TimeGroup, TimeGroupArray
+
+
+def test_time_group_array_sequence() -> None:
+    """Test TimeGroupArray behaves like a list of TimeGroups."""
+    tgs = get_time_group_array()
+    assert len(tgs) == 3
+    assert tgs[0] == TimeGroup(pd.Timestamp("2022-01-01"), pd.Timestamp("2022-01-05"))
+    assert isinstance(tgs[-1].start, pd.Timestamp)
+    assert list(tgs) == [tgs[0], tgs[1], tgs[2]]
+    assert tgs[1:] == list(tgs)[1:]
+    assert tgs == TimeGroupArray.from_time_groups(list(tgs))
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        tgs[0].start = pd.Timestamp("2022-01-02")  # type: ignore[misc]
+
+
+def test_time_group_array_vectorized() -> None:
+    """Test duration, filtering and sorting of a TimeGroupArray."""
+    tgs = get_time_group_array()
+    assert list(tgs.duration) == [np.timedelta64(4, "D"), np.timedelta64(0, "D"), np.timedelta64(4, "D")]
+    long_tgs = tgs.filter(tgs.duration >= np.timedelta64(1, "D"))
+    assert [tg.start for tg in long_tgs] == [pd.Timestamp("2022-01-01"), pd.Timestamp("2022-01-12")]
+    by_duration = tgs.sort(by="duration")
+    assert by_duration[0] == tgs[1]
+    assert by_duration.sort() == tgs
+
+
+def test_time_group_array_conversion() -> None:
+    """Test conversion of a TimeGroupArray to pandas and polars DataFrames."""
+    from timegroups.df_grouping import get_time_groups
+
+    idx = pd.date_range("2022-01-01", periods=3, freq="h", tz="Europe/Berlin").append(
+        pd.date_range("2022-01-02", periods=2, freq="h", tz="Europe/Berlin")
+    )
+    tgs = get_time_groups(idx)
+    df_pd = tgs.to_pandas()
+    assert list(df_pd.columns) == ["start", "end", "duration", "offset", "length"]
+    assert df_pd["start"].tolist() == [tg.start for tg in tgs]
+    assert df_pd["duration"].iloc[0] == timedelta(hours=2)
+
+    tgs_pl = get_time_groups(pl.from_pandas(idx))
+    assert tgs_pl == tgs
+    df_pl = tgs_pl.to_polars()
+    assert df_pl.get_column("start").dtype == pl.Datetime("ns", "Europe/Berlin")
+    assert df_pl.get_column("start").to_list() == [tg.start for tg in tgs_pl]
@@ -0,0 +1,57 @@
+from datetime import timedelta
+
+import pandas as pd
+import polars as pl
+import pytest
+
+from tests.data import TestDataframeRecord, test_dataframes
+from timegroups.interfaces import DataFrameWithDatetimeIndex, PolarsDataFrame
+from timegroups.time_group import TimeGroup
+
+
+@pytest.mark.parametrize(
+    "df, timestamp_col, time_groups",
+    test_dataframes,
+)
+def test_time_group_ids_pandas(
+    df: DataFrameWithDatetimeIndex,
+    timestamp_col: str,  # noqa: ARG001
+    time_groups: list[TimeGroup],
+) -> None:
+    """Test time_group_ids method."""
+    from timegroups.df_grouping import time_group_ids
+
+    ids = time_group_ids(df, freq=timedelta(days=1))
+    assert ids.dtype == "int32"
+    assert len(ids) == len(df)
+    groups = [(idx.min(), idx.max()) for _, idx in pd.Series(df.index, index=df.index).groupby(ids)]
+    assert groups == [(tg.start, tg.end) for tg in time_groups]
+
+
+@pytest.mark.parametrize(
+    "df, timestamp_col, time_groups",
+    [
+        TestDataframeRecord(
+            input_df=pl.from_pandas(df, include_index=True),
+            input_timestamp_col=timestamp_col,
+            expected_time_groups=time_groups,
+        )
+        for df, timestamp_col, time_groups in test_dataframes
+    ],
+)
+def test_time_group_expr_polars(
+    df: PolarsDataFrame,
+    timestamp_col: str,
+    time_groups: list[TimeGroup],
+) -> None:
+    """Test time_group_expr method."""
+    from timegroups.df_grouping import time_group_expr, time_group_ids
+
+    ids = df.select(time_group_expr(timestamp_col, freq=timedelta(days=1)).alias("time_group"))
+    assert ids.get_column("time_group").to_list() == time_group_ids(df, timestamp_column=timestamp_col).tolist()
+    groups = (
+        df.with_columns(time_group_expr(timestamp_col, freq=timedelta(days=1)).alias("time_group"))
+        .group_by("time_group", maintain_order=True)
+        .agg(pl.col(timestamp_col).min().alias("start"), pl.col(timestamp_col).max().alias("end"))
+    )
+    assert groups.select("start", "end").rows() == [(tg.start, tg.end) for tg in time_groups]
@@ -0,0 +1,63 @@
+from datetime import timedelta
+
+import numpy as np
+import pandas as pd
+import polars as pl
+
+from tests.data import get_gappy_dataframe
+from timegroups.df_grouping import get_time_groups
+from timegroups.tracker import TimeGroupTracker
+
+
+def get_test_index() -> pd.DatetimeIndex:
+    return get_gappy_dataframe(2_000, gap_probability=0.02, gap=5, unit="min").index
+
+
+def test_time_group_tracker_append() -> None:
+    """Test TimeGroupTracker matches get_time_groups on appended batches."""
+    idx = get_test_index()
+    freq = timedelta(minutes=1)
+    tracker = TimeGroupTracker.from_time_groups(get_time_groups(idx[:500], freq=freq), freq=freq)
+    for begin in range(500, len(idx), 137):
+        first_changed = tracker.update(idx[begin : begin + 137])
+        assert first_changed >= len(get_time_groups(idx[:begin], freq=freq)) - 1
+        assert tracker.time_groups == get_time_groups(idx[: begin + 137], freq=freq)
+
+
+def test_time_group_tracker_out_of_order() -> None:
+    """Test TimeGroupTracker re-merges groups on late timestamps."""
+    idx = get_test_index()
+    freq = timedelta(minutes=1)
+    rng = np.random.default_rng(1)
+    positions = rng.permutation(len(idx))
+    tracker = TimeGroupTracker(freq)
+    for batch in np.array_split(positions, 20):
+        tracker.update(idx[batch])
+    assert tracker.time_groups == get_time_groups(idx, freq=freq)
+
+    late = pd.DatetimeIndex([idx[0] - pd.Timedelta(minutes=2), idx[0] - pd.Timedelta(minutes=10)])
+    assert tracker.update(late) == 0
+    assert tracker.time_groups == get_time_groups(late[::-1].append(idx), freq=freq)
+
+
+def test_time_group_tracker_polars() -> None:
+    """Test TimeGroupTracker with polars timestamps."""
+    series = pl.Series("time", get_test_index().to_numpy()).dt.replace_time_zone("UTC")
+    freq = timedelta(minutes=1)
+    tracker = TimeGroupTracker(freq, backend="polars")
+    tracker.extend([series[:1000], series[1000:]])
+    assert tracker.tz == "UTC"
+    assert tracker.time_groups == get_time_groups(series, freq=freq)
+
+
+def test_time_group_tracker_serialization() -> None:
+    """Test TimeGroupTracker state survives a JSON round trip."""
+    idx = get_test_index().tz_localize("Europe/Berlin")
+    freq = timedelta(minutes=1)
+    tracker = TimeGroupTracker(freq, time_delta_factor=3.0)
+    tracker.update(idx[:1000])
+    restored = TimeGroupTracker.from_json(tracker.to_json())
+    assert restored.to_dict() == tracker.to_dict()
+    restored.update(idx[1000:])
+    assert restored.time_groups == get_time_groups(idx, freq=freq, time_delta_factor=3.0)
+    assert restored.time_groups[0].start.tz is not None
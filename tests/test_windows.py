@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+import polars as pl
+import pytest
+
+from tests.data import get_aligned_dataframes
+from timegroups.windows import get_windows, iter_windows, sliding_windows
+
+
+def test_sliding_windows_view() -> None:
+    """Test sliding_windows returns views."""
+    values = np.arange(20.0).reshape(10, 2)
+    windows = sliding_windows(values, 4, stride=3)
+    assert windows.shape == (3, 4, 2)
+    assert np.shares_memory(windows, values)
+    np.testing.assert_array_equal(windows[1], values[3:7])
+    assert sliding_windows(values, 11).shape == (0, 11, 2)
+
+
+def test_iter_windows() -> None:
+    """Test iter_windows yields views per time group."""
+    dfs = get_aligned_dataframes()
+    windows = list(iter_windows(dfs, input_len=3, output_len=2, stride=2))
+    assert [len(group_windows) for group_windows in windows] == [3, 0, 2]
+    np.testing.assert_array_equal(windows[2][1], dfs[2].to_numpy()[2:7])
+
+
+@pytest.mark.parametrize("backend", ["pandas", "polars"])
+def test_get_windows(backend: str) -> None:
+    """Test get_windows batches the windows of all time groups with their origin."""
+    dfs = get_aligned_dataframes()
+    data = [pl.from_pandas(df, include_index=True) for df in dfs] if backend == "polars" else dfs
+    windows = get_windows(data, input_len=3, output_len=1, timestamp_column="time")
+    assert windows.values.shape == (7 + 1 + 4, 4, 2)
+    assert windows.inputs.shape == (12, 3, 2)
+    assert windows.targets.shape == (12, 1, 2)
+    np.testing.assert_array_equal(windows.group_ids, [0] * 7 + [1] + [2] * 4)
+    np.testing.assert_array_equal(windows.positions, [0, 1, 2, 3, 4, 5, 6, 0, 0, 1, 2, 3])
+    assert windows.starts[8] == np.datetime64("2022-01-03T00:00")
+    np.testing.assert_array_equal(windows.values[9], dfs[2].to_numpy()[1:5])
+
+
+def test_get_windows_lengths() -> None:
+    """Test get_windows on a single DataFrame with group lengths."""
+    dfs = get_aligned_dataframes()
+    windows = get_windows(pd.concat(dfs), input_len=4, stride=3, columns=["b"], lengths=[len(df) for df in dfs])
+    np.testing.assert_array_equal(windows.group_ids, [0, 0, 0, 1, 2, 2])
+    np.testing.assert_array_equal(windows.values[4, :, 0], dfs[2]["b"].to_numpy()[:4])
+    for field, expected in zip(windows, get_windows(dfs, input_len=4, stride=3, columns=["b"]), strict=True):
+        np.testing.assert_array_equal(field, expected)
+    assert get_windows([], input_len=4).values.shape == (0, 4, 0)
+    with pytest.raises(ValueError, match="lengths"):
+        get_windows(pd.concat(dfs), input_len=4, lengths=[1, 2])